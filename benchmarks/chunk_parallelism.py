@@ -0,0 +1,93 @@
+"""
+Benchmark of the temporal chunk parallelism on a single long sequence.
+
+The sequence is processed serially, then split in overlapping chunks processed by a process pool. The speedup
+and the agreement of the stitched object ids with the serial output are reported.
+
+Usage:
+    python benchmarks/chunk_parallelism.py --nb-frames 20000 --nb-chunks 8
+"""
+import argparse
+import time
+
+import numpy as np
+
+from trackreid import ReidProcessor
+from trackreid.configs.output_data_positions import output_data_positions
+from trackreid.parallel import process_tracker_log_in_chunks
+from trackreid.tracker_log import process_tracker_log
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 5,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+}
+
+
+def generate_sequence(nb_objects: int, nb_frames: int, switch_rate: float, seed: int = 0):
+    """Objects move randomly, and the tracker assigns them a new id with probability switch_rate per frame."""
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 1000, size=(nb_objects, 2))
+    tracker_ids = np.arange(1, nb_objects + 1)
+    next_tracker_id = nb_objects + 1
+    frames = []
+    for _ in range(nb_frames):
+        positions += rng.normal(0, 2, size=positions.shape)
+        switches = rng.random(nb_objects) < switch_rate
+        tracker_ids[switches] = np.arange(next_tracker_id, next_tracker_id + switches.sum())
+        next_tracker_id += switches.sum()
+        frame = np.zeros((nb_objects, 7))
+        frame[:, 0:2] = positions
+        frame[:, 2:4] = 50
+        frame[:, 4] = tracker_ids
+        frame[:, 5] = np.arange(nb_objects) % 3
+        frame[:, 6] = rng.uniform(0.5, 1.0, size=nb_objects)
+        frames.append(frame)
+    return np.arange(nb_frames), frames
+
+
+def get_object_ids(reid_outputs):
+    return {
+        (row[output_data_positions.frame_id], row[output_data_positions.tracker_id]): row[
+            output_data_positions.object_id
+        ]
+        for reid_output in reid_outputs
+        for row in reid_output
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-objects", type=int, default=20)
+    parser.add_argument("--nb-frames", type=int, default=20000)
+    parser.add_argument("--switch-rate", type=float, default=0.002)
+    parser.add_argument("--nb-chunks", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    frame_ids, frames = generate_sequence(args.nb_objects, args.nb_frames, args.switch_rate)
+
+    start = time.perf_counter()
+    serial_outputs = process_tracker_log(ReidProcessor(**PROCESSOR_KWARGS), frame_ids, frames)
+    serial_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    chunked_outputs = process_tracker_log_in_chunks(
+        frame_ids, frames, PROCESSOR_KWARGS, nb_chunks=args.nb_chunks, max_workers=args.workers
+    )
+    chunked_time = time.perf_counter() - start
+
+    serial_object_ids = get_object_ids(serial_outputs)
+    chunked_object_ids = get_object_ids(chunked_outputs)
+    keys = serial_object_ids.keys() | chunked_object_ids.keys()
+    agreement = np.mean([serial_object_ids.get(key) == chunked_object_ids.get(key) for key in keys])
+
+    print(f"{args.nb_objects} objects, {args.nb_frames} frames, {args.nb_chunks} chunks")
+    print(f"serial      : {serial_time:8.2f} s")
+    print(f"chunked     : {chunked_time:8.2f} s (x{serial_time / chunked_time:.1f})")
+    print(f"agreement   : {agreement:8.2%}")
+
+
+if __name__ == "__main__":
+    main()
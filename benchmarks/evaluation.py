@@ -0,0 +1,60 @@
+"""
+Benchmark of trackreid.evaluation.evaluate on a long synthetic sequence, where the predictions are the ground
+truth with jittered boxes, missed detections and periodic identity switches.
+
+Usage:
+    python benchmarks/evaluation.py --nb-frames 10000 --nb-objects 50
+"""
+import argparse
+import time
+
+import numpy as np
+
+from trackreid.evaluation import evaluate
+
+
+def generate_sequence(nb_frames: int, nb_objects: int, switch_period: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 2000, size=(nb_objects, 2))
+    ground_truth, predictions = [], []
+    for frame_id in range(nb_frames):
+        positions += rng.normal(0, 2, size=positions.shape)
+        boxes = np.concatenate([positions, positions + 50], axis=1)
+        gt_ids = np.arange(nb_objects)
+        ground_truth.append(np.column_stack([np.full(nb_objects, frame_id), gt_ids, boxes]))
+
+        detected = rng.random(nb_objects) > 0.05
+        predicted_ids = gt_ids + nb_objects * (frame_id // switch_period)
+        frame_predictions = np.zeros((detected.sum(), 10))
+        frame_predictions[:, 0] = frame_id
+        frame_predictions[:, 1] = predicted_ids[detected]
+        frame_predictions[:, 3:7] = boxes[detected] + rng.normal(0, 3, size=(detected.sum(), 4))
+        frame_predictions[:, 9] = predicted_ids[detected]
+        predictions.append(frame_predictions)
+    return np.concatenate(predictions), np.concatenate(ground_truth)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-frames", type=int, default=10_000)
+    parser.add_argument("--nb-objects", type=int, default=50)
+    parser.add_argument("--switch-period", type=int, default=500)
+    args = parser.parse_args()
+
+    predictions, ground_truth = generate_sequence(
+        args.nb_frames, args.nb_objects, args.switch_period
+    )
+    start = time.perf_counter()
+    metrics = evaluate(predictions, ground_truth)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{args.nb_frames} frames, {len(ground_truth)} ground truth rows evaluated in {elapsed:.2f} s "
+        f"({args.nb_frames / elapsed:.0f} frames/s)"
+    )
+    for name, value in metrics.items():
+        print(f"{name:>20}: {value:.4f}" if isinstance(value, float) else f"{name:>20}: {value}")
+
+
+if __name__ == "__main__":
+    main()
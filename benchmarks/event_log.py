@@ -0,0 +1,87 @@
+"""
+Benchmark of the overhead of the lifecycle event log on ReidProcessor.update, and of its reader.
+
+Frames of a sequence where the tracker regularly loses objects and gives them new ids are processed with and
+without an event log, and the events of one object are then read back from the log.
+
+Usage:
+    python benchmarks/event_log.py --nb-objects 50 --nb-frames 2000
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from trackreid import ReidProcessor
+from trackreid.event_log import EventLog, read_events
+
+
+def generate_sequence(nb_objects: int, nb_frames: int, switch_period: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 1000, size=(nb_objects, 2))
+    tracker_ids = np.arange(1, nb_objects + 1, dtype=float)
+    next_tracker_id = nb_objects + 1
+    frames = []
+    for frame_id in range(nb_frames):
+        positions += rng.normal(0, 2, size=positions.shape)
+        if frame_id and frame_id % switch_period == 0:
+            # the tracker loses an object and gives it a new id
+            tracker_ids[rng.integers(nb_objects)] = next_tracker_id
+            next_tracker_id += 1
+        frame = np.zeros((nb_objects, 7))
+        frame[:, 0:2] = positions
+        frame[:, 2:4] = positions + 50
+        frame[:, 4] = tracker_ids
+        frame[:, 5] = np.arange(nb_objects) % 3
+        frame[:, 6] = rng.uniform(0.5, 1.0, size=nb_objects)
+        frames.append(frame)
+    return frames
+
+
+def time_processor(frames, event_log) -> float:
+    reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=5,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+        event_log=event_log,
+    )
+    start = time.perf_counter()
+    for frame_id, frame in enumerate(frames):
+        reid_processor.update(frame, frame_id)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-objects", type=int, default=50)
+    parser.add_argument("--nb-frames", type=int, default=2000)
+    parser.add_argument("--switch-period", type=int, default=10)
+    args = parser.parse_args()
+
+    frames = generate_sequence(args.nb_objects, args.nb_frames, args.switch_period)
+    time_processor(frames[: args.nb_frames // 10], event_log=None)  # warmup
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = Path(directory) / "events.bin"
+        base_time = time_processor(frames, event_log=None)
+        with EventLog(file_path) as event_log:
+            log_time = time_processor(frames, event_log=event_log)
+            nb_events = len(event_log)
+
+        start = time.perf_counter()
+        object_events = read_events(file_path, object_ids=[1.0])
+        read_time = time.perf_counter() - start
+        file_size = file_path.stat().st_size
+
+    print(f"{args.nb_objects} objects, {args.nb_frames} frames")
+    print(f"without event log : {base_time * 1e6:10.1f} us/frame")
+    print(f"with event log    : {log_time * 1e6:10.1f} us/frame")
+    print(f"events            : {nb_events} ({file_size / 1024:.1f} KiB)")
+    print(f"read one object   : {read_time * 1e3:10.2f} ms ({len(object_events)} events)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark of the relabeling of raw tracker rows with corrected object ids, with IdMapping.relabel and with a
+Python dictionary lookup per row.
+
+Usage:
+    python benchmarks/id_mapping.py --nb-rows 5000000 --nb-tracker-ids 100000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from trackreid.id_mapping import IdMapping
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-rows", type=int, default=5_000_000)
+    parser.add_argument("--nb-tracker-ids", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    tracker_ids = np.arange(1, args.nb_tracker_ids + 1, dtype=float)
+    # chains of a few tracker ids each
+    object_ids = np.maximum.accumulate(
+        np.where(rng.random(args.nb_tracker_ids) < 0.3, 0, tracker_ids)
+    )
+    object_ids[object_ids == 0] = 1
+    id_mapping = IdMapping(
+        tracker_ids=tracker_ids,
+        object_ids=object_ids,
+        first_frame_ids=np.zeros(args.nb_tracker_ids, dtype=np.int64),
+        last_frame_ids=np.zeros(args.nb_tracker_ids, dtype=np.int64),
+        states=np.zeros(args.nb_tracker_ids, dtype=np.int8),
+    )
+    rows = np.zeros((args.nb_rows, 7))
+    rows[:, 4] = rng.integers(1, args.nb_tracker_ids + 1, size=args.nb_rows)
+
+    start = time.perf_counter()
+    relabeled_rows = id_mapping.relabel(rows)
+    vectorized_time = time.perf_counter() - start
+
+    mapping = dict(zip(tracker_ids.tolist(), object_ids.tolist()))
+    start = time.perf_counter()
+    dict_object_ids = [mapping.get(tracker_id, -1) for tracker_id in rows[:, 4].tolist()]
+    dict_time = time.perf_counter() - start
+    assert np.array_equal(relabeled_rows[:, 4], dict_object_ids)
+
+    for name, elapsed in (("IdMapping.relabel", vectorized_time), ("dict lookup", dict_time)):
+        print(
+            f"{name:>18}: {elapsed * 1e3:8.1f} ms, {args.nb_rows / elapsed / 1e6:6.1f} M rows/s, "
+            f"{rows.nbytes / elapsed / 1e9:5.2f} GB/s of rows"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark of the cold import time of trackreid, measured in fresh interpreters.
+
+The import time of numpy alone is reported as a baseline, since it is a hard dependency. With --max-overhead-ms,
+the script exits with an error if importing trackreid takes longer than that on top of numpy, so that it can
+guard against import time regressions in CI.
+
+Usage:
+    python benchmarks/import_time.py --runs 20 --max-overhead-ms 50
+"""
+import argparse
+import subprocess
+import sys
+
+import numpy as np
+
+
+def time_import(module: str, runs: int) -> float:
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    timings = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, text=True, check=True
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+    return float(np.median(timings))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--max-overhead-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    numpy_time = time_import("numpy", args.runs)
+    trackreid_time = time_import("trackreid", args.runs)
+    overhead = trackreid_time - numpy_time
+
+    print(f"import numpy     : {numpy_time * 1e3:8.1f} ms")
+    print(
+        f"import trackreid : {trackreid_time * 1e3:8.1f} ms ({overhead * 1e3:.1f} ms on top of numpy)"
+    )
+
+    if args.max_overhead_ms is not None and overhead * 1e3 > args.max_overhead_ms:
+        sys.exit(f"Import overhead above {args.max_overhead_ms} ms.")
+
+
+if __name__ == "__main__":
+    main()
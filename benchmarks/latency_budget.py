@@ -0,0 +1,83 @@
+"""
+Benchmark of the per-frame latency of ReidProcessor.update on a sequence with bursts of identity switches, with
+and without a latency budget.
+
+Every --burst-period frames, the tracker ids of all objects switch at once, so that the next frames have as many
+switchers and candidates as objects. The latency percentiles, the number of corrections and the degradation
+counters are reported for each budget.
+
+Usage:
+    python benchmarks/latency_budget.py --nb-objects 100 --nb-frames 300 --budgets 5 20
+"""
+import argparse
+import time
+
+import numpy as np
+
+from trackreid import ReidProcessor
+
+
+def generate_burst_sequence(nb_objects: int, nb_frames: int, burst_period: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 1000, size=(nb_objects, 2))
+    tracker_ids = np.arange(1, nb_objects + 1)
+    frames = []
+    for frame_id in range(nb_frames):
+        positions += rng.normal(0, 2, size=positions.shape)
+        if frame_id and frame_id % burst_period == 0:
+            tracker_ids = tracker_ids + nb_objects
+        frame = np.zeros((nb_objects, 7))
+        frame[:, 0:2] = positions
+        frame[:, 2:4] = 50
+        frame[:, 4] = tracker_ids
+        frame[:, 5] = np.arange(nb_objects) % 3
+        frame[:, 6] = rng.uniform(0.5, 1.0, size=nb_objects)
+        # objects are lost for a few frames during a burst
+        if frame_id % burst_period in (1, 2):
+            frame = frame[:0]
+        frames.append(frame)
+    return frames
+
+
+def run(frames, latency_budget_ms):
+    reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=2,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+        latency_budget_ms=latency_budget_ms,
+    )
+    latencies = []
+    for frame_id, frame in enumerate(frames):
+        start = time.perf_counter()
+        reid_processor.update(frame, frame_id)
+        latencies.append((time.perf_counter() - start) * 1e3)
+    return np.array(latencies), reid_processor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-objects", type=int, default=100)
+    parser.add_argument("--nb-frames", type=int, default=300)
+    parser.add_argument("--burst-period", type=int, default=50)
+    parser.add_argument("--budgets", type=float, nargs="+", default=[5.0, 20.0])
+    args = parser.parse_args()
+
+    frames = generate_burst_sequence(args.nb_objects, args.nb_frames, args.burst_period)
+    print(
+        f"{args.nb_objects} objects, {args.nb_frames} frames, bursts every {args.burst_period} frames"
+    )
+    for budget in [None, *args.budgets]:
+        latencies, reid_processor = run(frames, budget)
+        p50, p99, maximum = np.percentile(latencies, [50, 99, 100])
+        name = "no budget" if budget is None else f"{budget:g} ms budget"
+        print(
+            f"{name:<15}: p50 {p50:7.2f} ms, p99 {p99:7.2f} ms, max {maximum:7.2f} ms, "
+            f"{reid_processor.nb_corrections} corrections"
+        )
+        if budget is not None:
+            print(f"{'':<15}  {reid_processor.latency_stats['counters']}")
+
+
+if __name__ == "__main__":
+    main()
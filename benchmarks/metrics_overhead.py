@@ -0,0 +1,82 @@
+"""
+Benchmark of the overhead of the operational metrics on ReidProcessor.update, and of their rendering.
+
+Frames of a sequence with periodic tracker id switches are processed with and without metrics, and the rendering
+of the metrics in the Prometheus text format, done on each scrape, is timed separately.
+
+Usage:
+    python benchmarks/metrics_overhead.py --nb-objects 50 --nb-frames 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from trackreid import ReidProcessor
+from trackreid.metrics import ReidMetrics
+
+
+def generate_sequence(nb_objects: int, nb_frames: int, switch_period: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 1000, size=(nb_objects, 2))
+    tracker_ids = np.arange(1, nb_objects + 1, dtype=float)
+    next_tracker_id = nb_objects + 1
+    frames = []
+    for frame_id in range(nb_frames):
+        positions += rng.normal(0, 2, size=positions.shape)
+        if frame_id and frame_id % switch_period == 0:
+            # the tracker loses an object and gives it a new id
+            tracker_ids[rng.integers(nb_objects)] = next_tracker_id
+            next_tracker_id += 1
+        frame = np.zeros((nb_objects, 7))
+        frame[:, 0:2] = positions
+        frame[:, 2:4] = positions + 50
+        frame[:, 4] = tracker_ids
+        frame[:, 5] = np.arange(nb_objects) % 3
+        frame[:, 6] = rng.uniform(0.5, 1.0, size=nb_objects)
+        frames.append(frame)
+    return frames
+
+
+def time_processor(frames, metrics) -> float:
+    reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=5,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+        metrics=metrics,
+    )
+    start = time.perf_counter()
+    for frame_id, frame in enumerate(frames):
+        reid_processor.update(frame, frame_id)
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-objects", type=int, default=50)
+    parser.add_argument("--nb-frames", type=int, default=2000)
+    parser.add_argument("--switch-period", type=int, default=10)
+    parser.add_argument("--nb-renders", type=int, default=100)
+    args = parser.parse_args()
+
+    frames = generate_sequence(args.nb_objects, args.nb_frames, args.switch_period)
+
+    time_processor(frames[: args.nb_frames // 10], metrics=None)  # warmup
+    metrics = ReidMetrics()
+    base_time = time_processor(frames, metrics=None)
+    metrics_time = time_processor(frames, metrics=metrics)
+
+    start = time.perf_counter()
+    for _ in range(args.nb_renders):
+        metrics.render()
+    render_time = (time.perf_counter() - start) / args.nb_renders
+
+    print(f"{args.nb_objects} objects, {args.nb_frames} frames")
+    print(f"without metrics : {base_time * 1e6:10.1f} us/frame")
+    print(f"with metrics    : {metrics_time * 1e6:10.1f} us/frame")
+    print(f"render          : {render_time * 1e6:10.1f} us/scrape")
+
+
+if __name__ == "__main__":
+    main()
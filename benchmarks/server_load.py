@@ -0,0 +1,116 @@
+"""
+Load test of the ReidServer, for capacity planning: several client processes each send the frames of their own
+streams as fast as the server answers, and the throughput and latency percentiles are reported.
+
+The server runs in this process, on a Unix domain socket by default, or on a local TCP port with --tcp.
+
+Usage:
+    python benchmarks/server_load.py --nb-clients 8 --streams-per-client 2 --nb-objects 50 --nb-frames 500
+"""
+import argparse
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from trackreid.server import ReidClient, ReidServer
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 5,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+}
+
+
+def generate_sequence(nb_objects: int, nb_frames: int, seed: int):
+    """
+    Generates a sequence of moving objects, whose tracker ids switch from time to time.
+    """
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 1000, size=(nb_objects, 2))
+    tracker_ids = np.arange(1, nb_objects + 1)
+    next_tracker_id = nb_objects + 1
+    frames = []
+    for _ in range(nb_frames):
+        positions += rng.normal(0, 2, size=positions.shape)
+        switches = rng.random(nb_objects) < 0.01
+        tracker_ids[switches] = np.arange(next_tracker_id, next_tracker_id + switches.sum())
+        next_tracker_id += switches.sum()
+
+        frame = np.zeros((nb_objects, 7))
+        frame[:, 0:2] = positions
+        frame[:, 2:4] = 50
+        frame[:, 4] = tracker_ids
+        frame[:, 5] = np.arange(nb_objects) % 3
+        frame[:, 6] = rng.uniform(0.5, 1.0, size=nb_objects)
+        frames.append(frame)
+    return frames
+
+
+def run_client(
+    address, client_index: int, streams_per_client: int, nb_objects: int, nb_frames: int
+):
+    sequences = [
+        generate_sequence(nb_objects, nb_frames, seed=client_index * streams_per_client + stream)
+        for stream in range(streams_per_client)
+    ]
+    round_trip_times, queue_times = [], []
+    with ReidClient(address) as client:
+        for frame_id in range(nb_frames):
+            for stream, frames in enumerate(sequences):
+                client.update(f"client_{client_index}_stream_{stream}", frames[frame_id], frame_id)
+                round_trip_times.append(client.last_stats["round_trip_time"])
+                queue_times.append(client.last_stats["queue_time"])
+    return round_trip_times, queue_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-clients", type=int, default=4)
+    parser.add_argument("--streams-per-client", type=int, default=1)
+    parser.add_argument("--nb-objects", type=int, default=50)
+    parser.add_argument("--nb-frames", type=int, default=500)
+    parser.add_argument("--tcp", action="store_true", help="Use a local TCP port.")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        address = ("127.0.0.1", 0) if args.tcp else str(Path(tmp_dir) / "reid.sock")
+        server = ReidServer(address, PROCESSOR_KWARGS).start()
+
+        start = time.perf_counter()
+        with multiprocessing.Pool(args.nb_clients) as pool:
+            results = pool.starmap(
+                run_client,
+                [
+                    (
+                        server.address,
+                        client_index,
+                        args.streams_per_client,
+                        args.nb_objects,
+                        args.nb_frames,
+                    )
+                    for client_index in range(args.nb_clients)
+                ],
+            )
+        elapsed = time.perf_counter() - start
+        server.stop()
+
+    round_trip_times = np.concatenate([result[0] for result in results]) * 1e3
+    queue_times = np.concatenate([result[1] for result in results]) * 1e3
+    nb_streams = args.nb_clients * args.streams_per_client
+    print(
+        f"{args.nb_clients} clients, {nb_streams} streams of {args.nb_objects} objects, "
+        f"{args.nb_frames} frames each"
+    )
+    print(f"throughput       : {len(round_trip_times) / elapsed:10.1f} frames/s")
+    print(f"mean batch size  : {server.stats['nb_requests'] / server.stats['nb_batches']:10.2f}")
+    for name, times in (("round trip", round_trip_times), ("queue", queue_times)):
+        p50, p95, p99 = np.percentile(times, [50, 95, 99])
+        print(f"{name:<17}: p50 {p50:7.3f} ms, p95 {p95:7.3f} ms, p99 {p99:7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
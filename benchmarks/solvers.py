@@ -0,0 +1,61 @@
+"""
+Benchmark of the assignment solvers of trackreid.solvers on random cost matrices of several sizes and densities.
+
+For each problem, the time of each solver is reported along with the quality of its assignment: the number of
+matched pairs and the excess of its total cost over the optimal assignment of the Jonker-Volgenant solver, relative
+to the optimal total cost of the matched pairs.
+
+Usage:
+    python benchmarks/solvers.py --sizes 10 100 1000 --densities 1.0 0.05
+"""
+import argparse
+import time
+
+import numpy as np
+
+from trackreid.configs.reid_constants import reid_constants
+from trackreid.solvers import SOLVERS
+
+COST_LIMIT = reid_constants.MATCHES.DISALLOWED_MATCH - 0.1
+
+
+def generate_cost_matrix(size: int, density: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    cost_matrix = rng.uniform(0, 100, size=(size, size))
+    cost_matrix[rng.random((size, size)) > density] = reid_constants.MATCHES.DISALLOWED_MATCH
+    return cost_matrix
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--densities", type=float, nargs="+", default=[1.0, 0.05])
+    parser.add_argument("--solvers", nargs="+", default=["jv", "greedy", "auction", "auto"])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    print(
+        f"{'size':>6} {'density':>8} {'solver':>8} {'time (ms)':>10} {'matches':>8} {'excess cost':>12}"
+    )
+    for size in args.sizes:
+        for density in args.densities:
+            cost_matrix = generate_cost_matrix(size, density)
+            optimal_rows, optimal_columns = SOLVERS["jv"](cost_matrix.copy(), COST_LIMIT)
+            optimal_cost = cost_matrix[optimal_rows, optimal_columns].sum()
+            for name in args.solvers:
+                timings = []
+                for _ in range(args.repeats):
+                    start = time.perf_counter()
+                    rows, columns = SOLVERS[name](cost_matrix.copy(), COST_LIMIT)
+                    timings.append(time.perf_counter() - start)
+                # unmatched pairs are counted at the largest allowed cost
+                nb_missed = len(optimal_rows) - len(rows)
+                cost = cost_matrix[rows, columns].sum() + nb_missed * 100
+                print(
+                    f"{size:>6} {density:>8.2f} {name:>8} {min(timings) * 1e3:>10.2f} {len(rows):>8} "
+                    f"{(cost - optimal_cost) / max(optimal_cost, 1e-9):>11.1%}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark of the per-frame cost of ReidProcessor.update on steady-state frames, i.e. frames with the same
+tracker ids as the previous frame and no pending candidate or switcher.
+
+The per-frame cost of the fast path is compared to the cost of the full reid process on the same frames,
+and to the cost of copying the tracker output.
+
+Usage:
+    python benchmarks/steady_state.py --nb-objects 50 --nb-frames 2000
+"""
+import argparse
+import time
+
+import numpy as np
+
+from trackreid import ReidProcessor
+
+
+def generate_steady_sequence(nb_objects: int, nb_frames: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    positions = rng.uniform(0, 1000, size=(nb_objects, 2))
+    frames = []
+    for _ in range(nb_frames):
+        positions += rng.normal(0, 2, size=positions.shape)
+        frame = np.zeros((nb_objects, 7))
+        frame[:, 0:2] = positions
+        frame[:, 2:4] = positions + 50
+        frame[:, 4] = np.arange(1, nb_objects + 1)
+        frame[:, 5] = np.arange(nb_objects) % 3
+        frame[:, 6] = rng.uniform(0.5, 1.0, size=nb_objects)
+        frames.append(frame)
+    return frames
+
+
+def time_processor(frames, warmup: int, fast_path: bool) -> float:
+    reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=5,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+    )
+    if not fast_path:
+        reid_processor._is_steady_frame = lambda current_tracker_ids: False  # noqa: ARG005
+
+    for frame_id, frame in enumerate(frames[:warmup]):
+        reid_processor.update(frame, frame_id)
+
+    start = time.perf_counter()
+    for frame_id, frame in enumerate(frames[warmup:], start=warmup):
+        reid_processor.update(frame, frame_id)
+    return (time.perf_counter() - start) / (len(frames) - warmup)
+
+
+def time_copy(frames) -> float:
+    start = time.perf_counter()
+    for frame in frames:
+        frame.copy()
+    return (time.perf_counter() - start) / len(frames)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--nb-objects", type=int, default=50)
+    parser.add_argument("--nb-frames", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+
+    frames = generate_steady_sequence(nb_objects=args.nb_objects, nb_frames=args.nb_frames)
+
+    copy_time = time_copy(frames)
+    fast_time = time_processor(frames, warmup=args.warmup, fast_path=True)
+    full_time = time_processor(frames, warmup=args.warmup, fast_path=False)
+
+    print(f"{args.nb_objects} objects, {args.nb_frames} frames")
+    print(f"copy of the tracker output : {copy_time * 1e6:10.1f} us/frame")
+    print(f"steady-state fast path     : {fast_time * 1e6:10.1f} us/frame")
+    print(f"full reid process          : {full_time * 1e6:10.1f} us/frame")
+
+
+if __name__ == "__main__":
+    main()
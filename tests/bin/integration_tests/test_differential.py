@@ -0,0 +1,43 @@
+import pytest
+
+from tests.utils.differential import check_equivalence, generate_tracker_sequence
+from trackreid.selection_functions import select_by_category_batched
+
+OPTIMIZED_KWARGS = [
+    {},
+    {"cache_costs": True},
+    {"selection_function": select_by_category_batched},
+    {"velocity_smoothing": 0.5, "trajectory_capacity": 8},
+]
+
+
+@pytest.mark.parametrize("optimized_kwargs", OPTIMIZED_KWARGS)
+@pytest.mark.parametrize("seed", range(4))
+def test_equivalence_with_reference_engine(seed, optimized_kwargs):
+    frames = generate_tracker_sequence(seed=seed)
+    divergence = check_equivalence(frames, optimized_kwargs=optimized_kwargs)
+    assert divergence is None, str(divergence)
+
+
+def test_steady_sequences_equivalence():
+    # few events, so that most frames take the steady-state fast path
+    for seed in range(2):
+        frames = generate_tracker_sequence(
+            seed=seed,
+            nb_frames=200,
+            death_rate=0.003,
+            switch_rate=0.003,
+            miss_rate=0.003,
+            empty_frame_rate=0,
+        )
+        divergence = check_equivalence(frames)
+        assert divergence is None, str(divergence)
+
+
+def test_divergences_are_shrunk():
+    # engines with different parameters diverge, which must be reported on a minimal sequence
+    frames = generate_tracker_sequence(seed=0)
+    divergence = check_equivalence(frames, optimized_kwargs={"max_frames_to_rematch": 2})
+    assert divergence is not None
+    assert len(divergence.frames) < 10
+    assert "frames = [" in str(divergence)
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tests.utils.file_utils import compare_files, reset_output_folder
+from trackreid.cli import main
+from trackreid.tracked_object import TrackedObject
+from trackreid.tracker_log import load_tracker_log, split_tracker_log
+
+INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+EXPECTED_OUTPUT_FILE = Path("tests/assets/integration_tests/expected_outputs/corrected_tracks.txt")
+OUTPUT_FOLDER = Path("tests/results/unit_tests/cli/")
+
+ARGS = [
+    "--filter-confidence-threshold",
+    "0.1",
+    "--filter-time-threshold",
+    "1",
+    "--max-frames-to-rematch",
+    "100",
+    "--max-attempt-to-match",
+    "5",
+    "--cost-function",
+    "tests.bin.unit_tests.test_cli:dummy_cost_function",
+    "--selection-function",
+    "tests.bin.unit_tests.test_cli:dummy_selection_function",
+]
+
+
+def dummy_cost_function(candidate: TrackedObject, switcher: TrackedObject):  # noqa: ARG001
+    return 0
+
+
+def dummy_selection_function(candidate: TrackedObject, switcher: TrackedObject):  # noqa: ARG001
+    return 1
+
+
+def test_split_tracker_log():
+    tracker_log = np.array([[2, 10], [1, 11], [2, 12], [3, 13]])
+    frame_ids, frame_tracker_outputs = split_tracker_log(tracker_log)
+
+    assert frame_ids.tolist() == [1, 2, 3]
+    assert [output[:, 0].tolist() for output in frame_tracker_outputs] == [[11], [10, 12], [13]]
+
+
+def test_cli_txt_output():
+    reset_output_folder(output_folder=OUTPUT_FOLDER, create_folder=False)
+
+    assert main([str(INPUT_FILE), "--output-dir", str(OUTPUT_FOLDER), *ARGS]) == 0
+    compare_files(EXPECTED_OUTPUT_FILE, OUTPUT_FOLDER / INPUT_FILE.name)
+
+    reset_output_folder(output_folder=OUTPUT_FOLDER, create_folder=False)
+
+
+def test_cli_npy_output_and_resume():
+    reset_output_folder(output_folder=OUTPUT_FOLDER, create_folder=False)
+    output_file = OUTPUT_FOLDER / (INPUT_FILE.stem + ".npy")
+    args = [str(INPUT_FILE.parent), "--output-dir", str(OUTPUT_FOLDER), "--format", "npy", *ARGS]
+
+    main(args)
+    expected_output = np.loadtxt(EXPECTED_OUTPUT_FILE)
+    assert np.allclose(np.load(output_file), expected_output, atol=1e-6)
+
+    # already processed files are skipped unless --overwrite is given
+    np.save(output_file, np.zeros(0))
+    main(args)
+    assert np.load(output_file).size == 0
+    main([*args, "--overwrite"])
+    assert np.allclose(np.load(output_file), expected_output, atol=1e-6)
+
+    reset_output_folder(output_folder=OUTPUT_FOLDER, create_folder=False)
+
+
+def test_load_tracker_log_single_line(tmp_path):
+    file_path = tmp_path / "log.txt"
+    file_path.write_text("4 1 0 0 10 10 2 0.9\n")
+    frame_ids, frame_tracker_outputs = load_tracker_log(file_path)
+
+    assert frame_ids.tolist() == [4]
+    assert frame_tracker_outputs[0].shape == (1, 7)
+
+
+def test_cli_rejects_inputs_with_the_same_name(tmp_path):
+    for camera in ("cam1", "cam2"):
+        (tmp_path / camera).mkdir()
+        (tmp_path / camera / "day.txt").write_text(INPUT_FILE.read_text())
+
+    with pytest.raises(ValueError, match="same name"):
+        main([str(tmp_path / "cam1"), str(tmp_path / "cam2"), "--output-dir", str(tmp_path), *ARGS])
+
+
+def test_cli_reports_failed_files(tmp_path):
+    input_folder, output_folder = tmp_path / "inputs", tmp_path / "outputs"
+    input_folder.mkdir()
+    (input_folder / "valid.txt").write_text(INPUT_FILE.read_text())
+    (input_folder / "invalid.txt").write_text("not a tracker log\n")
+
+    # the invalid file does not prevent the valid one from being processed
+    assert (
+        main([str(input_folder), "--output-dir", str(output_folder), "--workers", "2", *ARGS]) == 1
+    )
+    compare_files(EXPECTED_OUTPUT_FILE, output_folder / "valid.txt")
+    assert not (output_folder / "invalid.txt").exists()
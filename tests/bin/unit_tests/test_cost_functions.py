@@ -0,0 +1,58 @@
+import numpy as np
+
+from trackreid.cost_functions import (
+    bounding_box_distance,
+    predicted_bounding_box_distance,
+    predicted_bounding_box_distance_batched,
+)
+from trackreid.matcher import Matcher
+from trackreid.tracked_object import TrackedObject
+from trackreid.utils import is_batched
+
+
+def _moving_object(object_id, start_frame, nb_frames, start_x, speed):
+    tracked_object = TrackedObject(
+        object_ids=object_id,
+        state=0,
+        metadata=np.array([start_x, 0, start_x + 10, 10, object_id, 0, 0.9]),
+        frame_id=start_frame,
+        velocity_smoothing=0.5,
+    )
+    for frame_id in range(start_frame + 1, start_frame + nb_frames):
+        x = start_x + speed * (frame_id - start_frame)
+        tracked_object.update_metadata(np.array([x, 0, x + 10, 10, object_id, 0, 0.9]), frame_id)
+    return tracked_object
+
+
+def test_predicted_bounding_box_distance():
+    # switcher moving right, lost at frame 9 at x=90
+    switcher = _moving_object(1, start_frame=0, nb_frames=10, start_x=0, speed=10)
+    # candidate appearing at frame 20 where the switcher is expected to be
+    candidate = _moving_object(2, start_frame=20, nb_frames=1, start_x=200, speed=0)
+
+    assert bounding_box_distance(candidate, switcher) == 110
+    assert predicted_bounding_box_distance(candidate, switcher) == 0
+
+
+def test_predicted_bounding_box_distance_batched():
+    switchers = [
+        _moving_object(1, start_frame=0, nb_frames=10, start_x=0, speed=10),
+        _moving_object(2, start_frame=0, nb_frames=5, start_x=500, speed=-5),
+    ]
+    candidates = [
+        _moving_object(3, start_frame=20, nb_frames=1, start_x=200, speed=0),
+        _moving_object(4, start_frame=15, nb_frames=3, start_x=300, speed=2),
+        _moving_object(5, start_frame=12, nb_frames=1, start_x=0, speed=0),
+    ]
+    assert is_batched(predicted_bounding_box_distance_batched)
+
+    def dummy_selection_function(candidate, switcher):  # noqa: ARG001
+        return 1
+
+    matcher = Matcher(predicted_bounding_box_distance, dummy_selection_function)
+    batched_matcher = Matcher(predicted_bounding_box_distance_batched, dummy_selection_function)
+    cost_matrix = matcher.compute_cost_matrix(candidates, switchers)
+    batched_cost_matrix = batched_matcher.compute_cost_matrix(candidates, switchers)
+
+    assert batched_cost_matrix.shape == (2, 3)
+    assert np.allclose(cost_matrix, batched_cost_matrix)
@@ -0,0 +1,118 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.configs.output_data_positions import (
+    output_data_dtypes,
+    output_data_positions,
+)
+from trackreid.evaluation import compute_iou, evaluate, tracker_log_to_predictions
+from trackreid.tracker_log import process_tracker_log, split_tracker_log
+from trackreid.utils import get_output_dtype
+
+INTEGRATION_INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+
+def _build_sequence():
+    # object 1 is seen all along, object 2 switches to tracker id 3 at frame 10 and is missed at frame 5
+    ground_truth, predictions = [], []
+    for frame_id in range(20):
+        ground_truth.append([frame_id, 1, 0, 0, 10, 10])
+        ground_truth.append([frame_id, 2, 100, 100, 110, 110])
+        predictions.append([frame_id, 1, 0, 0, 0, 10, 10, 0.9, 0.9, 1])
+        if frame_id != 5:
+            object_id = 2 if frame_id < 10 else 3
+            predictions.append([frame_id, object_id, 0, 100, 100, 110, 110, 0.9, 0.9, object_id])
+    return np.array(predictions, dtype=float), np.array(ground_truth, dtype=float)
+
+
+def test_evaluate():
+    predictions, ground_truth = _build_sequence()
+    metrics = evaluate(predictions, ground_truth)
+
+    assert metrics["matches"] == 39
+    assert metrics["false_negatives"] == 1
+    assert metrics["false_positives"] == 0
+    assert metrics["id_switches"] == 1
+    assert metrics["fragmentations"] == 1
+    assert metrics["mota"] == pytest.approx(1 - 2 / 40)
+    assert metrics["motp"] == pytest.approx(1.0)
+    # object 2 is identified by tracker id 3, in 10 of its 20 frames
+    assert metrics["idf1"] == pytest.approx(2 * 30 / 79)
+    assert metrics["mostly_tracked"] == 2
+    assert metrics["nb_predicted_ids"] == 3
+
+    # predictions shifted by half their size no longer match
+    shifted_predictions = predictions.copy()
+    shifted_predictions[:, 3:7] += 5
+    metrics = evaluate(shifted_predictions, ground_truth)
+    assert metrics["matches"] == 0
+    assert metrics["mostly_lost"] == 2
+    assert metrics["idf1"] == 0
+
+
+def test_evaluate_formats():
+    predictions, ground_truth = _build_sequence()
+    metrics = evaluate(predictions, ground_truth)
+
+    structured_predictions = np.zeros(
+        len(predictions), dtype=get_output_dtype(output_data_positions, output_data_dtypes)
+    )
+    for name, position in [("frame_id", 0), ("object_id", 1), ("category", 2), ("tracker_id", 9)]:
+        structured_predictions[name] = predictions[:, position]
+    structured_predictions["bbox"] = predictions[:, 3:7]
+    assert evaluate(structured_predictions, ground_truth) == metrics
+
+    # boxes as (x, y, width, height), in shuffled order
+    xywh_predictions, xywh_ground_truth = predictions.copy(), ground_truth.copy()
+    xywh_predictions[:, 5:7] -= xywh_predictions[:, 3:5]
+    xywh_ground_truth[:, 4:6] -= xywh_ground_truth[:, 2:4]
+    order = np.random.default_rng(0).permutation(len(xywh_predictions))
+    assert evaluate(xywh_predictions[order], xywh_ground_truth, bbox_format="xywh") == metrics
+
+    np.testing.assert_allclose(
+        compute_iou(
+            np.array([[0, 0, 10, 10], [0, 0, 10, 10]]), np.array([[5, 0, 15, 10], [20, 20, 30, 30]])
+        ),
+        [1 / 3, 0],
+    )
+
+
+def test_evaluate_reid_output():
+    tracker_log = np.loadtxt(INTEGRATION_INPUT_FILE, ndmin=2)
+    raw_predictions = tracker_log_to_predictions(tracker_log)
+    # the raw tracker output evaluated against itself
+    ground_truth = raw_predictions[:, [0, 1, 3, 4, 5, 6]]
+    metrics = evaluate(raw_predictions, ground_truth)
+    assert metrics["idf1"] == metrics["mota"] == 1.0
+
+    reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=5,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+        output_format="structured",
+    )
+    reid_outputs = process_tracker_log(reid_processor, *split_tracker_log(tracker_log))
+    reid_metrics = evaluate(np.concatenate(reid_outputs), ground_truth)
+    assert reid_metrics["false_positives"] == 0
+    assert reid_metrics["nb_predicted_ids"] < metrics["nb_predicted_ids"]
+
+
+def test_evaluate_prediction_kept_once():
+    # tracker id 7 is matched with object 1 then object 2, and overlaps both of them at frame 3
+    box = [0, 0, 10, 10]
+    predictions = np.array(
+        [[frame_id, 7, 0, *box, 0.9, 0.9, 7] for frame_id in (1, 2, 3)], dtype=float
+    )
+    ground_truth = np.array([[1, 1, *box], [2, 2, *box], [3, 1, *box], [3, 2, *box]], dtype=float)
+    metrics = evaluate(predictions, ground_truth)
+
+    # the match with object 1 is kept at frame 3 and object 2 is missed
+    assert metrics["matches"] == 3
+    assert metrics["false_positives"] == 0
+    assert metrics["false_negatives"] == 1
+    assert metrics["id_switches"] == 0
+    assert metrics["mota"] == pytest.approx(1 - 1 / 4)
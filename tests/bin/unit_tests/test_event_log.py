@@ -0,0 +1,114 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.configs.reid_constants import reid_constants
+from trackreid.event_log import NO_STATE, RECORD, EventLog, event_types, read_events
+from trackreid.tracker_log import load_tracker_log
+
+INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 5,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+}
+
+
+def test_event_log_append_and_read(tmp_path):
+    file_path = tmp_path / "events.bin"
+    with EventLog(file_path, capacity=2) as event_log:
+        for frame_id in range(5):
+            event_log.frame_id = frame_id
+            event_log.record(event_types.NEW, frame_id, frame_id, state=-2)
+        assert len(event_log) == 5
+        # records are readable before the log is closed
+        assert len(read_events(file_path)) == 5
+
+    with EventLog(file_path) as event_log:
+        event_log.frame_id = 5
+        event_log.record(event_types.MERGE, 1, 4, cost=0.5)
+    assert file_path.stat().st_size == 16 + 6 * RECORD.size
+
+    events = read_events(file_path)
+    assert events["frame_id"].tolist() == [0, 1, 2, 3, 4, 5]
+    assert np.isnan(events["cost"][:5]).all() and events["cost"][5] == 0.5
+
+    assert read_events(file_path, object_ids=[1])["event_type"].tolist() == [
+        event_types.NEW,
+        event_types.MERGE,
+    ]
+    assert read_events(file_path, tracker_ids=[4], frame_range=(0, 4))["frame_id"].tolist() == [4]
+    assert len(read_events(file_path, event_types=[event_types.CUT])) == 0
+
+    file_path.write_bytes(b"not an event log")
+    with pytest.raises(ValueError):
+        EventLog(file_path)
+
+
+def test_processor_event_log(tmp_path):
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    file_path = tmp_path / "events.bin"
+    with EventLog(file_path) as event_log:
+        reid_processor = ReidProcessor(**PROCESSOR_KWARGS, event_log=event_log)
+        for frame_id, tracker_output in zip(frame_ids, frame_tracker_outputs):
+            reid_processor.update(tracker_output, frame_id)
+
+    events = read_events(file_path)
+    assert np.all(np.diff(events["frame_id"]) >= 0)
+
+    new_events = events[events["event_type"] == event_types.NEW]
+    assert len(new_events) == reid_processor.nb_tracker_ids
+
+    merges = events[events["event_type"] == event_types.MERGE]
+    assert len(merges) - np.sum(events["event_type"] == event_types.CUT) == (
+        reid_processor.nb_corrections
+    )
+    assert np.all(np.isfinite(merges["cost"]))
+
+    # the last state transition of each object is its current state
+    states = events[events["event_type"] != event_types.NEW]
+    for tracked_object in reid_processor.all_tracked_objects:
+        object_events = states[
+            (states["object_id"] == tracked_object.object_id) & (states["state"] != NO_STATE)
+        ]
+        if len(object_events):
+            assert object_events["state"][-1] == tracked_object.state
+        else:
+            assert tracked_object.state == reid_constants.STATES.TRACKER_OUTPUT
+
+
+def test_cut_and_merge_events(tmp_path):
+    # object 1 is lost and rematched with tracker id 2, then tracker id 1 reappears next to it
+    def detection(tracker_id, x):
+        return [x, 0, x + 10, 10, tracker_id, 0, 0.9]
+
+    file_path = tmp_path / "events.bin"
+    with EventLog(file_path) as event_log:
+        reid_processor = ReidProcessor(
+            **{**PROCESSOR_KWARGS, "filter_time_threshold": 2}, event_log=event_log
+        )
+        for frame_id in range(30):
+            if frame_id < 10:
+                tracker_output = [detection(1, 0)]
+            elif frame_id < 20:
+                tracker_output = [detection(2, 0)]
+            else:
+                tracker_output = [detection(1, 0), detection(2, 50)]
+            reid_processor.update(np.array(tracker_output, dtype=float), frame_id)
+
+    merge, cut = read_events(file_path, event_types=[event_types.MERGE, event_types.CUT])
+    assert (merge["frame_id"], merge["object_id"], merge["tracker_id"]) == (11, 1, 2)
+    assert (cut["frame_id"], cut["object_id"], cut["tracker_id"]) == (20, 1, 2)
+
+    transitions = read_events(file_path, object_ids=[1], event_types=[event_types.STATE])
+    assert transitions["state"].tolist() == [
+        reid_constants.STATES.CANDIDATE,
+        reid_constants.STATES.STABLE,
+        reid_constants.STATES.SWITCHER,
+        reid_constants.STATES.STABLE,
+    ]
+    assert transitions["tracker_id"][-1] == 2
@@ -0,0 +1,210 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.configs.output_data_positions import output_data_positions
+from trackreid.gallery import (
+    CameraTopology,
+    GalleryClient,
+    SharedGallery,
+    make_global_id,
+)
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 1,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+}
+
+
+@pytest.fixture
+def gallery():
+    gallery = SharedGallery.create(name=None, nb_cameras=2, slots_per_camera=4, embedding_dim=2)
+    yield gallery
+    gallery.close()
+
+
+def make_frame(tracker_ids):
+    frame = np.zeros((len(tracker_ids), 7))
+    frame[:, 2:4] = 10
+    frame[:, 4] = tracker_ids
+    frame[:, 5] = np.array(tracker_ids) % 2
+    frame[:, 6] = 0.9
+    return frame
+
+
+def publish_from_other_process(name):
+    gallery = SharedGallery.attach(name)
+    gallery.publish(0, 0, global_id=7, category=1, lost_time=0.0, embedding=[1, 0])
+    gallery.publish(0, 1, global_id=8, category=1, lost_time=0.0, embedding=[0, 1])
+    gallery.close()
+
+
+def test_gallery_cross_process_query(gallery):
+    process = multiprocessing.get_context("spawn").Process(
+        target=publish_from_other_process, args=(gallery.name,)
+    )
+    process.start()
+    process.join()
+    assert process.exitcode == 0
+
+    topology = CameraTopology({(0, 1): (1.0, 10.0)})
+    embeddings = np.array([[0.1, 1.0], [1.0, 0.1], [1.0, 1.0]])
+    global_ids = gallery.query(1, 5.0, [1, 1, 2], topology, embeddings=embeddings)
+    assert global_ids.tolist() == [8, 7, -1]
+
+    # transit time outside of the allowed window, or transition not allowed
+    assert gallery.query(1, 0.5, [1], topology).tolist() == [-1]
+    assert gallery.query(1, 20.0, [1], topology).tolist() == [-1]
+    assert gallery.query(0, 5.0, [1], topology).tolist() == [-1]
+
+    # claimed entries are not matched again
+    gallery.claim(1, 0, global_id=8, time=5.0)
+    assert gallery.query(1, 5.0, [1, 1], topology, embeddings=embeddings[:2]).tolist() == [-1, 7]
+
+
+def claim_from_other_process(name, camera_index, barrier, results):
+    gallery = SharedGallery.attach(name)
+    barrier.wait()
+    results.put((camera_index, gallery.claim(camera_index, 0, global_id=7, time=5.0)))
+    gallery.close()
+
+
+def test_gallery_claims_race():
+    gallery = SharedGallery.create(name=None, nb_cameras=4, slots_per_camera=2)
+    gallery.publish(0, 0, global_id=7, category=1, lost_time=0.0)
+    context = multiprocessing.get_context("spawn")
+    barrier, results = context.Barrier(3), context.Queue()
+    processes = [
+        context.Process(
+            target=claim_from_other_process, args=(gallery.name, camera_index, barrier, results)
+        )
+        for camera_index in range(1, 4)
+    ]
+    for process in processes:
+        process.start()
+    claims = dict(results.get(timeout=60) for _ in processes)
+    for process in processes:
+        process.join()
+
+    # a single camera wins the entry, the others are told to leave their candidate unmatched
+    assert sorted(claims.values()) == [False, False, True]
+    winner = next(camera_index for camera_index, claimed in claims.items() if claimed)
+    assert gallery.claims["active"].sum() == 1
+    assert gallery.claims[winner]["global_id"][0] == 7
+
+    # the threads of a process are arbitrated as well
+    gallery.claims["active"] = 0
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        claimed = list(
+            executor.map(
+                lambda camera_index: gallery.claim(camera_index, 1, global_id=7, time=6.0),
+                range(1, 4),
+            )
+        )
+    assert sorted(claimed) == [False, False, True]
+
+    # removed entries cannot be claimed
+    gallery.remove(0, 0)
+    gallery.claims["active"] = 0
+    assert not gallery.claim(1, 0, global_id=7, time=7.0)
+    gallery.close()
+
+
+def test_gallery_clients_share_global_ids(gallery):
+    topology = CameraTopology({(0, 1): (0.0, 10.0)})
+    processors = [ReidProcessor(**PROCESSOR_KWARGS) for _ in range(2)]
+    clients = [GalleryClient(gallery, camera_index, topology) for camera_index in range(2)]
+
+    # object 3 leaves camera 0 at frame 10, and object 1 enters camera 1 at frame 12,
+    # while objects 4 and 6 of another category stay in front of the cameras
+    for frame_id in range(1, 15):
+        frames = [
+            make_frame([3, 4] if frame_id < 10 else [4]),
+            make_frame([1, 6] if frame_id >= 12 else [6]),
+        ]
+        for processor, client, frame in zip(processors, clients, frames):
+            processor.update(frame, frame_id)
+            client.publish(processor, time=frame_id)
+            client.match_candidates(processor, time=frame_id)
+
+    global_id = make_global_id(0, 3)
+    assert clients[0].get_global_id(3) == global_id
+    assert clients[1].get_global_id(1) == global_id
+    assert gallery.claimed_global_ids().tolist() == [global_id]
+
+    # the claimed entry is removed from the gallery at the next publication of camera 0
+    clients[0].publish(processors[0], time=15)
+    assert not gallery.entries["active"].any()
+
+    # once the candidate is stable, the object is output with the global id of camera 0
+    for frame_id in range(15, 20):
+        output = processors[1].update(make_frame([1, 6]), frame_id)
+    global_ids = clients[1].get_global_ids(output[:, output_data_positions.object_id])
+    assert sorted(global_ids.tolist()) == [global_id, make_global_id(1, 6)]
+
+
+def test_gallery_clients_race_for_entry():
+    gallery = SharedGallery.create(name=None, nb_cameras=3, slots_per_camera=2)
+    gallery.publish(0, 0, global_id=make_global_id(0, 3), category=1, lost_time=0.0)
+    topology = CameraTopology({(0, 1): (0.0, 10.0), (0, 2): (0.0, 10.0)})
+    processors = [ReidProcessor(**PROCESSOR_KWARGS) for _ in range(2)]
+    clients = [GalleryClient(gallery, camera_index, topology) for camera_index in (1, 2)]
+    for frame_id in range(1, 3):
+        for processor in processors:
+            processor.update(make_frame([1]), frame_id)
+
+    # camera 2 queries the entry, then camera 1 matches it before camera 2 claims it
+    query = gallery.query
+
+    def query_then_let_camera_1_match(*args, **kwargs):
+        global_ids = query(*args, **kwargs)
+        gallery.query = query
+        assert clients[0].match_candidates(processors[0], time=2.0) == [(1, make_global_id(0, 3))]
+        return global_ids
+
+    gallery.query = query_then_let_camera_1_match
+    assert clients[1].match_candidates(processors[1], time=2.0) == []
+    assert clients[0].get_global_id(1) == make_global_id(0, 3)
+    assert clients[1].get_global_id(1) == make_global_id(2, 1)
+    assert gallery.claimed_global_ids().tolist() == [make_global_id(0, 3)]
+    gallery.close()
+
+
+def test_gallery_client_camera_index(gallery):
+    with pytest.raises(ValueError):
+        GalleryClient(gallery, camera_index=2, topology=CameraTopology({}))
+
+
+def test_gallery_claims_are_not_overwritten():
+    gallery = SharedGallery.create(name=None, nb_cameras=2, slots_per_camera=1)
+    topology = CameraTopology({(0, 1): (0.0, 100.0)})
+    processors = [ReidProcessor(**PROCESSOR_KWARGS) for _ in range(2)]
+    clients = [GalleryClient(gallery, camera_index, topology) for camera_index in range(2)]
+
+    # objects 3 and 5 leave camera 0 at frames 10 and 20, objects 1, 7 and 9 enter camera 1 at frames 12, 22
+    # and 26, while objects 4 and 6 of another category stay in front of the cameras
+    for frame_id in range(1, 30):
+        camera_0_ids = [tracker_id for tracker_id, end in [(3, 10), (5, 20)] if frame_id < end]
+        camera_1_ids = [
+            tracker_id for tracker_id, start in [(1, 12), (7, 22), (9, 26)] if frame_id >= start
+        ]
+        frames = [make_frame([*camera_0_ids, 4]), make_frame([*camera_1_ids, 6])]
+        for processor, client, frame in zip(processors, clients, frames):
+            processor.update(frame, frame_id)
+            client.publish(processor, time=frame_id)
+            client.match_candidates(processor, time=frame_id)
+
+    # object 3 is still lost on camera 0, but is not published again once claimed
+    assert clients[1].get_global_id(1) == make_global_id(0, 3)
+    assert clients[1].get_global_id(7) == make_global_id(0, 5)
+    assert clients[1].get_global_id(9) == make_global_id(1, 9)
+
+    # claims are released once their entries are removed
+    gallery.release_claims(1)
+    assert gallery.claimed_global_ids().tolist() == []
+    gallery.close()
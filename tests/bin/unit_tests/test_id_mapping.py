@@ -0,0 +1,78 @@
+from pathlib import Path
+
+import numpy as np
+
+from trackreid import ReidProcessor
+from trackreid.id_mapping import IdMapping
+from trackreid.tracker_log import load_tracker_log
+
+INTEGRATION_INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+
+def _run_processor():
+    reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=5,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+    )
+    frame_ids, frame_tracker_outputs = load_tracker_log(INTEGRATION_INPUT_FILE)
+    outputs = [
+        reid_processor.update(tracker_output, frame_id)
+        for frame_id, tracker_output in zip(frame_ids, frame_tracker_outputs)
+    ]
+    return reid_processor, np.concatenate([output for output in outputs if output.size])
+
+
+def test_relabel_matches_processor_output():
+    reid_processor, reid_output = _run_processor()
+    id_mapping = reid_processor.export_id_mapping()
+    assert np.all(np.diff(id_mapping.tracker_ids) > 0)
+    assert np.all(id_mapping.first_frame_ids <= id_mapping.last_frame_ids)
+
+    # the output rows are the last rows of the corrected objects, whose object ids are final
+    tracker_log = np.loadtxt(INTEGRATION_INPUT_FILE, ndmin=2)
+    relabeled_log = id_mapping.relabel(tracker_log, tracker_id_column=5, frame_id_column=0)
+    assert relabeled_log is not tracker_log
+    assert np.all(relabeled_log[:, 5] != -1)
+    last_frame_id = reid_output[:, 0].max()
+    last_rows = {(row[0], row[9]): row[1] for row in reid_output if row[0] == last_frame_id}
+    for frame_id, tracker_id, object_id in zip(
+        tracker_log[:, 0], tracker_log[:, 5], relabeled_log[:, 5]
+    ):
+        if (frame_id, tracker_id) in last_rows:
+            assert object_id == last_rows[(frame_id, tracker_id)]
+
+
+def test_lookup():
+    id_mapping = IdMapping(
+        tracker_ids=np.array([1.0, 2.0, 5.0]),
+        object_ids=np.array([1.0, 2.0, 1.0]),
+        first_frame_ids=np.array([0, 0, 10]),
+        last_frame_ids=np.array([9, 20, 30]),
+        states=np.zeros(3, dtype=np.int8),
+    )
+    tracker_ids = np.array([5, 3, 1, 2, 6, 0])
+    np.testing.assert_array_equal(id_mapping.lookup(tracker_ids), [1, -1, 1, 2, -1, -1])
+    np.testing.assert_array_equal(
+        id_mapping.lookup(tracker_ids, frame_ids=np.array([5, 5, 5, 25, 5, 5]), fill_value=0),
+        [0, 0, 1, 0, 0, 0],
+    )
+
+    empty_mapping = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=5,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+    ).export_id_mapping()
+    assert not len(empty_mapping)
+    np.testing.assert_array_equal(empty_mapping.lookup(tracker_ids), -np.ones(6))
+
+
+def test_save_and_load(tmp_path):
+    reid_processor, _ = _run_processor()
+    id_mapping = reid_processor.export_id_mapping()
+    id_mapping.save(tmp_path / "id_mapping.npz")
+    loaded_id_mapping = IdMapping.load(tmp_path / "id_mapping.npz")
+    for field in ("tracker_ids", "object_ids", "first_frame_ids", "last_frame_ids", "states"):
+        np.testing.assert_array_equal(getattr(id_mapping, field), getattr(loaded_id_mapping, field))
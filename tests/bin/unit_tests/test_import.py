@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+from trackreid.configs.input_data_positions import input_data_positions
+from trackreid.configs.output_data_positions import output_data_positions
+
+
+def test_import_is_lightweight():
+    # pydantic, lap and http.server are only needed to print the schemas, to solve assignments and to serve
+    # metrics
+    code = "import sys, trackreid; print(sorted({'pydantic', 'lap', 'http.server'} & set(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_schemas_match_layouts():
+    from trackreid.configs.input_data_positions import InputDataPositions
+    from trackreid.configs.output_data_positions import OutputDataPositions
+
+    assert InputDataPositions().model_dump() == vars(input_data_positions)
+    assert OutputDataPositions().model_dump() == vars(output_data_positions)
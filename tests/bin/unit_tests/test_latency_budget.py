@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from trackreid.latency_budget import LatencyBudget, select_most_recent_switchers
+from trackreid.matcher import Matcher
+from trackreid.tracked_object import TrackedObject
+
+
+def test_latency_budget_ladder():
+    latency_budget = LatencyBudget(budget_ms=10)
+    latency_budget.record_matching(
+        {"matrices": 1e-3, "assignment": 8e-3}, nb_switchers=10, nb_candidates=10, greedy=False
+    )
+    latency_budget.record_matching(
+        {"matrices": 1e-3, "assignment": 1e-4}, nb_switchers=10, nb_candidates=10, greedy=True
+    )
+
+    # 100 switchers and 10 candidates: lapjv on 100 switchers takes 8 seconds, on 10 switchers 9 ms
+    assert latency_budget._get_max_switchers(100, 10, greedy=False, remaining_ms=10) == 10
+    assert latency_budget._get_max_switchers(100, 10, greedy=True, remaining_ms=20) == 100
+    assert latency_budget._get_max_switchers(100, 10, greedy=False, remaining_ms=0.5) == 0
+    assert latency_budget._get_max_switchers(100, 10, greedy=True, remaining_ms=0.5) == 4
+
+    latency_budget.budget_ms = -1
+    latency_budget.start_frame()
+    assert latency_budget.plan_matching(100, 10) is None
+    assert latency_budget.counters["deferred_matchings"] == 1
+
+    with pytest.raises(ValueError):
+        LatencyBudget(budget_ms=-1)
+
+
+def test_select_most_recent_switchers():
+    switchers = []
+    for object_id, frame_id in enumerate([5, 9, 7, 9]):
+        data_line = np.array([0, 0, 1, 1, object_id, 0, 0.9])
+        switchers.append(
+            TrackedObject(object_ids=object_id, state=1, metadata=data_line, frame_id=frame_id)
+        )
+
+    selected = select_most_recent_switchers(switchers, 3)
+    assert [switcher.object_id for switcher in selected] == [1, 2, 3]
+
+
+def test_greedy_assignment():
+    candidates, switchers = ["a", "b"], ["x", "y"]
+    # the optimal assignment is a-y and b-x, the greedy assignment takes the cheapest pair a-x first
+    cost_matrix = np.array([[1.0, 2.0], [3.0, 1e6]])
+
+    matches = Matcher.greedy_assignment(cost_matrix, candidates=candidates, switchers=switchers)
+    assert matches == [{"a": "x"}]
+
+    matches = Matcher.linear_assigment(cost_matrix, candidates=candidates, switchers=switchers)
+    assert matches == [{"a": "y"}, {"b": "x"}]
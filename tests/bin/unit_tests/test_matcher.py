@@ -1,7 +1,10 @@
 import json
 from pathlib import Path
 
+import numpy as np
+
 from trackreid.matcher import Matcher
+from trackreid.selection_functions import select_by_category, select_by_category_batched
 from trackreid.tracked_object import TrackedObject
 
 INPUT_FOLDER = Path("tests/assets/unit_tests/data/tracked_objects")
@@ -78,3 +81,77 @@ def test_matcher_middle_case():
     for match in matches:
         for candidate, switcher in match.items():
             assert candidate.object_id % 2 == switcher.object_id % 2
+
+
+def test_matcher_batched_selection():
+    def dummy_cost_function(candidate, switcher):
+        return abs(candidate.object_id - switcher.object_id)
+
+    candidates = ALL_TRACKED_OBJECTS[:1]
+    switchers = ALL_TRACKED_OBJECTS
+
+    matcher = Matcher(dummy_cost_function, select_by_category)
+    batched_matcher = Matcher(dummy_cost_function, select_by_category_batched)
+
+    selection_matrix = matcher.compute_selection_matrix(candidates, switchers)
+    batched_selection_matrix = batched_matcher.compute_selection_matrix(candidates, switchers)
+
+    assert selection_matrix.shape == (3, 1)
+    assert (selection_matrix == batched_selection_matrix).all()
+    assert (
+        matcher.match(candidates, switchers)[0] == batched_matcher.match(candidates, switchers)[0]
+    )
+
+
+def test_matcher_cache():
+    def dummy_cost_function(candidate, switcher):
+        return abs(candidate.bbox[0] - switcher.bbox[0])
+
+    tracked_objects = [tracked_object.copy() for tracked_object in ALL_TRACKED_OBJECTS]
+    candidates, switchers = tracked_objects[:1], tracked_objects[1:]
+
+    matcher = Matcher(dummy_cost_function, select_by_category)
+    cached_matcher = Matcher(dummy_cost_function, select_by_category, cache_costs=True)
+
+    def assert_same_matches():
+        assert matcher.match(candidates, switchers) == cached_matcher.match(candidates, switchers)
+
+    assert_same_matches()
+    assert cached_matcher.cache_stats["computed_costs"] == 2
+
+    # nothing changed, the assignment is reused
+    assert_same_matches()
+    assert cached_matcher.cache_stats["reused_assignments"] == 1
+    assert cached_matcher.cache_stats["reused_costs"] == 2
+
+    # an update of the candidate invalidates its column, but not its category
+    candidates[0].update_metadata(
+        np.array([0, 0, 10, 10, 4, candidates[0].category, 0.5]), frame_id=1000
+    )
+    assert_same_matches()
+    assert cached_matcher.cache_stats["computed_costs"] == 4
+    assert cached_matcher.cache_stats["reused_selections"] == 4
+
+    # a new switcher only adds a row
+    switchers.append(ALL_TRACKED_OBJECTS[0].copy())
+    assert_same_matches()
+    assert cached_matcher.cache_stats["computed_costs"] == 5
+    assert cached_matcher.cache_stats["reused_costs"] == 4
+
+
+def test_matcher_solvers():
+    def dummy_cost_function(candidate, switcher):
+        return abs(candidate.object_id - switcher.object_id)
+
+    def dummy_selection_function(candidate, switcher):  # noqa: ARG001
+        return 1
+
+    candidates = list(ALL_TRACKED_OBJECTS)
+    switchers = list(reversed(ALL_TRACKED_OBJECTS))
+    expected_matches = Matcher(dummy_cost_function, dummy_selection_function).match(
+        candidates, switchers
+    )
+    for solver in ("greedy", "auction", "auto"):
+        matcher = Matcher(dummy_cost_function, dummy_selection_function, solver=solver)
+        assert matcher.match(candidates, switchers) == expected_matches
+    assert matcher.match(candidates[:1], switchers) == [{candidates[0]: candidates[0]}]
@@ -1,6 +1,9 @@
 import json
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from trackreid.tracked_object_metadata import TrackedObjectMetaData
 
 INPUT_FOLDER = Path("tests/assets/unit_tests/data/tracked_objects")
@@ -50,3 +53,181 @@ def test_tracked_metadata_merge():
     assert tracked_metadata_1.confidence == 0.700626
     assert tracked_metadata_1.confidence_sum == 260.988185
     assert tracked_metadata_1.observations == 391
+
+
+def test_tracked_metadata_derived_values():
+    tracked_metadata = ALL_TRACKED_METADATA[0].copy()
+    assert tracked_metadata.category == 0
+    assert tracked_metadata.mean_confidence() == tracked_metadata.confidence_sum / 175
+
+    # tie between classes 0 and 1: the first inserted class wins, as with max over the dict
+    data_line = np.array([0, 0, 10, 10, 1, 1, 0.5])
+    for frame_id in range(252, 252 + 175):
+        tracked_metadata.update(data_line, frame_id)
+        assert tracked_metadata.category == max(
+            tracked_metadata.class_counts, key=tracked_metadata.class_counts.get
+        )
+    assert tracked_metadata.category == 0
+    tracked_metadata.update(data_line, 427)
+    assert tracked_metadata.category == 1
+    assert tracked_metadata.mean_confidence() == tracked_metadata.confidence_sum / 351
+    assert round(tracked_metadata.class_proportions()[1], 3) == round(176 / 351, 3)
+
+    merged_metadata = ALL_TRACKED_METADATA[0].copy()
+    merged_metadata.merge(ALL_TRACKED_METADATA[1].copy())
+    assert merged_metadata.category == 1
+    assert merged_metadata.mean_confidence() == merged_metadata.confidence_sum / 391
+
+
+def test_tracked_metadata_dense_class_counts():
+    data_line = np.array([0, 0, 10, 10, 1, 2, 0.5])
+    tracked_metadata = TrackedObjectMetaData(data_line, frame_id=1, num_classes=4)
+    assert tracked_metadata.class_counts.tolist() == [0, 0, 1, 0]
+    assert tracked_metadata.category == 2
+
+    other_metadata = TrackedObjectMetaData(np.array([0, 0, 10, 10, 1, 1, 0.7]), 2, num_classes=4)
+    other_metadata.update(np.array([0, 0, 10, 10, 1, 1, 0.7]), 3)
+    tracked_metadata.merge(other_metadata)
+    assert tracked_metadata.class_counts.tolist() == [0, 2, 1, 0]
+    assert tracked_metadata.category == 1
+    assert tracked_metadata.class_proportions().tolist() == [0, 2 / 3, 1 / 3, 0]
+
+    copied_metadata = TrackedObjectMetaData.from_dict(tracked_metadata.to_dict())
+    assert copied_metadata.num_classes == 4
+    assert copied_metadata.class_counts.tolist() == [0, 2, 1, 0]
+    assert copied_metadata.category == 1
+
+    # dense and dictionary class counts can be merged together
+    dict_metadata = ALL_TRACKED_METADATA[1].copy()
+    dict_metadata.merge(copied_metadata)
+    assert dict_metadata.class_counts == {0: 0, 1: 218, 2: 1}
+    assert dict_metadata.category == 1
+
+
+def test_tracked_metadata_class_proportions_cache():
+    dict_metadata = TrackedObjectMetaData(np.array([0, 0, 10, 10, 1, 2, 0.5]), 1)
+    with pytest.raises(TypeError):
+        dict_metadata.class_proportions()[2] = 0.0
+    assert dict_metadata.class_proportions() == {2: 1.0}
+    assert dict_metadata.class_proportions() is dict_metadata.class_proportions()
+
+    dense_metadata = TrackedObjectMetaData(np.array([0, 0, 10, 10, 1, 2, 0.5]), 1, num_classes=4)
+    with pytest.raises(ValueError):
+        dense_metadata.class_proportions()[2] = 0.0
+    assert dense_metadata.class_proportions().tolist() == [0, 0, 1, 0]
+
+
+def test_tracked_metadata_dense_class_counts_range():
+    tracked_metadata = TrackedObjectMetaData(np.array([0, 0, 10, 10, 1, 2, 0.5]), 1, num_classes=4)
+    for category in (-1, 4):
+        with pytest.raises(ValueError, match=f"Category {category} out of range"):
+            tracked_metadata.update(np.array([0, 0, 10, 10, 1, category, 0.5]), 2)
+        with pytest.raises(ValueError, match="num_classes=4"):
+            TrackedObjectMetaData(np.array([0, 0, 10, 10, 1, category, 0.5]), 1, num_classes=4)
+    assert tracked_metadata.class_counts.tolist() == [0, 0, 1, 0]
+    assert tracked_metadata.observations == 1
+
+    # dictionary class counts with a category out of range are not merged
+    dict_metadata = TrackedObjectMetaData(np.array([0, 0, 10, 10, 1, 7, 0.5]), 1)
+    with pytest.raises(ValueError, match="Category 7 out of range"):
+        tracked_metadata.merge(dict_metadata)
+    assert tracked_metadata.class_counts.tolist() == [0, 0, 1, 0]
+    assert tracked_metadata.observations == 1
+
+
+def test_tracked_metadata_motion_model():
+    tracked_metadata = TrackedObjectMetaData(
+        np.array([0, 0, 10, 10, 1, 0, 0.5]), frame_id=1, velocity_smoothing=0.5
+    )
+    assert tracked_metadata.velocity.tolist() == [0, 0, 0, 0]
+    tracked_metadata.update(np.array([10, 0, 20, 10, 1, 0, 0.5]), frame_id=2)
+    assert tracked_metadata.velocity.tolist() == [10, 0, 10, 0]
+    # displacement of 20 over 2 frames, the per frame velocity is unchanged
+    tracked_metadata.update(np.array([30, 0, 40, 10, 1, 0, 0.5]), frame_id=4)
+    assert tracked_metadata.velocity.tolist() == [10, 0, 10, 0]
+    tracked_metadata.update(np.array([30, 0, 40, 10, 1, 0, 0.5]), frame_id=5)
+    assert tracked_metadata.velocity.tolist() == [5, 0, 5, 0]
+
+    assert tracked_metadata.predict_bbox(7).tolist() == [40, 0, 50, 10]
+    assert tracked_metadata.predict_bbox(3).tolist() == [30, 0, 40, 10]
+
+    copied_metadata = TrackedObjectMetaData.from_dict(tracked_metadata.to_dict())
+    assert copied_metadata.velocity.tolist() == [5, 0, 5, 0]
+    assert "velocity" not in ALL_TRACKED_METADATA[0].to_dict()
+
+
+def test_tracked_metadata_trajectory():
+    tracked_metadata = TrackedObjectMetaData(
+        np.array([0, 0, 10, 10, 1, 0, 0.5]), frame_id=1, trajectory_capacity=3
+    )
+    for frame_id in range(2, 6):
+        tracked_metadata.update(np.array([frame_id, 0, 10, 10, 1, 0, 0.5]), frame_id=frame_id)
+
+    # only the last 3 observations are kept, in chronological order
+    assert tracked_metadata.trajectory[:, 0].tolist() == [3, 4, 5]
+    assert tracked_metadata.trajectory[-1].tolist() == [5, 5, 0, 10, 10, 0.5]
+    assert tracked_metadata.trajectory_velocity().tolist() == [1, 0, 0, 0]
+
+    other_metadata = TrackedObjectMetaData(
+        np.array([20, 0, 10, 10, 2, 0, 0.9]), frame_id=8, trajectory_capacity=3
+    )
+    merged_metadata = tracked_metadata.copy()
+    merged_metadata.merge(other_metadata)
+    assert merged_metadata.trajectory[:, 0].tolist() == [4, 5, 8]
+    assert tracked_metadata.trajectory[:, 0].tolist() == [3, 4, 5]
+
+    merged_metadata.truncate_trajectory(5)
+    assert merged_metadata.trajectory[:, 0].tolist() == [5, 8]
+    merged_metadata.update(np.array([21, 0, 10, 10, 2, 0, 0.9]), frame_id=9)
+    assert merged_metadata.trajectory[:, 0].tolist() == [5, 8, 9]
+
+    copied_metadata = TrackedObjectMetaData.from_dict(merged_metadata.to_dict())
+    assert np.array_equal(copied_metadata.trajectory, merged_metadata.trajectory)
+    assert "trajectory" not in ALL_TRACKED_METADATA[0].to_dict()
+
+
+def test_metadata_timestamps():
+    data_line = np.array([0, 0, 10, 10, 1, 0, 0.9])
+    metadata = TrackedObjectMetaData(data_line, frame_id=0, timestamp=0.0)
+    # observed on consecutive processed frames, then missed on the frame at 0.3s
+    metadata.update(data_line, frame_id=3, timestamp=0.1, previous_frame_timestamp=0.0)
+    metadata.update(data_line, frame_id=6, timestamp=0.2, previous_frame_timestamp=0.1)
+    metadata.update(data_line, frame_id=12, timestamp=0.4, previous_frame_timestamp=0.3)
+
+    assert metadata.first_timestamp == 0.0
+    assert metadata.last_timestamp == 0.4
+    assert round(metadata.time_seen, 6) == 0.2
+    assert round(metadata.frame_interval, 6) == 0.1
+    # seen on 4 of the 5 processed frames, whatever the frame ids of the decimated stream
+    assert round(metadata.percentage_of_time_seen(12, timestamp=0.4), 6) == 80.0
+    assert metadata.percentage_of_time_seen(12) == 4 / 13 * 100
+
+    copied_metadata = TrackedObjectMetaData.from_dict(metadata.to_dict())
+    assert copied_metadata.last_timestamp == 0.4
+    assert copied_metadata.time_seen == metadata.time_seen
+    assert copied_metadata.frame_interval == metadata.frame_interval
+    assert "time_seen" not in ALL_TRACKED_METADATA[0].to_dict()
+
+
+def test_metadata_percentage_of_time_seen_with_timestamps():
+    data_line = np.array([0, 0, 10, 10, 1, 0, 0.9])
+    seen_frame_ids = [0, 1, 3, 4, 5, 9, 10]
+    frame_metadata = TrackedObjectMetaData(data_line, frame_id=0)
+    timed_metadata = TrackedObjectMetaData(data_line, frame_id=0, timestamp=0.0)
+    assert timed_metadata.percentage_of_time_seen(0, timestamp=0.0) == 100.0
+
+    # the same sequence at 25 frames per second, timestamped or not
+    for frame_id in range(1, 14):
+        timestamp = frame_id / 25
+        if frame_id in seen_frame_ids:
+            frame_metadata.update(data_line, frame_id=frame_id)
+            timed_metadata.update(
+                data_line,
+                frame_id=frame_id,
+                timestamp=timestamp,
+                previous_frame_timestamp=(frame_id - 1) / 25,
+            )
+        assert timed_metadata.percentage_of_time_seen(
+            frame_id, timestamp=timestamp
+        ) == pytest.approx(frame_metadata.percentage_of_time_seen(frame_id))
+    assert frame_metadata.percentage_of_time_seen(13) == pytest.approx(7 / 14 * 100)
@@ -0,0 +1,159 @@
+import time
+import urllib.request
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.metrics import (
+    Histogram,
+    HttpExporter,
+    MetricsExporter,
+    ReidMetrics,
+    TextfileExporter,
+)
+from trackreid.server import ReidClient, ReidServer
+from trackreid.tracker_log import load_tracker_log
+
+INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 5,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+}
+
+
+def parse_samples(text):
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(1, 5))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+
+    lines = histogram.render("size", {"role": "a"})
+    assert lines == [
+        'size_bucket{role="a",le="1.0"} 2',
+        'size_bucket{role="a",le="5.0"} 3',
+        'size_bucket{role="a",le="+Inf"} 4',
+        'size_sum{role="a"} 14.5',
+        'size_count{role="a"} 4',
+    ]
+
+
+def test_processor_metrics():
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    metrics = ReidMetrics(labels={"camera": "1"})
+    reid_processor = ReidProcessor(**PROCESSOR_KWARGS, metrics=metrics)
+    for frame_id, tracker_output in zip(frame_ids, frame_tracker_outputs):
+        reid_processor.update(tracker_output, frame_id)
+
+    samples = parse_samples(metrics.render())
+    assert samples['trackreid_frames_total{camera="1"}'] == len(frame_ids)
+    assert samples['trackreid_detections_total{camera="1"}'] == sum(
+        len(tracker_output) for tracker_output in frame_tracker_outputs
+    )
+    assert samples['trackreid_corrections_total{camera="1"}'] == reid_processor.nb_corrections
+    assert samples['trackreid_frame_duration_seconds_count{camera="1"}'] == len(frame_ids)
+    assert samples['trackreid_matching_size_count{camera="1",role="switchers"}'] == (
+        metrics.counters["matchings"]
+    )
+    assert sum(
+        value for name, value in samples.items() if name.startswith("trackreid_tracked_objects")
+    ) == len(reid_processor.all_tracked_objects)
+    assert (
+        samples['trackreid_object_store_bytes{camera="1"}']
+        == reid_processor.memory_report()["total_bytes"]
+    )
+
+    # the processors of a shared metrics are summed, and dropped once deleted
+    other_processor = ReidProcessor(**PROCESSOR_KWARGS, metrics=metrics)
+    other_processor.update(frame_tracker_outputs[0], frame_ids[0])
+    assert metrics.counters["frames"] == len(frame_ids) + 1
+    del reid_processor, other_processor
+    assert not any(metrics.get_state_counts().values())
+
+
+def test_exporters(tmp_path):
+    metrics = ReidMetrics()
+    metrics.add_gauge("trackreid_custom", "Custom gauge.", lambda: 3)
+
+    with HttpExporter(metrics) as exporter:
+        host, port = exporter.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics") as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            samples = parse_samples(response.read().decode())
+    assert samples["trackreid_custom"] == 3
+    assert samples["trackreid_frames_total"] == 0
+
+    file_path = tmp_path / "trackreid.prom"
+    with TextfileExporter(metrics, file_path, interval_s=60):
+        assert parse_samples(file_path.read_text())["trackreid_custom"] == 3
+        metrics.counters["frames"] = 5
+    assert parse_samples(file_path.read_text())["trackreid_frames_total"] == 5
+    assert [path.name for path in tmp_path.iterdir()] == ["trackreid.prom"]
+
+
+def test_render_reads_frame_snapshots():
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    metrics = ReidMetrics()
+    reid_processor = ReidProcessor(**PROCESSOR_KWARGS, emission_lag=3, metrics=metrics)
+    for frame_id, tracker_output in zip(frame_ids[:50], frame_tracker_outputs[:50]):
+        reid_processor.update(tracker_output, frame_id)
+    memory_report = reid_processor.memory_report()
+
+    # a scrape does not read the processor, e.g. its pending frames, only the end of frame snapshot
+    reid_processor._pending_frames = None
+    reid_processor._memory_counters = None
+    samples = parse_samples(metrics.render())
+    assert samples["trackreid_object_store_bytes"] == memory_report["total_bytes"]
+    assert metrics.get_state_counts() == {
+        state: state_report["objects"] for state, state_report in memory_report["by_state"].items()
+    }
+
+
+def test_textfile_exporter_survives_failed_write(tmp_path, capsys):
+    metrics = ReidMetrics()
+    nb_calls = []
+
+    def flaky_gauge():
+        nb_calls.append(1)
+        if len(nb_calls) == 2:
+            raise RuntimeError("scrape failed")
+        return len(nb_calls)
+
+    metrics.add_gauge("trackreid_custom", "Custom gauge.", flaky_gauge)
+    file_path = tmp_path / "trackreid.prom"
+    with TextfileExporter(metrics, file_path, interval_s=0.01):
+        while len(nb_calls) < 4:
+            time.sleep(0.01)
+    assert parse_samples(file_path.read_text())["trackreid_custom"] >= 4
+    assert "RuntimeError: scrape failed" in capsys.readouterr().err
+
+
+def test_metrics_exporter_is_abstract():
+    with pytest.raises(TypeError):
+        MetricsExporter(ReidMetrics())
+
+
+def test_server_metrics(tmp_path):
+    metrics = ReidMetrics()
+    server = ReidServer(str(tmp_path / "reid.sock"), PROCESSOR_KWARGS, metrics=metrics).start()
+    try:
+        with ReidClient(server.address) as client:
+            client.update("camera", np.array([[0, 0, 10, 10, 1, 0, 0.9]]), 1)
+            samples = parse_samples(metrics.render())
+    finally:
+        server.stop()
+    assert samples["trackreid_frames_total"] == 1
+    assert samples["trackreid_server_streams"] == 1
+    assert samples["trackreid_server_queue_depth"] == 0
@@ -0,0 +1,105 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.configs.output_data_positions import output_data_positions
+from trackreid.parallel import process_tracker_log_in_chunks
+from trackreid.tracked_object import TrackedObject
+from trackreid.tracker_log import load_tracker_log, process_tracker_log
+
+INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+
+def dummy_cost_function(candidate: TrackedObject, switcher: TrackedObject):  # noqa: ARG001
+    return 0
+
+
+def dummy_selection_function(candidate: TrackedObject, switcher: TrackedObject):  # noqa: ARG001
+    return 1
+
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 1,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+    "cost_function": dummy_cost_function,
+    "selection_function": dummy_selection_function,
+}
+
+
+def get_object_ids(reid_outputs):
+    return {
+        (row[output_data_positions.frame_id], row[output_data_positions.tracker_id]): row[
+            output_data_positions.object_id
+        ]
+        for reid_output in reid_outputs
+        for row in reid_output
+    }
+
+
+@pytest.fixture(scope="module")
+def serial_object_ids():
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    reid_processor = ReidProcessor(**PROCESSOR_KWARGS)
+    return get_object_ids(process_tracker_log(reid_processor, frame_ids, frame_tracker_outputs))
+
+
+@pytest.mark.parametrize("nb_chunks, max_workers", [(1, 1), (3, 1), (3, 2)])
+def test_agreement_with_serial_output(serial_object_ids, nb_chunks, max_workers):
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    reid_outputs = process_tracker_log_in_chunks(
+        frame_ids,
+        frame_tracker_outputs,
+        processor_kwargs=PROCESSOR_KWARGS,
+        nb_chunks=nb_chunks,
+        max_workers=max_workers,
+    )
+    object_ids = get_object_ids(reid_outputs)
+
+    assert len(reid_outputs) == len(frame_ids)
+    assert object_ids.keys() == serial_object_ids.keys()
+    agreement = np.mean([object_ids[key] == serial_object_ids[key] for key in object_ids])
+    if nb_chunks == 1:
+        assert agreement == 1
+    else:
+        assert agreement > 0.95
+
+
+def test_overlap_lower_than_max_frames_to_rematch():
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    with pytest.raises(ValueError):
+        process_tracker_log_in_chunks(
+            frame_ids, frame_tracker_outputs, PROCESSOR_KWARGS, nb_chunks=2, overlap=10
+        )
+
+
+def test_chunks_with_disjoint_objects_of_the_same_id():
+    # tracker id 1 is used by an object in the first chunk, and reused by another object far from it in the
+    # second chunk, beyond the overlap
+    frame_tracker_outputs = []
+    for frame_id in range(40):
+        rows = [[0, 0, 10, 10, 2, 0, 0.9]]
+        if frame_id < 10:
+            rows.append([100, 0, 110, 10, 1, 0, 0.9])
+        elif frame_id >= 30:
+            rows.append([500, 0, 510, 10, 1, 0, 0.9])
+        frame_tracker_outputs.append(np.array(rows, dtype=float))
+    processor_kwargs = {**PROCESSOR_KWARGS, "max_frames_to_rematch": 5}
+
+    reid_outputs = process_tracker_log_in_chunks(
+        np.arange(40),
+        frame_tracker_outputs,
+        processor_kwargs,
+        nb_chunks=2,
+        overlap=10,
+        max_workers=1,
+    )
+    object_ids = get_object_ids(reid_outputs)
+
+    assert object_ids[(5, 1)] == 1
+    assert object_ids[(35, 2)] == 2
+    # the second object is renumbered after the largest object id emitted by the first chunk
+    assert object_ids[(35, 1)] == 3
@@ -0,0 +1,305 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.memory import STATE_NAMES
+from trackreid.tracker_log import load_tracker_log
+
+INTEGRATION_INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+
+def _build_processor(**kwargs):
+    return ReidProcessor(
+        filter_confidence_threshold=0.3,
+        filter_time_threshold=2,
+        max_frames_to_rematch=10,
+        max_attempt_to_match=3,
+        **kwargs,
+    )
+
+
+def _build_frames():
+    frames = []
+    for frame_id in range(30):
+        # object 1 is seen all along, object 2 is replaced by object 3 at frame 10, low confidence object 4
+        # enters at frame 20
+        rows = [[10 + frame_id, 10, 60 + frame_id, 60, 1, 0, 0.9]]
+        rows.append([200, 200 + frame_id, 250, 250 + frame_id, 2 if frame_id < 10 else 3, 1, 0.8])
+        if frame_id >= 20:
+            rows.append([400, 400, 450, 450, 4, 1, 0.1])
+        frames.append(np.array(rows, dtype=float))
+    return frames
+
+
+def test_fast_path_matches_full_process():
+    frames = _build_frames()
+
+    reid_processor = _build_processor()
+    full_reid_processor = _build_processor()
+    full_reid_processor._is_steady_frame = lambda current_tracker_ids: False  # noqa: ARG005
+
+    nb_steady_frames = 0
+    for frame_id, frame in enumerate(frames):
+        nb_steady_frames += reid_processor._is_steady_frame(list(frame[:, 4]))
+        output = reid_processor.update(frame, frame_id)
+        expected_output = full_reid_processor.update(frame, frame_id)
+        assert np.array_equal(output, expected_output)
+
+    assert nb_steady_frames > 15
+    assert reid_processor.to_dict() == full_reid_processor.to_dict()
+    assert [list(obj.re_id_chain) for obj in reid_processor.all_tracked_objects] == [
+        [1.0],
+        [2.0, 3.0],
+        [4.0],
+    ]
+
+
+def test_structured_output():
+    frames = _build_frames()
+
+    reid_processor = _build_processor()
+    structured_reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.3,
+        filter_time_threshold=2,
+        max_frames_to_rematch=10,
+        max_attempt_to_match=3,
+        output_format="structured",
+    )
+
+    for frame_id, frame in enumerate(frames):
+        output = reid_processor.update(frame, frame_id)
+        structured_output = structured_reid_processor.update(frame, frame_id)
+        assert structured_output.dtype.names == (
+            "frame_id",
+            "object_id",
+            "category",
+            "bbox",
+            "confidence",
+            "mean_confidence",
+            "tracker_id",
+        )
+        assert len(structured_output) == len(output)
+        assert np.array_equal(structured_output["object_id"], output[:, 1])
+        assert np.array_equal(structured_output["tracker_id"], output[:, 9])
+        assert np.allclose(structured_output["bbox"], output[:, 3:7])
+        assert np.allclose(structured_output["mean_confidence"], output[:, 8])
+
+
+def test_jsonl_export(tmp_path):
+    frames = _build_frames()
+    reid_processor = _build_processor()
+
+    for frame_id, frame in enumerate(frames[:11]):
+        reid_processor.update(frame, frame_id)
+
+    file_path = tmp_path / "tracked_objects.jsonl"
+    assert reid_processor.export_jsonl(file_path) == 3
+    lines = [json.loads(line) for line in file_path.read_text().splitlines()]
+    assert lines == [
+        tracked_object.to_dict() for tracked_object in reid_processor.all_tracked_objects
+    ]
+
+    # nothing changed since the last export
+    assert list(reid_processor.iter_jsonl(only_changed=True)) == []
+
+    # object 3 is merged into object 2, and object 1 is updated
+    reid_processor.update(frames[11], 11)
+    lines = [json.loads(line) for line in reid_processor.iter_jsonl(only_changed=True)]
+    assert [line["object_id"] for line in lines] == [1.0, 2.0, 3.0]
+    assert lines[1]["re_id_chain"] == [2.0, 3.0]
+    assert lines[2] == {"object_id": 3.0, "removed": True}
+
+
+def test_jsonl_export_stopped_early():
+    frames = _build_frames()
+    reid_processor = _build_processor()
+
+    for frame_id, frame in enumerate(frames[:11]):
+        reid_processor.update(frame, frame_id)
+    assert len(list(reid_processor.iter_jsonl())) == 3
+
+    # an export stopped after one line does not record the signatures of the objects it streamed
+    reid_processor.update(frames[11], 11)
+    next(reid_processor.iter_jsonl(only_changed=True))
+    lines = [json.loads(line) for line in reid_processor.iter_jsonl(only_changed=True)]
+    assert [line["object_id"] for line in lines] == [1.0, 2.0, 3.0]
+    assert lines[2] == {"object_id": 3.0, "removed": True}
+    assert list(reid_processor.iter_jsonl(only_changed=True)) == []
+
+
+def test_memory_report():
+    reid_processor = _build_processor()
+    for frame_id, frame in enumerate(_build_frames()):
+        reid_processor.update(frame, frame_id)
+
+    report = reid_processor.memory_report()
+    assert report["by_state"]["STABLE"]["objects"] == 2
+    assert report["by_state"]["TRACKER_OUTPUT"]["objects"] == 1
+    assert report["longest_chains"][0]["object_id"] == 2.0
+    assert report["longest_chains"][0]["nb_ids"] == 2
+    assert report["total_bytes"] == sum(report["by_component"].values())
+    assert sum(state["bytes"] for state in report["by_state"].values()) == sum(
+        report["by_component"][component] for component in ("objects", "chains", "metadata")
+    )
+
+    reid_processor.reset()
+    report = reid_processor.memory_report()
+    assert report["by_component"]["metadata"] == 0
+    assert report["longest_chains"] == []
+
+
+def _count_tracked_objects(reid_processor):
+    counters = {state: [0, 0, 0] for state in STATE_NAMES}
+    for tracked_object in reid_processor.all_tracked_objects:
+        counter = counters[tracked_object.state]
+        counter[0] += 1
+        counter[1] += len(tracked_object.re_id_chain)
+        class_counts = tracked_object.metadata.class_counts
+        counter[2] += len(class_counts) if isinstance(class_counts, dict) else 0
+    return counters
+
+
+@pytest.mark.parametrize("num_classes", [None, 4])
+def test_memory_counters_match_tracked_objects(num_classes):
+    frame_ids, frame_tracker_outputs = load_tracker_log(INTEGRATION_INPUT_FILE)
+    reid_processor = ReidProcessor(
+        filter_confidence_threshold=0.1,
+        filter_time_threshold=1,
+        max_frames_to_rematch=100,
+        max_attempt_to_match=5,
+        num_classes=num_classes,
+    )
+    nb_fast_path_frames = 0
+    for frame_id, tracker_output in zip(frame_ids, frame_tracker_outputs):
+        current_tracker_ids = list(tracker_output.reshape(-1, 7)[:, 4])
+        nb_fast_path_frames += reid_processor._is_steady_frame(current_tracker_ids)
+        reid_processor.update(tracker_output, frame_id)
+        assert reid_processor._memory_counters.counters == _count_tracked_objects(reid_processor)
+
+    assert nb_fast_path_frames > 0
+    assert reid_processor.nb_corrections > 0
+    longest_chains = reid_processor.memory_report()["longest_chains"]
+    expected_nb_ids = sorted(
+        (len(obj.re_id_chain) for obj in reid_processor.all_tracked_objects), reverse=True
+    )
+    assert [chain["nb_ids"] for chain in longest_chains] == expected_nb_ids[
+        : ReidProcessor.NB_LONGEST_CHAINS
+    ]
+
+
+def test_memory_counters_after_cut():
+    reid_processor = _build_processor()
+    for frame_id, frame in enumerate(_build_frames()):
+        # tracker id 2, merged with 3 at frame 11, reappears and cuts the re-id chain [2, 3]
+        if frame_id >= 15:
+            frame = np.vstack([frame, [[200, 300, 250, 350, 2, 1, 0.8]]])
+        reid_processor.update(frame, frame_id)
+        assert reid_processor._memory_counters.counters == _count_tracked_objects(reid_processor)
+
+    assert [list(obj.re_id_chain) for obj in reid_processor.all_tracked_objects] == [
+        [1.0],
+        [2.0],
+        [3.0],
+        [4.0],
+    ]
+
+
+def test_latency_budget():
+    frames = _build_frames()
+    reid_processor = _build_processor()
+    relaxed_reid_processor = _build_processor(latency_budget_ms=1e9)
+    # a frame cannot be processed in no time, so matching is always deferred
+    exhausted_reid_processor = _build_processor(latency_budget_ms=0)
+
+    for frame_id, frame in enumerate(frames):
+        output = reid_processor.update(frame, frame_id)
+        assert np.array_equal(output, relaxed_reid_processor.update(frame, frame_id))
+        exhausted_reid_processor.update(frame, frame_id)
+
+    assert reid_processor.latency_stats is None
+    assert reid_processor.nb_corrections == relaxed_reid_processor.nb_corrections == 1
+    assert relaxed_reid_processor.latency_stats["counters"]["deferred_matchings"] == 0
+
+    latency_stats = exhausted_reid_processor.latency_stats
+    assert exhausted_reid_processor.nb_corrections == 0
+    assert latency_stats["counters"]["deferred_matchings"] > 0
+    assert latency_stats["counters"]["over_budget_frames"] == len(frames)
+    assert "total" in latency_stats["stage_timings"]
+
+
+def test_timestamps_on_decimated_stream():
+    frame_ids, frame_tracker_outputs = load_tracker_log(INTEGRATION_INPUT_FILE)
+    fps = 30
+
+    def run(step, **kwargs):
+        reid_processor = ReidProcessor(filter_confidence_threshold=0.1, **kwargs)
+        object_ids = {}
+        for frame_id, tracker_output in list(zip(frame_ids, frame_tracker_outputs))[::step]:
+            output = reid_processor.update(tracker_output, frame_id, timestamp=frame_id / fps)
+            for row in output:
+                object_ids[(frame_id, row[9])] = row[1]
+        return object_ids
+
+    full_rate_object_ids = run(
+        1, filter_time_threshold=5, max_frames_to_rematch=100, max_attempt_to_match=5
+    )
+    seconds_kwargs = {
+        "filter_time_threshold": 4 / fps,
+        "max_frames_to_rematch": 100 / fps,
+        "max_attempt_to_match": 5 / fps,
+        "time_unit": "seconds",
+    }
+    assert run(1, **seconds_kwargs).keys() <= full_rate_object_ids.keys()
+
+    # on every third frame, thresholds in seconds give the same ids as the full-rate stream
+    decimated_object_ids = run(3, **seconds_kwargs)
+    assert decimated_object_ids
+    for key, object_id in decimated_object_ids.items():
+        assert full_rate_object_ids[key] == object_id
+
+    with pytest.raises(ValueError):
+        ReidProcessor(filter_confidence_threshold=0.1, **seconds_kwargs).update(
+            frame_tracker_outputs[0], frame_ids[0]
+        )
+
+
+def test_emission_lag():
+    frames = _build_frames()
+
+    reid_processor = _build_processor()
+    lagged_reid_processor = _build_processor(emission_lag=5)
+    outputs, lagged_outputs = [], []
+    for frame_id, tracker_output in enumerate(frames):
+        outputs.append(reid_processor.update(tracker_output, frame_id))
+        lagged_output = lagged_reid_processor.update(tracker_output, frame_id)
+        assert not len(lagged_output) or lagged_output[:, 0].max() == frame_id - 5
+        lagged_outputs.append(lagged_output)
+    lagged_outputs.append(lagged_reid_processor.flush_pending_frames())
+    output = np.concatenate(outputs)
+    lagged_output = np.concatenate(lagged_outputs)
+
+    # rows emitted immediately are emitted with the lag too, with mean confidences at emission time, and the rows
+    # of object 3 while it was a candidate are emitted retroactively with the id it was matched to
+    columns = [0, 1, 2, 3, 4, 5, 6, 7, 9]
+    assert {tuple(row) for row in output[:, columns]} <= {
+        tuple(row) for row in lagged_output[:, columns]
+    }
+    object_3_rows = lagged_output[lagged_output[:, 9] == 3]
+    assert len(object_3_rows) == 20 > (output[:, 9] == 3).sum()
+    assert set(object_3_rows[:, 1]) == {2}
+    assert not lagged_reid_processor.flush_pending_frames().size
+
+
+def test_emission_lag_values():
+    with pytest.raises(ValueError, match="non-negative"):
+        _build_processor(emission_lag=-1)
+
+    # without lag, the rows of each frame are emitted by its update
+    reid_processor = _build_processor(emission_lag=0)
+    for frame_id, tracker_output in enumerate(_build_frames()):
+        output = reid_processor.update(tracker_output, frame_id)
+        assert not len(output) or set(output[:, 0]) == {frame_id}
+    assert not reid_processor.flush_pending_frames().size
@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.reorder_buffer import ReorderBuffer
+from trackreid.tracker_log import load_tracker_log
+
+INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 5,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.time = 0.0
+
+    def __call__(self):
+        return self.time
+
+
+def test_reorder_buffer_restores_order():
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    reid_processor = ReidProcessor(**PROCESSOR_KWARGS)
+    expected_outputs = [
+        reid_processor.update(tracker_output, frame_id)
+        for frame_id, tracker_output in zip(frame_ids, frame_tracker_outputs)
+    ]
+
+    # shuffle frames within windows of 8 frames
+    rng = np.random.default_rng(0)
+    order = np.argsort(np.arange(len(frame_ids)) + rng.uniform(0, 8, size=len(frame_ids)))
+
+    reorder_buffer = ReorderBuffer(
+        ReidProcessor(**PROCESSOR_KWARGS), max_size=16, start_frame_id=frame_ids[0]
+    )
+    released = []
+    for index in order:
+        released.extend(reorder_buffer.submit(frame_ids[index], frame_tracker_outputs[index]))
+    released.extend(reorder_buffer.flush())
+
+    assert [frame_id for frame_id, _ in released] == list(frame_ids)
+    for (_, output), expected_output in zip(released, expected_outputs):
+        assert np.array_equal(output, expected_output)
+
+    stats = reorder_buffer.get_stats()
+    assert stats["released_frames"] == len(frame_ids)
+    assert stats["missing_frames"] == stats["late_frames"] == 0
+    assert 0 < stats["max_reorder_depth"] < 8
+
+
+@pytest.mark.parametrize("gap_policy", ["empty", "skip"])
+def test_reorder_buffer_gaps(gap_policy):
+    frame = np.array([[0, 0, 10, 10, 1, 0, 0.9]])
+    clock = FakeClock()
+    reorder_buffer = ReorderBuffer(
+        ReidProcessor(**PROCESSOR_KWARGS),
+        max_size=3,
+        timeout=1.0,
+        gap_policy=gap_policy,
+        clock=clock,
+    )
+
+    assert [frame_id for frame_id, _ in reorder_buffer.submit(0, frame)] == [0]
+    # frame 1 is missing: frames 2 and 3 wait until the timeout
+    assert reorder_buffer.submit(2, frame) == []
+    assert reorder_buffer.submit(3, frame) == []
+    assert reorder_buffer.poll() == []
+    clock.time = 1.0
+    released = [frame_id for frame_id, _ in reorder_buffer.poll()]
+    assert released == ([1, 2, 3] if gap_policy == "empty" else [2, 3])
+
+    # frame 1 arrives too late, frame 4 is missing and given up when the buffer is full
+    assert reorder_buffer.submit(1, frame) == []
+    for frame_id in (5, 6):
+        assert reorder_buffer.submit(frame_id, frame) == []
+    released = [frame_id for frame_id, _ in reorder_buffer.submit(7, frame)]
+    assert released == ([4, 5, 6, 7] if gap_policy == "empty" else [5, 6, 7])
+
+    stats = reorder_buffer.get_stats()
+    assert stats["late_frames"] == 1
+    assert stats["missing_frames"] == 2
+    assert stats["timeouts"] == 1
+    assert stats["max_reorder_depth"] == 3
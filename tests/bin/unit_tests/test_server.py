@@ -0,0 +1,85 @@
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.metrics import ReidMetrics
+from trackreid.server import ReidClient, ReidServer
+from trackreid.tracker_log import load_tracker_log
+
+INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.1,
+    "filter_time_threshold": 5,
+    "max_frames_to_rematch": 100,
+    "max_attempt_to_match": 5,
+}
+
+
+@pytest.fixture
+def unix_server(tmp_path):
+    server = ReidServer(str(tmp_path / "reid.sock"), PROCESSOR_KWARGS).start()
+    yield server
+    server.stop()
+
+
+def test_server_matches_processor(unix_server):
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    reid_processor = ReidProcessor(**PROCESSOR_KWARGS)
+
+    with ReidClient(unix_server.address) as client:
+        for frame_id, tracker_output in zip(frame_ids, frame_tracker_outputs):
+            output = client.update("camera", tracker_output, frame_id)
+            expected_output = reid_processor.update(tracker_output, frame_id)
+            assert np.array_equal(output, expected_output.reshape(output.shape))
+        assert set(client.last_stats) == {"queue_time", "process_time", "round_trip_time"}
+
+        client.close_stream("camera")
+        assert not unix_server.processors
+
+        # errors are returned to the client, and the connection stays usable
+        with pytest.raises(RuntimeError):
+            client.update("invalid", np.zeros((2, 3)), 0)
+        output = client.update("camera", frame_tracker_outputs[0], frame_ids[0])
+        expected_output = ReidProcessor(**PROCESSOR_KWARGS).update(
+            frame_tracker_outputs[0], frame_ids[0]
+        )
+        assert np.array_equal(output, expected_output.reshape(output.shape))
+
+
+def test_server_multiplexes_streams():
+    server = ReidServer(("127.0.0.1", 0), PROCESSOR_KWARGS).start()
+    frame_ids, frame_tracker_outputs = load_tracker_log(INPUT_FILE)
+    frame_ids, frame_tracker_outputs = frame_ids[:100], frame_tracker_outputs[:100]
+    outputs = {}
+
+    def run_stream(stream_id):
+        with ReidClient(server.address) as client:
+            outputs[stream_id] = [
+                client.update(stream_id, tracker_output, frame_id)
+                for frame_id, tracker_output in zip(frame_ids, frame_tracker_outputs)
+            ]
+
+    threads = [threading.Thread(target=run_stream, args=(f"camera_{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    server.stop()
+
+    assert len(server.processors) == 4
+    assert server.stats["nb_requests"] == 400
+    for stream_outputs in outputs.values():
+        for output, expected_output in zip(stream_outputs, outputs["camera_0"]):
+            assert np.array_equal(output, expected_output)
+
+
+def test_server_rejects_processor_kwargs(tmp_path):
+    address = str(tmp_path / "reid.sock")
+    with pytest.raises(ValueError, match="output format"):
+        ReidServer(address, {**PROCESSOR_KWARGS, "output_format": "structured"})
+    with pytest.raises(ValueError, match="metrics argument"):
+        ReidServer(address, {**PROCESSOR_KWARGS, "metrics": ReidMetrics()})
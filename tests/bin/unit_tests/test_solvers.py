@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+
+from trackreid.solvers import (
+    auction_solver,
+    auto_solver,
+    get_solver,
+    greedy_solver,
+    jv_solver,
+    trivial_solver,
+)
+
+COST_LIMIT = 1e6 - 0.1
+
+
+def _random_cost_matrix(nb_rows, nb_columns, density, seed=0):
+    rng = np.random.default_rng(seed)
+    cost_matrix = rng.integers(0, 20, size=(nb_rows, nb_columns)).astype(float)
+    cost_matrix[rng.random((nb_rows, nb_columns)) > density] = 1e6
+    return cost_matrix
+
+
+def _total_cost(cost_matrix, rows, columns):
+    nb_unmatched = sum(cost_matrix.shape) - 2 * len(rows)
+    return cost_matrix[rows, columns].sum() + nb_unmatched * COST_LIMIT / 2
+
+
+def _sorted_greedy(cost_matrix):
+    rows, columns = np.nonzero(cost_matrix < COST_LIMIT)
+    order = np.argsort(cost_matrix[rows, columns], kind="stable")
+    matched_rows, matched_columns, matches = set(), set(), []
+    for row, column in zip(rows[order], columns[order]):
+        if row not in matched_rows and column not in matched_columns:
+            matched_rows.add(row)
+            matched_columns.add(column)
+            matches.append((column, row))
+    return sorted(matches)
+
+
+@pytest.mark.parametrize("shape", [(6, 6), (5, 9), (12, 4), (30, 30)])
+@pytest.mark.parametrize("density", [1.0, 0.3])
+def test_solvers(shape, density):
+    cost_matrix = _random_cost_matrix(*shape, density=density)
+    optimal_cost = _total_cost(cost_matrix, *jv_solver(cost_matrix.copy(), COST_LIMIT))
+
+    # integer costs with ties: the greedy solver breaks them like a stable sort of the pairs
+    rows, columns = greedy_solver(cost_matrix, COST_LIMIT)
+    assert list(zip(columns, rows)) == _sorted_greedy(cost_matrix)
+    assert _total_cost(cost_matrix, rows, columns) >= optimal_cost
+
+    for solver in (auction_solver, auto_solver):
+        rows, columns = solver(cost_matrix, COST_LIMIT)
+        assert np.all(np.diff(columns) > 0)
+        assert len(set(rows)) == len(rows)
+        assert np.all(cost_matrix[rows, columns] < COST_LIMIT)
+    # the auction solver is exact on square problems where all pairs are allowed
+    if shape[0] == shape[1] and density == 1.0:
+        assert _total_cost(cost_matrix, *auction_solver(cost_matrix, COST_LIMIT)) == pytest.approx(
+            optimal_cost
+        )
+    assert _total_cost(cost_matrix, *auto_solver(cost_matrix, COST_LIMIT)) == optimal_cost
+
+
+def test_trivial_solver():
+    cost_matrix = np.array([[5.0, 2.0, 1e6, 2.0]])
+    for matrix, expected in ((cost_matrix, ([0], [1])), (cost_matrix.T, ([1], [0]))):
+        rows, columns = trivial_solver(matrix, COST_LIMIT)
+        assert (rows.tolist(), columns.tolist()) == expected
+        assert auto_solver(matrix, COST_LIMIT)[0].tolist() == expected[0]
+
+    rows, columns = trivial_solver(np.array([[1e6, 1e6]]), COST_LIMIT)
+    assert not rows.size and not columns.size
+    with pytest.raises(ValueError):
+        trivial_solver(np.zeros((2, 2)), COST_LIMIT)
+
+
+def test_get_solver():
+    assert get_solver("greedy") is greedy_solver
+    assert get_solver(jv_solver) is jv_solver
+    with pytest.raises(ValueError):
+        get_solver("hungarian")
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from trackreid import ReidProcessor
+from trackreid.evaluation import tracker_log_to_predictions
+from trackreid.sweep import SharedTrackerLog, get_parameter_grid, run_sweep
+from trackreid.tracker_log import load_tracker_log, process_tracker_log
+
+INTEGRATION_INPUT_FILE = Path("tests/assets/integration_tests/data/tracker_output.txt")
+BASE_KWARGS = {"filter_confidence_threshold": 0.1, "filter_time_threshold": 5}
+PARAM_GRID = {"max_frames_to_rematch": [20, 100], "max_attempt_to_match": [3, 5]}
+
+
+def test_shared_tracker_log():
+    tracker_log = np.loadtxt(INTEGRATION_INPUT_FILE, ndmin=2)
+    frame_ids, frame_tracker_outputs = load_tracker_log(INTEGRATION_INPUT_FILE)
+
+    shared_log = SharedTrackerLog.create(tracker_log)
+    attached_log = SharedTrackerLog.attach(shared_log.name)
+    shared_frame_ids, shared_frame_tracker_outputs = attached_log.get_frames()
+    np.testing.assert_array_equal(shared_frame_ids, frame_ids)
+    assert len(shared_frame_tracker_outputs) == len(frame_tracker_outputs)
+    for shared_tracker_output, tracker_output in zip(
+        shared_frame_tracker_outputs, frame_tracker_outputs
+    ):
+        np.testing.assert_array_equal(shared_tracker_output, tracker_output)
+    with pytest.raises(ValueError):
+        shared_frame_tracker_outputs[0][0, 0] = 0
+
+    del shared_frame_ids, shared_frame_tracker_outputs, shared_tracker_output
+    attached_log.close()
+    shared_log.close()
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_run_sweep(max_workers):
+    tracker_log = np.loadtxt(INTEGRATION_INPUT_FILE, ndmin=2)
+    ground_truth = tracker_log_to_predictions(tracker_log)[:, [0, 1, 3, 4, 5, 6]]
+    results = run_sweep(
+        INTEGRATION_INPUT_FILE,
+        param_grid=PARAM_GRID,
+        base_kwargs=BASE_KWARGS,
+        ground_truth=ground_truth,
+        return_outputs=True,
+        max_workers=max_workers,
+    )
+
+    assert len(results) == 4
+    frame_ids, frame_tracker_outputs = load_tracker_log(INTEGRATION_INPUT_FILE)
+    for parameters, row in zip(get_parameter_grid(PARAM_GRID), results):
+        assert row.items() >= parameters.items()
+        reid_processor = ReidProcessor(**BASE_KWARGS, **parameters)
+        outputs = process_tracker_log(reid_processor, frame_ids, frame_tracker_outputs)
+        np.testing.assert_array_equal(
+            row["outputs"], np.concatenate([output for output in outputs if output.size])
+        )
+        assert row["nb_corrections"] == reid_processor.nb_corrections
+        assert row["mean_nb_corrections"] == reid_processor.mean_nb_corrections
+        assert row["nb_output_rows"] == len(row["outputs"])
+        assert 0 < row["idf1"] <= 1
@@ -1,6 +1,8 @@
 import json
 from pathlib import Path
 
+import numpy as np
+
 from trackreid.tracked_object import TrackedObject
 
 INPUT_FOLDER = Path("tests/assets/unit_tests/data/tracked_objects")
@@ -91,6 +93,41 @@ def test_get_nb_frames_since_last_appearance():
     assert tracked_object.get_nb_frames_since_last_appearance(300) == 49
 
 
+def test_timestamps_fall_back_to_frames():
+    # the object was observed on frames without timestamps
+    tracked_object = ALL_TRACKED_OBJECTS[0].copy()
+    assert tracked_object.get_age(100, timestamp=10.0) == 85
+    assert tracked_object.get_nb_frames_since_last_appearance(300, timestamp=10.0) == 49
+
+    tracked_object.update_metadata(np.array([0, 0, 10, 10, 1, 0, 0.9]), 301, timestamp=10.0)
+    assert tracked_object.get_age(302, timestamp=10.5) == 0.5
+    assert tracked_object.get_nb_frames_since_last_appearance(302, timestamp=10.5) == 0.5
+
+
 def test_get_state():
     tracked_object = ALL_TRACKED_OBJECTS[0].copy()
     assert tracked_object.get_state() == 0
+
+
+def test_tracked_object_trajectory_merge_and_cut():
+    tracked_object_1 = TrackedObject(
+        object_ids=1,
+        state=0,
+        metadata=np.array([0, 0, 10, 10, 1, 0, 0.5]),
+        frame_id=0,
+        trajectory_capacity=4,
+    )
+    tracked_object_1.update_metadata(np.array([1, 0, 10, 10, 1, 0, 0.5]), frame_id=1)
+    tracked_object_2 = TrackedObject(
+        object_ids=2,
+        state=0,
+        metadata=np.array([5, 0, 10, 10, 2, 0, 0.5]),
+        frame_id=5,
+        trajectory_capacity=4,
+    )
+    tracked_object_1.merge(tracked_object_2)
+    assert tracked_object_1.metadata.trajectory[:, 0].tolist() == [0, 1, 5]
+
+    new_object, cut_object = tracked_object_1.cut(1)
+    assert new_object.metadata.trajectory[:, 0].tolist() == [5]
+    assert cut_object.metadata.trajectory[:, 0].tolist() == [0, 1, 5]
@@ -5,7 +5,10 @@ import numpy as np
 from llist import sllist
 
 from trackreid import utils
-from trackreid.configs.output_data_positions import OutputDataPositions
+from trackreid.configs.output_data_positions import (
+    OutputDataPositions,
+    output_data_dtypes,
+)
 from trackreid.tracked_object import TrackedObject
 
 # Load tracked object data
@@ -90,3 +93,11 @@ def test_reshape_tracker_result():
 def test_get_nb_output_cols():
     output_positions = OutputDataPositions()
     assert utils.get_nb_output_cols(output_positions) == 10
+
+
+def test_get_output_dtype():
+    output_positions = OutputDataPositions()
+    output_dtype = utils.get_output_dtype(output_positions, output_data_dtypes)
+    assert output_dtype["frame_id"] == np.int32
+    assert output_dtype["bbox"].shape == (4,)
+    assert output_dtype.itemsize == 40
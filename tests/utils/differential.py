@@ -0,0 +1,251 @@
+"""
+Differential testing of trackreid against the frozen reference engine (tests/utils/reference_engine).
+
+Randomized tracker sequences are processed by both engines, and outputs and re-id chains are compared frame by
+frame. When they diverge, the sequence is shrunk to a minimal reproducing sequence, so that divergences introduced
+by optimizations can be investigated on a handful of detections.
+
+Larger runs can be launched with: python -m tests.utils.differential --seeds 100 --nb-frames 1000
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from tests.utils.reference_engine import ReidProcessor as ReferenceReidProcessor
+from trackreid import ReidProcessor
+
+PROCESSOR_KWARGS = {
+    "filter_confidence_threshold": 0.3,
+    "filter_time_threshold": 3,
+    "max_frames_to_rematch": 30,
+    "max_attempt_to_match": 4,
+}
+
+
+@dataclass
+class Divergence:
+    frame_index: int
+    reason: str
+    frames: List[np.ndarray]
+
+    def __str__(self) -> str:
+        return (
+            f"Engines diverge at frame {self.frame_index} ({self.reason}) on the sequence:\n"
+            + format_sequence(self.frames)
+        )
+
+
+def generate_tracker_sequence(
+    seed: int,
+    nb_frames: int = 200,
+    birth_rate: float = 0.1,
+    death_rate: float = 0.02,
+    switch_rate: float = 0.02,
+    miss_rate: float = 0.1,
+    empty_frame_rate: float = 0.05,
+    reappearance_rate: float = 0.03,
+) -> List[np.ndarray]:
+    """
+    Generates a random tracker sequence, with objects moving, being missed, disappearing, and changing tracker id.
+    Tracker ids of old objects randomly reappear, which cuts their re-id chains, and some frames are empty.
+
+    Args:
+        seed (int): The random seed.
+        nb_frames (int, optional): The number of frames. Defaults to 200.
+        birth_rate (float, optional): Probability that an object appears in a frame. Defaults to 0.1.
+        death_rate (float, optional): Probability that an object disappears in a frame. Defaults to 0.02.
+        switch_rate (float, optional): Probability that an object changes tracker id in a frame. Defaults to 0.02.
+        miss_rate (float, optional): Probability that an object is not detected in a frame. Defaults to 0.1.
+        empty_frame_rate (float, optional): Probability that a frame is empty. Defaults to 0.05.
+        reappearance_rate (float, optional): Probability that an old tracker id reappears in a frame.
+            Defaults to 0.03.
+
+    Returns:
+        List[np.ndarray]: The tracker output of each frame.
+    """
+    rng = np.random.default_rng(seed)
+    next_tracker_id = 1
+    alive_objects = {}
+    frames = []
+    for _ in range(nb_frames):
+        if rng.random() < birth_rate or not alive_objects:
+            alive_objects[next_tracker_id] = [
+                rng.uniform(0, 1000),
+                rng.uniform(0, 1000),
+                int(rng.integers(0, 3)),
+            ]
+            next_tracker_id += 1
+
+        for tracker_id in list(alive_objects):
+            draw = rng.random()
+            if draw < death_rate:
+                del alive_objects[tracker_id]
+            elif draw < death_rate + switch_rate:
+                alive_objects[next_tracker_id] = alive_objects.pop(tracker_id)
+                next_tracker_id += 1
+
+        rows = []
+        for tracker_id, (x, y, category) in alive_objects.items():
+            if rng.random() < miss_rate:
+                continue
+            alive_objects[tracker_id][0] += rng.normal(0, 5)
+            if rng.random() < 0.1:
+                category = (category + 1) % 3
+            rows.append([x, y, x + 50, y + 80, tracker_id, category, rng.uniform(0.2, 1.0)])
+
+        if rng.random() < empty_frame_rate:
+            rows = []
+
+        if rng.random() < reappearance_rate and next_tracker_id > 3:
+            old_tracker_id = int(rng.integers(1, next_tracker_id))
+            if old_tracker_id not in alive_objects:
+                rows.append([1, 1, 50, 50, old_tracker_id, 0, 0.9])
+
+        frames.append(np.array(rows) if rows else np.empty((0, 7)))
+    return frames
+
+
+def format_sequence(frames: List[np.ndarray]) -> str:
+    """
+    Formats a tracker sequence as Python code, to paste a reproducing sequence in a test.
+    """
+    lines = ["frames = ["]
+    for frame in frames:
+        rows = ", ".join(repr([round(float(value), 6) for value in row]) for row in frame)
+        lines.append(f"    np.array([{rows}]).reshape(-1, 7),")
+    lines.append("]")
+    return "\n".join(lines)
+
+
+def _get_chains(reid_processor) -> List[Tuple[List[float], int]]:
+    return sorted(
+        (list(tracked_object.re_id_chain), tracked_object.state)
+        for tracked_object in reid_processor.all_tracked_objects
+    )
+
+
+def find_divergence(
+    frames: List[np.ndarray],
+    optimized_kwargs: Optional[Dict] = None,
+    processor_kwargs: Optional[Dict] = None,
+) -> Optional[Tuple[int, str]]:
+    """
+    Processes a sequence with the reference engine and with trackreid, and compares their outputs and
+    re-id chains after each frame.
+
+    Args:
+        frames (List[np.ndarray]): The tracker output of each frame.
+        optimized_kwargs (Optional[Dict], optional): Extra parameters of the trackreid ReidProcessor, e.g. to
+            enable optional features, overriding processor_kwargs. Defaults to None.
+        processor_kwargs (Optional[Dict], optional): Parameters of both engines. Defaults to PROCESSOR_KWARGS.
+
+    Returns:
+        Optional[Tuple[int, str]]: The index of the first diverging frame and the reason, or None.
+    """
+    processor_kwargs = processor_kwargs or PROCESSOR_KWARGS
+    reference_processor = ReferenceReidProcessor(**processor_kwargs)
+    reid_processor = ReidProcessor(**{**processor_kwargs, **(optimized_kwargs or {})})
+
+    for frame_index, frame in enumerate(frames):
+        reference_output = reference_processor.update(frame.copy(), frame_index)
+        output = reid_processor.update(frame.copy(), frame_index)
+        if reference_output.shape != output.shape or not np.array_equal(reference_output, output):
+            return frame_index, "different outputs"
+        if _get_chains(reference_processor) != _get_chains(reid_processor):
+            return frame_index, "different re-id chains"
+    return None
+
+
+def shrink_sequence(
+    frames: List[np.ndarray], diverges: Callable[[List[np.ndarray]], bool]
+) -> List[np.ndarray]:
+    """
+    Shrinks a diverging sequence by removing frames, then detections, as long as it keeps diverging.
+
+    Args:
+        frames (List[np.ndarray]): A sequence on which diverges is True.
+        diverges (Callable[[List[np.ndarray]], bool]): Whether the engines diverge on a sequence.
+
+    Returns:
+        List[np.ndarray]: A sequence on which diverges is True, and from which no frame or detection can be
+        removed without losing the divergence.
+    """
+    # remove chunks of frames, of decreasing size
+    chunk_size = max(len(frames) // 2, 1)
+    while True:
+        start = 0
+        while start < len(frames):
+            shrunk_frames = frames[:start] + frames[start + chunk_size :]
+            if shrunk_frames and diverges(shrunk_frames):
+                frames = shrunk_frames
+            else:
+                start += chunk_size
+        if chunk_size == 1:
+            break
+        chunk_size = max(chunk_size // 2, 1)
+
+    # remove single detections
+    for frame_index in range(len(frames)):
+        row_index = 0
+        while row_index < len(frames[frame_index]):
+            shrunk_frames = list(frames)
+            shrunk_frames[frame_index] = np.delete(frames[frame_index], row_index, axis=0)
+            if diverges(shrunk_frames):
+                frames = shrunk_frames
+            else:
+                row_index += 1
+    return frames
+
+
+def check_equivalence(
+    frames: List[np.ndarray],
+    optimized_kwargs: Optional[Dict] = None,
+    processor_kwargs: Optional[Dict] = None,
+) -> Optional[Divergence]:
+    """
+    Checks that trackreid and the reference engine agree on a sequence, and shrinks it if they do not.
+
+    Args:
+        frames (List[np.ndarray]): The tracker output of each frame.
+        optimized_kwargs (Optional[Dict], optional): Extra parameters of the trackreid ReidProcessor.
+            Defaults to None.
+        processor_kwargs (Optional[Dict], optional): Parameters of both engines. Defaults to PROCESSOR_KWARGS.
+
+    Returns:
+        Optional[Divergence]: None if the engines agree, else the divergence on a minimal reproducing sequence.
+    """
+
+    def diverges(sequence: List[np.ndarray]) -> bool:
+        return find_divergence(sequence, optimized_kwargs, processor_kwargs) is not None
+
+    divergence = find_divergence(frames, optimized_kwargs, processor_kwargs)
+    if divergence is None:
+        return None
+
+    frames = shrink_sequence(frames[: divergence[0] + 1], diverges)
+    frame_index, reason = find_divergence(frames, optimized_kwargs, processor_kwargs)
+    return Divergence(frame_index=frame_index, reason=reason, frames=frames)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Runs the differential tests on many large random sequences."
+    )
+    parser.add_argument("--seeds", type=int, default=100)
+    parser.add_argument("--nb-frames", type=int, default=1000)
+    parser.add_argument("--cache-costs", action="store_true")
+    args = parser.parse_args()
+
+    for seed in range(args.seeds):
+        frames = generate_tracker_sequence(seed=seed, nb_frames=args.nb_frames)
+        divergence = check_equivalence(frames, optimized_kwargs={"cache_costs": args.cache_costs})
+        if divergence is not None:
+            raise SystemExit(f"Seed {seed}: {divergence}")
+    print(f"No divergence on {args.seeds} sequences of {args.nb_frames} frames.")
+
+
+if __name__ == "__main__":
+    main()
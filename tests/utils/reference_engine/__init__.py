@@ -0,0 +1,5 @@
+"""
+Frozen copy of the original, straightforward implementation of trackreid (version 0.4.1), used as the reference
+engine of the differential tests. It must not be modified: optimizations of trackreid are checked against it.
+"""
+from .reid_processor import ReidProcessor  # noqa: F401
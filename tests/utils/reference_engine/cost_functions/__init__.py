@@ -0,0 +1 @@
+from .bounding_box_distance import bounding_box_distance  # noqa: F401
@@ -0,0 +1 @@
+from .select_by_category import select_by_category  # noqa: F401
@@ -0,0 +1,299 @@
+"""
+Command line entry point to run the re-identification process offline over tracker logs.
+
+A tracker log is a text file with one detection per line and space separated columns: the frame id, followed by
+the columns of the tracker output expected by ReidProcessor.update. Each file is processed independently by a
+worker of a process pool, and its corrected output is written in the output folder, as text (same format as
+ReidProcessor with save_to_txt) or as a binary .npy array. Files whose output already exists are skipped, so an
+interrupted run can be resumed by launching the same command again. Outputs are named after the input files, so
+inputs must have distinct names. A file that fails is reported and does not stop the others, and the command then
+exits with a non-zero code.
+
+Example:
+    trackreid logs/ --output-dir corrected/ --filter-confidence-threshold 0.1 --filter-time-threshold 5 \
+        --max-frames-to-rematch 500 --max-attempt-to-match 5 --workers 8
+"""
+import argparse
+import importlib
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from trackreid import cost_functions, selection_functions
+from trackreid.reid_processor import ReidProcessor
+from trackreid.solvers import SOLVERS
+from trackreid.tracker_log import load_tracker_log, process_tracker_log
+
+OUTPUT_EXTENSIONS = {"txt": ".txt", "npy": ".npy"}
+
+
+def resolve_function(name: str, default_module) -> Callable:
+    """
+    Resolves a cost or selection function from its name. Bare names are looked up in the default module
+    (trackreid.cost_functions or trackreid.selection_functions), while "package.module:function" names are imported.
+
+    Args:
+        name (str): The function name.
+        default_module: The module where bare names are looked up.
+
+    Returns:
+        Callable: The function.
+    """
+    if ":" in name:
+        module_name, function_name = name.split(":", 1)
+        module = importlib.import_module(module_name)
+    else:
+        module, function_name = default_module, name
+    if not hasattr(module, function_name):
+        raise NameError(f"Function {function_name} not found in {module.__name__}.")
+    return getattr(module, function_name)
+
+
+def list_input_files(inputs: List[str], pattern: str) -> List[Path]:
+    """
+    Lists the tracker logs to process, expanding directories with the given glob pattern.
+
+    Args:
+        inputs (List[str]): Files or directories.
+        pattern (str): Glob pattern of the tracker logs in directories.
+
+    Returns:
+        List[Path]: The sorted list of unique files.
+    """
+    files = []
+    for input_path in map(Path, inputs):
+        if input_path.is_dir():
+            files.extend(sorted(input_path.glob(pattern)))
+        elif input_path.is_file():
+            files.append(input_path)
+        else:
+            raise FileNotFoundError(f"Input {input_path} does not exist.")
+    return list(dict.fromkeys(files))
+
+
+def get_output_paths(input_paths: List[Path], output_dir: Path, extension: str) -> List[Path]:
+    """
+    Returns the output path of each tracker log, named after its stem in the output folder.
+
+    Args:
+        input_paths (List[Path]): The tracker logs.
+        output_dir (Path): The output folder.
+        extension (str): The extension of the outputs.
+
+    Returns:
+        List[Path]: The output paths, in the order of the inputs.
+
+    Raises:
+        ValueError: If several tracker logs share the same stem, as their outputs would overwrite each other.
+    """
+    stems = {}
+    for input_path in input_paths:
+        if input_path.stem in stems:
+            raise ValueError(
+                f"Inputs {stems[input_path.stem]} and {input_path} have the same name "
+                f"{input_path.stem} and would be written to the same output."
+            )
+        stems[input_path.stem] = input_path
+    return [output_dir / (input_path.stem + extension) for input_path in input_paths]
+
+
+def process_file(
+    input_path: Path, output_path: Path, processor_kwargs: Dict, output_format: str
+) -> Dict:
+    """
+    Runs a ReidProcessor over a tracker log and writes its corrected output. The output is first written
+    to a temporary file and then renamed, so that an existing output is always complete.
+
+    Args:
+        input_path (Path): The tracker log.
+        output_path (Path): The corrected output.
+        processor_kwargs (Dict): The ReidProcessor parameters, with cost and selection functions given by name.
+        output_format (str): "txt" or "npy".
+
+    Returns:
+        Dict: Statistics of the run: number of frames, of output rows, of corrections and elapsed time.
+    """
+    start = time.perf_counter()
+    processor_kwargs = dict(processor_kwargs)
+    processor_kwargs["cost_function"] = resolve_function(
+        processor_kwargs["cost_function"], cost_functions
+    )
+    processor_kwargs["selection_function"] = resolve_function(
+        processor_kwargs["selection_function"], selection_functions
+    )
+
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    tmp_path.unlink(missing_ok=True)
+
+    reid_processor = ReidProcessor(
+        save_to_txt=output_format == "txt", file_path=str(tmp_path), **processor_kwargs
+    )
+    frame_ids, frame_tracker_outputs = load_tracker_log(input_path)
+    outputs = process_tracker_log(reid_processor, frame_ids, frame_tracker_outputs)
+    outputs = [output for output in outputs if output.size]
+
+    if output_format == "npy":
+        nb_cols = reid_processor.nb_output_cols
+        output = np.concatenate(outputs) if outputs else np.zeros((0, nb_cols))
+        with tmp_path.open("wb") as file:
+            np.save(file, output)
+    else:
+        tmp_path.touch()
+    tmp_path.replace(output_path)
+
+    return {
+        "input_path": str(input_path),
+        "nb_frames": len(frame_ids),
+        "nb_rows": sum(len(output) for output in outputs),
+        "nb_corrections": reid_processor.nb_corrections,
+        "elapsed": time.perf_counter() - start,
+    }
+
+
+def add_processor_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the ReidProcessor parameters to a parser, see get_processor_kwargs.
+    """
+    processor = parser.add_argument_group("ReidProcessor parameters")
+    processor.add_argument("--filter-confidence-threshold", type=float, required=True)
+    processor.add_argument("--filter-time-threshold", type=int, required=True)
+    processor.add_argument("--max-frames-to-rematch", type=int, required=True)
+    processor.add_argument("--max-attempt-to-match", type=int, required=True)
+    processor.add_argument("--cost-function", default="bounding_box_distance")
+    processor.add_argument("--selection-function", default="select_by_category")
+    processor.add_argument("--cost-function-threshold", type=float, default=None)
+    processor.add_argument("--num-classes", type=int, default=None)
+    processor.add_argument("--velocity-smoothing", type=float, default=None)
+    processor.add_argument("--trajectory-capacity", type=int, default=None)
+    processor.add_argument("--cache-costs", action="store_true")
+    processor.add_argument("--solver", choices=list(SOLVERS), default="jv")
+
+
+def get_processor_kwargs(args: argparse.Namespace) -> Dict:
+    """
+    Returns the ReidProcessor parameters of parsed arguments, with cost and selection functions given by name.
+    """
+    return {
+        "filter_confidence_threshold": args.filter_confidence_threshold,
+        "filter_time_threshold": args.filter_time_threshold,
+        "max_frames_to_rematch": args.max_frames_to_rematch,
+        "max_attempt_to_match": args.max_attempt_to_match,
+        "cost_function": args.cost_function,
+        "selection_function": args.selection_function,
+        "cost_function_threshold": args.cost_function_threshold,
+        "num_classes": args.num_classes,
+        "velocity_smoothing": args.velocity_smoothing,
+        "trajectory_capacity": args.trajectory_capacity,
+        "cache_costs": args.cache_costs,
+        "solver": args.solver,
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="trackreid",
+        description="Run the re-identification process over tracker logs.",
+    )
+    parser.add_argument("inputs", nargs="+", help="Tracker log files or directories.")
+    parser.add_argument("--output-dir", required=True, help="Folder of the corrected outputs.")
+    parser.add_argument(
+        "--pattern", default="*.txt", help="Glob pattern of the tracker logs in input directories."
+    )
+    parser.add_argument("--format", choices=list(OUTPUT_EXTENSIONS), default="txt")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes.")
+    parser.add_argument(
+        "--overwrite", action="store_true", help="Process files whose output already exists."
+    )
+
+    add_processor_arguments(parser)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    processor_kwargs = get_processor_kwargs(args)
+    # fail fast on unknown functions rather than in every worker
+    resolve_function(args.cost_function, cost_functions)
+    resolve_function(args.selection_function, selection_functions)
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    input_paths = list_input_files(args.inputs, args.pattern)
+    output_paths = get_output_paths(input_paths, output_dir, OUTPUT_EXTENSIONS[args.format])
+
+    tasks = []
+    nb_skipped = 0
+    for input_path, output_path in zip(input_paths, output_paths):
+        if output_path.exists() and not args.overwrite:
+            nb_skipped += 1
+        else:
+            tasks.append((input_path, output_path))
+
+    print(
+        f"{len(tasks)} file(s) to process, {nb_skipped} already processed file(s) skipped.",
+        file=sys.stderr,
+    )
+
+    start = time.perf_counter()
+    results, failures = [], []
+    if args.workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(
+                    process_file, input_path, output_path, processor_kwargs, args.format
+                ): input_path
+                for input_path, output_path in tasks
+            }
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as error:  # noqa: BLE001
+                    failures.append(futures[future])
+                    _print_failure(futures[future], error, len(results) + len(failures), len(tasks))
+                else:
+                    _print_progress(results[-1], len(results) + len(failures), len(tasks))
+    else:
+        for input_path, output_path in tasks:
+            try:
+                results.append(process_file(input_path, output_path, processor_kwargs, args.format))
+            except Exception as error:  # noqa: BLE001
+                failures.append(input_path)
+                _print_failure(input_path, error, len(results) + len(failures), len(tasks))
+            else:
+                _print_progress(results[-1], len(results) + len(failures), len(tasks))
+
+    elapsed = time.perf_counter() - start
+    nb_frames = sum(result["nb_frames"] for result in results)
+    nb_rows = sum(result["nb_rows"] for result in results)
+    print(
+        f"Processed {len(results)} file(s), {nb_frames} frames and {nb_rows} output rows "
+        f"in {elapsed:.2f}s ({nb_frames / max(elapsed, 1e-9):.1f} frames/s).",
+        file=sys.stderr,
+    )
+    if failures:
+        print(f"{len(failures)} file(s) failed: {', '.join(map(str, failures))}.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def _print_progress(result: Dict, nb_done: int, nb_tasks: int) -> None:
+    print(
+        f"[{nb_done}/{nb_tasks}] {result['input_path']}: {result['nb_frames']} frames, "
+        f"{result['nb_corrections']} corrections, "
+        f"{result['nb_frames'] / max(result['elapsed'], 1e-9):.1f} frames/s",
+        file=sys.stderr,
+    )
+
+
+def _print_failure(input_path: Path, error: Exception, nb_done: int, nb_tasks: int) -> None:
+    print(f"[{nb_done}/{nb_tasks}] {input_path}: failed with {error!r}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
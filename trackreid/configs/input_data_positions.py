@@ -1,25 +1,26 @@
-from pydantic import BaseModel, Field
-
-
-class InputDataPositions(BaseModel):
-    bbox: list = Field(
-        [0, 1, 2, 3],
-        description="List of bounding box coordinate positions in the input (numpy array)."
-        + "Coordinates are in the format x,y,w,h by default.",
-    )
-    object_id: int = Field(
-        4,
-        description="Position of the ID assigned by the tracker to each item in the input (numpy array)",
-    )
-    category: int = Field(
-        5,
-        description="Position of the category assigned to each detected object in the input (numpy array)",
-    )
-    confidence: int = Field(
-        6,
-        description="Position of the confidence score (range [0, 1]) for each"
-        + "detected object in the input (numpy array)",
-    )
-
-
-input_data_positions = InputDataPositions()
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(frozen=True)
+class InputDataLayout:
+    """
+    Positions of each variable in the input (numpy array) of the ReidProcessor. Plain frozen dataclass read in
+    the hot path; the documented schema, InputDataPositions, is built lazily from trackreid.configs.schemas.
+    """
+
+    bbox: List[int] = field(default_factory=lambda: [0, 1, 2, 3])
+    object_id: int = 4
+    category: int = 5
+    confidence: int = 6
+
+
+input_data_positions = InputDataLayout()
+
+
+def __getattr__(name: str):
+    if name == "InputDataPositions":
+        from trackreid.configs.schemas import InputDataPositions
+
+        return InputDataPositions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,35 +1,40 @@
-from pydantic import BaseModel, Field
-
-
-class OutputDataPositions(BaseModel):
-    frame_id: int = Field(0, description="Position of the frame id in the output (numpy array)")
-    object_id: int = Field(
-        1,
-        description="Position of the ID assigned by the reid processor to each item in the output (numpy array)",
-    )
-    category: int = Field(
-        2,
-        description="Position of the category assigned to each detected object in the output (numpy array)",
-    )
-    bbox: list = Field(
-        [3, 4, 5, 6],
-        description="List of bounding box coordinate positions in the output (numpy array)."
-        + "Coordinates are in the format x,y,w,h by default.",
-    )
-    confidence: int = Field(
-        7,
-        description="Position of the confidence score (range [0, 1]) for each"
-        + " detected object in the output (numpy array)",
-    )
-    mean_confidence: int = Field(
-        8,
-        description="Position of the mean confidence score over object life time (range [0, 1]) for each"
-        + " tracked object in the output (numpy array)",
-    )
-    tracker_id: int = Field(
-        9,
-        description="Position of the id assigned to the tracker to each object (prior re-identification).",
-    )
-
-
-output_data_positions = OutputDataPositions()
+from dataclasses import dataclass, field
+from typing import List
+
+
+@dataclass(frozen=True)
+class OutputDataLayout:
+    """
+    Positions of each variable in the output (numpy array) of the ReidProcessor. Plain frozen dataclass read in
+    the hot path; the documented schema, OutputDataPositions, is built lazily from trackreid.configs.schemas.
+    """
+
+    frame_id: int = 0
+    object_id: int = 1
+    category: int = 2
+    bbox: List[int] = field(default_factory=lambda: [3, 4, 5, 6])
+    confidence: int = 7
+    mean_confidence: int = 8
+    tracker_id: int = 9
+
+
+output_data_positions = OutputDataLayout()
+
+# Types of each output field in the structured output mode of the ReidProcessor.
+output_data_dtypes = {
+    "frame_id": "int32",
+    "object_id": "int32",
+    "category": "int32",
+    "bbox": "float32",
+    "confidence": "float32",
+    "mean_confidence": "float32",
+    "tracker_id": "int32",
+}
+
+
+def __getattr__(name: str):
+    if name == "OutputDataPositions":
+        from trackreid.configs.schemas import OutputDataPositions
+
+        return OutputDataPositions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,9 @@
+from dataclasses import dataclass, field
 from typing import ClassVar
 
-from pydantic import BaseModel
 
-
-class States(BaseModel):
+@dataclass(frozen=True)
+class States:
     LOST_FOREVER: int = -3
     TRACKER_OUTPUT: int = -2
     FILTERED_OUTPUT: int = -1
@@ -21,13 +21,15 @@ class States(BaseModel):
     }
 
 
-class Matches(BaseModel):
+@dataclass(frozen=True)
+class Matches:
     DISALLOWED_MATCH: int = 1e6
 
 
-class ReidConstants(BaseModel):
-    STATES: States = States()
-    MATCHES: Matches = Matches()
+@dataclass(frozen=True)
+class ReidConstants:
+    STATES: States = field(default_factory=States)
+    MATCHES: Matches = field(default_factory=Matches)
 
 
 reid_constants = ReidConstants()
@@ -0,0 +1,64 @@
+"""
+Documented pydantic schemas of the input and output layouts, used by the print_* helpers of the ReidProcessor.
+This module imports pydantic, and is only imported on demand so that importing trackreid stays lightweight.
+Defaults are read from the plain layouts, which remain the single source of truth.
+"""
+from pydantic import BaseModel, Field
+
+from trackreid.configs.input_data_positions import input_data_positions
+from trackreid.configs.output_data_positions import output_data_positions
+
+
+class InputDataPositions(BaseModel):
+    bbox: list = Field(
+        input_data_positions.bbox,
+        description="List of bounding box coordinate positions in the input (numpy array)."
+        + "Coordinates are in the format x,y,w,h by default.",
+    )
+    object_id: int = Field(
+        input_data_positions.object_id,
+        description="Position of the ID assigned by the tracker to each item in the input (numpy array)",
+    )
+    category: int = Field(
+        input_data_positions.category,
+        description="Position of the category assigned to each detected object in the input (numpy array)",
+    )
+    confidence: int = Field(
+        input_data_positions.confidence,
+        description="Position of the confidence score (range [0, 1]) for each"
+        + "detected object in the input (numpy array)",
+    )
+
+
+class OutputDataPositions(BaseModel):
+    frame_id: int = Field(
+        output_data_positions.frame_id,
+        description="Position of the frame id in the output (numpy array)",
+    )
+    object_id: int = Field(
+        output_data_positions.object_id,
+        description="Position of the ID assigned by the reid processor to each item in the output (numpy array)",
+    )
+    category: int = Field(
+        output_data_positions.category,
+        description="Position of the category assigned to each detected object in the output (numpy array)",
+    )
+    bbox: list = Field(
+        output_data_positions.bbox,
+        description="List of bounding box coordinate positions in the output (numpy array)."
+        + "Coordinates are in the format x,y,w,h by default.",
+    )
+    confidence: int = Field(
+        output_data_positions.confidence,
+        description="Position of the confidence score (range [0, 1]) for each"
+        + " detected object in the output (numpy array)",
+    )
+    mean_confidence: int = Field(
+        output_data_positions.mean_confidence,
+        description="Position of the mean confidence score over object life time (range [0, 1]) for each"
+        + " tracked object in the output (numpy array)",
+    )
+    tracker_id: int = Field(
+        output_data_positions.tracker_id,
+        description="Position of the id assigned to the tracker to each object (prior re-identification).",
+    )
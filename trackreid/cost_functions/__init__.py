@@ -1 +1,5 @@
 from .bounding_box_distance import bounding_box_distance  # noqa: F401
+from .predicted_bounding_box_distance import (  # noqa: F401
+    predicted_bounding_box_distance,
+    predicted_bounding_box_distance_batched,
+)
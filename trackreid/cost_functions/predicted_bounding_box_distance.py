@@ -0,0 +1,73 @@
+from typing import List
+
+import numpy as np
+
+from trackreid.tracked_object import TrackedObject
+from trackreid.utils import batched
+
+
+def predicted_bounding_box_distance(candidate: TrackedObject, switcher: TrackedObject) -> float:
+    """
+    Calculates the Euclidean distance between the center of the bounding box of a candidate and the center of
+    the bounding box of a switcher, extrapolated with its motion model at the frame where the candidate was last seen.
+    Unlike bounding_box_distance, the switcher position is not frozen at the moment it was lost, which allows
+    for tighter cost thresholds over long rematching windows.
+
+    Switchers without motion model (see the velocity_smoothing parameter of the ReidProcessor) are compared
+    with their last seen bounding box.
+
+    Args:
+        candidate (TrackedObject): The first TrackedObject.
+        switcher (TrackedObject): The second TrackedObject.
+
+    Returns:
+        float: The Euclidean distance between the centers of the candidate and predicted switcher bounding boxes.
+    """
+    bbox1 = candidate.metadata.bbox
+    bbox2 = switcher.metadata.predict_bbox(candidate.metadata.last_frame_id)
+
+    # Calculate the Euclidean distance between the centers of the bounding boxes
+    center1 = ((bbox1[0] + bbox1[2]) / 2, (bbox1[1] + bbox1[3]) / 2)
+    center2 = ((bbox2[0] + bbox2[2]) / 2, (bbox2[1] + bbox2[3]) / 2)
+    distance = np.sqrt((center1[0] - center2[0]) ** 2 + (center1[1] - center2[1]) ** 2)
+
+    return distance
+
+
+@batched
+def predicted_bounding_box_distance_batched(
+    candidates: List[TrackedObject], switchers: List[TrackedObject]
+) -> np.ndarray:
+    """
+    Batched version of predicted_bounding_box_distance, extrapolating every switcher at the frame where each
+    candidate was last seen and computing all the center distances at once.
+
+    Args:
+        candidates (List[TrackedObject]): The M candidates.
+        switchers (List[TrackedObject]): The N switchers.
+
+    Returns:
+        np.ndarray: A [N, M] array of distances between switchers (rows) and candidates (columns).
+    """
+    candidates_bbox = np.array([candidate.metadata.bbox for candidate in candidates], dtype=float)
+    candidates_frame_ids = np.array([candidate.metadata.last_frame_id for candidate in candidates])
+
+    switchers_bbox = np.array([switcher.metadata.bbox for switcher in switchers], dtype=float)
+    switchers_frame_ids = np.array([switcher.metadata.last_frame_id for switcher in switchers])
+    switchers_velocity = np.array(
+        [
+            np.zeros(4) if switcher.metadata.velocity is None else switcher.metadata.velocity
+            for switcher in switchers
+        ]
+    )
+
+    # [N, M] number of frames to extrapolate each switcher for each candidate
+    elapsed_frames = np.maximum(candidates_frame_ids[None, :] - switchers_frame_ids[:, None], 0)
+    predicted_bbox = (
+        switchers_bbox[:, None, :] + switchers_velocity[:, None, :] * elapsed_frames[:, :, None]
+    )
+
+    candidates_center = (candidates_bbox[:, :2] + candidates_bbox[:, 2:]) / 2
+    predicted_center = (predicted_bbox[..., :2] + predicted_bbox[..., 2:]) / 2
+
+    return np.linalg.norm(predicted_center - candidates_center[None, :, :], axis=-1)
@@ -0,0 +1,337 @@
+"""
+MOT identity metrics of corrected outputs against ground truth, to tune the parameters of a ReidProcessor over long
+sequences.
+
+Predictions are outputs of ReidProcessor.update concatenated over frames, in the OutputDataPositions layout, as
+float arrays or structured arrays. Raw tracker logs can be evaluated as well after conversion with
+tracker_log_to_predictions, to measure the impact of re-identification. Ground truth is an array with one row per
+object and frame, and the columns frame_id, object_id, followed by the bounding box in the same format as the
+predictions.
+
+The intersection over union of all the pairs of predicted and ground truth boxes of the same frames is computed
+in a single vectorized pass. Predictions are then matched with ground truth frame by frame as in the CLEAR MOT
+metrics: pairs matched in the previous frame are kept if their overlap is above the threshold, and the remaining
+objects are matched optimally, maximizing the number of matches and then their overlaps. Identity bookkeeping
+(switches, fragmentations, tracked ratios) uses arrays indexed by dense object indexes, and the global identity
+matching of IDF1 is solved once, on the number of frames each pair of ids overlaps.
+
+Example:
+    metrics = evaluate(np.concatenate(reid_outputs), ground_truth, iou_threshold=0.5)
+    print(metrics["idf1"], metrics["id_switches"])
+"""
+from typing import Dict, Tuple
+
+import numpy as np
+
+from trackreid.configs.input_data_positions import input_data_positions
+from trackreid.configs.output_data_positions import output_data_positions
+from trackreid.solvers import jv_solver
+from trackreid.utils import get_nb_output_cols
+
+BBOX_FORMATS = ("xyxy", "xywh")
+# ratios of frames matched above or below which a ground truth object is mostly tracked or mostly lost
+MOSTLY_TRACKED_RATIO = 0.8
+MOSTLY_LOST_RATIO = 0.2
+
+
+def compute_iou(
+    boxes: np.ndarray, other_boxes: np.ndarray, bbox_format: str = "xyxy"
+) -> np.ndarray:
+    """
+    Computes the intersection over union of pairs of boxes, element-wise.
+
+    Args:
+        boxes (np.ndarray): A [N, 4] array of boxes.
+        other_boxes (np.ndarray): A [N, 4] array of boxes.
+        bbox_format (str, optional): "xyxy" for (x1, y1, x2, y2) boxes or "xywh" for (x, y, width, height)
+            boxes. Defaults to "xyxy".
+
+    Returns:
+        np.ndarray: The [N] intersections over union.
+    """
+    if bbox_format not in BBOX_FORMATS:
+        raise ValueError(f"Unknown bbox format {bbox_format}, use one of {BBOX_FORMATS}.")
+    boxes, other_boxes = np.asarray(boxes, dtype=float), np.asarray(other_boxes, dtype=float)
+    if bbox_format == "xywh":
+        boxes = np.concatenate([boxes[:, :2], boxes[:, :2] + boxes[:, 2:]], axis=1)
+        other_boxes = np.concatenate(
+            [other_boxes[:, :2], other_boxes[:, :2] + other_boxes[:, 2:]], axis=1
+        )
+
+    widths = np.minimum(boxes[:, 2], other_boxes[:, 2]) - np.maximum(boxes[:, 0], other_boxes[:, 0])
+    heights = np.minimum(boxes[:, 3], other_boxes[:, 3]) - np.maximum(
+        boxes[:, 1], other_boxes[:, 1]
+    )
+    intersections = np.clip(widths, 0, None) * np.clip(heights, 0, None)
+    areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
+    other_areas = (other_boxes[:, 2] - other_boxes[:, 0]) * (other_boxes[:, 3] - other_boxes[:, 1])
+    unions = areas + other_areas - intersections
+    return np.divide(intersections, unions, out=np.zeros_like(unions), where=unions > 0)
+
+
+def tracker_log_to_predictions(tracker_log: np.ndarray) -> np.ndarray:
+    """
+    Converts a tracker log, whose first column is the frame id followed by the columns of the tracker output, to
+    predictions in the OutputDataPositions layout, with tracker ids as object ids, so that the raw tracker output
+    can be evaluated like corrected outputs.
+
+    Args:
+        tracker_log (np.ndarray): The tracker log, with one row per detection.
+
+    Returns:
+        np.ndarray: The predictions.
+    """
+    tracker_outputs = tracker_log[:, 1:]
+    predictions = np.zeros((len(tracker_log), get_nb_output_cols(output_data_positions)))
+    predictions[:, output_data_positions.frame_id] = tracker_log[:, 0]
+    predictions[:, output_data_positions.object_id] = tracker_outputs[
+        :, input_data_positions.object_id
+    ]
+    predictions[:, output_data_positions.tracker_id] = tracker_outputs[
+        :, input_data_positions.object_id
+    ]
+    predictions[:, output_data_positions.category] = tracker_outputs[
+        :, input_data_positions.category
+    ]
+    predictions[:, output_data_positions.bbox] = tracker_outputs[:, input_data_positions.bbox]
+    predictions[:, output_data_positions.confidence] = tracker_outputs[
+        :, input_data_positions.confidence
+    ]
+    predictions[:, output_data_positions.mean_confidence] = tracker_outputs[
+        :, input_data_positions.confidence
+    ]
+    return predictions
+
+
+def _get_prediction_columns(predictions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns the frame ids, object ids and boxes of predictions, as float or structured arrays.
+    """
+    if predictions.dtype.names is not None:
+        return predictions["frame_id"], predictions["object_id"], predictions["bbox"]
+    if not predictions.size:
+        return np.zeros(0), np.zeros(0), np.zeros((0, 4))
+    return (
+        predictions[:, output_data_positions.frame_id],
+        predictions[:, output_data_positions.object_id],
+        predictions[:, output_data_positions.bbox],
+    )
+
+
+def _get_frame_pairs(
+    frame_ids: np.ndarray, other_frame_ids: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Lists all the pairs of rows of two arrays sorted by frame id that belong to the same frame.
+
+    Args:
+        frame_ids (np.ndarray): The sorted frame ids of the first array.
+        other_frame_ids (np.ndarray): The sorted frame ids of the second array.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The row of each pair in both arrays, and the start of the
+        pairs of each row of the first array.
+    """
+    starts = np.searchsorted(other_frame_ids, frame_ids, side="left")
+    ends = np.searchsorted(other_frame_ids, frame_ids, side="right")
+    counts = ends - starts
+    rows = np.repeat(np.arange(len(frame_ids)), counts)
+    pair_starts = np.concatenate([[0], np.cumsum(counts)])
+    other_rows = np.arange(counts.sum()) - np.repeat(pair_starts[:-1] - starts, counts)
+    return rows, other_rows, pair_starts
+
+
+def evaluate(
+    predictions: np.ndarray,
+    ground_truth: np.ndarray,
+    iou_threshold: float = 0.5,
+    bbox_format: str = "xyxy",
+) -> Dict[str, float]:
+    """
+    Computes the CLEAR MOT and identity metrics of predictions against ground truth, see the module documentation.
+
+    Args:
+        predictions (np.ndarray): The predictions, in the OutputDataPositions layout, as a float or structured
+            array.
+        ground_truth (np.ndarray): The ground truth, with columns frame_id, object_id and the 4 coordinates of
+            the bounding box.
+        iou_threshold (float, optional): The minimal intersection over union of a match. Defaults to 0.5.
+        bbox_format (str, optional): The format of the boxes of both predictions and ground truth, "xyxy" or
+            "xywh". Defaults to "xyxy".
+
+    Returns:
+        Dict[str, float]: The metrics:
+            - idf1, idp, idr: The identity F1 score, precision and recall.
+            - mota: The multiple object tracking accuracy, 1 - (false negatives + false positives + id switches)
+            / ground truth objects.
+            - motp: The mean intersection over union of the matches.
+            - id_switches: The number of times a ground truth object is matched with another predicted id than
+            in its previous match.
+            - fragmentations: The number of times the matching of a ground truth object is interrupted and
+            resumed.
+            - matches, false_positives, false_negatives: The numbers of matched, unmatched predicted and
+            unmatched ground truth rows.
+            - mostly_tracked, mostly_lost: The numbers of ground truth objects matched in at least 80%, or at
+            most 20%, of their frames.
+            - nb_ground_truth, nb_predictions: The numbers of ground truth and predicted rows.
+            - nb_ground_truth_ids, nb_predicted_ids: The numbers of ground truth and predicted objects.
+    """
+    predicted_frame_ids, predicted_ids, predicted_boxes = _get_prediction_columns(predictions)
+    ground_truth = np.asarray(ground_truth, dtype=float).reshape(-1, 6)
+    gt_frame_ids, gt_ids, gt_boxes = ground_truth[:, 0], ground_truth[:, 1], ground_truth[:, 2:6]
+
+    predicted_order = np.argsort(predicted_frame_ids, kind="stable")
+    predicted_frame_ids = np.asarray(predicted_frame_ids, dtype=float)[predicted_order]
+    predicted_boxes = np.asarray(predicted_boxes, dtype=float)[predicted_order]
+    unique_predicted_ids, predicted_indexes = np.unique(
+        np.asarray(predicted_ids)[predicted_order], return_inverse=True
+    )
+    gt_order = np.argsort(gt_frame_ids, kind="stable")
+    gt_frame_ids, gt_boxes = gt_frame_ids[gt_order], gt_boxes[gt_order]
+    unique_gt_ids, gt_indexes = np.unique(gt_ids[gt_order], return_inverse=True)
+
+    # intersection over union of all the pairs of rows of the same frame, in a single pass
+    gt_rows, predicted_rows, pair_starts = _get_frame_pairs(gt_frame_ids, predicted_frame_ids)
+    ious = compute_iou(gt_boxes[gt_rows], predicted_boxes[predicted_rows], bbox_format=bbox_format)
+    overlapping = ious >= iou_threshold
+
+    counts, matched_counts = _match_frames(
+        gt_frame_ids=gt_frame_ids,
+        gt_indexes=gt_indexes,
+        predicted_frame_ids=predicted_frame_ids,
+        predicted_indexes=predicted_indexes,
+        pair_starts=pair_starts,
+        ious=np.where(overlapping, ious, 0.0),
+        nb_gt_ids=len(unique_gt_ids),
+    )
+
+    # global identity matching, maximizing the number of frames each pair of ids overlaps
+    pair_keys = (
+        gt_indexes[gt_rows[overlapping]] * len(unique_predicted_ids)
+        + predicted_indexes[predicted_rows[overlapping]]
+    )
+    overlap_counts = np.bincount(
+        pair_keys, minlength=len(unique_gt_ids) * len(unique_predicted_ids)
+    ).reshape(len(unique_gt_ids), len(unique_predicted_ids))
+    id_true_positives = 0
+    if overlap_counts.size:
+        rows, columns = jv_solver(-overlap_counts.astype(float), 0.0)
+        id_true_positives = int(overlap_counts[rows, columns].sum())
+
+    nb_ground_truth, nb_predictions = len(gt_frame_ids), len(predicted_frame_ids)
+    gt_frame_counts = np.bincount(gt_indexes, minlength=len(unique_gt_ids))
+    tracked_ratios = matched_counts / np.maximum(gt_frame_counts, 1)
+    nb_matches = counts["matches"]
+    false_negatives = nb_ground_truth - nb_matches
+    false_positives = nb_predictions - nb_matches
+    return {
+        "idf1": _safe_ratio(2 * id_true_positives, nb_ground_truth + nb_predictions),
+        "idp": _safe_ratio(id_true_positives, nb_predictions),
+        "idr": _safe_ratio(id_true_positives, nb_ground_truth),
+        "mota": 1.0
+        - _safe_ratio(false_negatives + false_positives + counts["id_switches"], nb_ground_truth),
+        "motp": _safe_ratio(counts["iou_sum"], nb_matches),
+        "id_switches": counts["id_switches"],
+        "fragmentations": counts["fragmentations"],
+        "matches": nb_matches,
+        "false_positives": false_positives,
+        "false_negatives": false_negatives,
+        "mostly_tracked": int(np.sum(tracked_ratios >= MOSTLY_TRACKED_RATIO)),
+        "mostly_lost": int(np.sum(tracked_ratios <= MOSTLY_LOST_RATIO)),
+        "nb_ground_truth": nb_ground_truth,
+        "nb_predictions": nb_predictions,
+        "nb_ground_truth_ids": len(unique_gt_ids),
+        "nb_predicted_ids": len(unique_predicted_ids),
+    }
+
+
+def _match_frames(
+    gt_frame_ids: np.ndarray,
+    gt_indexes: np.ndarray,
+    predicted_frame_ids: np.ndarray,
+    predicted_indexes: np.ndarray,
+    pair_starts: np.ndarray,
+    ious: np.ndarray,
+    nb_gt_ids: int,
+) -> Tuple[Dict[str, float], np.ndarray]:
+    """
+    Matches predictions with ground truth frame by frame, keeping the matches of the previous frame whose overlap
+    is still above the threshold, and counts matches, id switches and fragmentations.
+
+    Args:
+        gt_frame_ids (np.ndarray): The sorted frame ids of the ground truth rows.
+        gt_indexes (np.ndarray): The dense index of the object of each ground truth row.
+        predicted_frame_ids (np.ndarray): The sorted frame ids of the predicted rows.
+        predicted_indexes (np.ndarray): The dense index of the object of each predicted row.
+        pair_starts (np.ndarray): The start of the pairs of each ground truth row, see _get_frame_pairs.
+        ious (np.ndarray): The intersection over union of each pair, 0 below the threshold.
+        nb_gt_ids (int): The number of ground truth objects.
+
+    Returns:
+        Tuple[Dict[str, float], np.ndarray]: The counts of matches, id switches and fragmentations and the sum of
+        the matched ious, and the number of matched frames of each ground truth object.
+    """
+    last_predicted_index = np.full(nb_gt_ids, -1)
+    tracked_at_last_appearance = np.zeros(nb_gt_ids, dtype=bool)
+    matched_counts = np.zeros(nb_gt_ids, dtype=int)
+    counts = {"matches": 0, "id_switches": 0, "fragmentations": 0, "iou_sum": 0.0}
+
+    frame_ids, frame_starts = np.unique(gt_frame_ids, return_index=True)
+    frame_ends = np.append(frame_starts[1:], len(gt_frame_ids))
+    predicted_starts = np.searchsorted(predicted_frame_ids, frame_ids, side="left")
+    predicted_ends = np.searchsorted(predicted_frame_ids, frame_ids, side="right")
+    for gt_start, gt_end, predicted_start, predicted_end in zip(
+        frame_starts, frame_ends, predicted_starts, predicted_ends
+    ):
+        frame_gt_indexes = gt_indexes[gt_start:gt_end]
+        if predicted_end == predicted_start:
+            tracked_at_last_appearance[frame_gt_indexes] = False
+            continue
+        frame_predicted_indexes = predicted_indexes[predicted_start:predicted_end]
+        # pairs of the frame are stored row by row, with all the predictions of the frame for each row
+        frame_ious = ious[pair_starts[gt_start] : pair_starts[gt_end]].reshape(
+            gt_end - gt_start, predicted_end - predicted_start
+        )
+
+        # matches of the previous frames are kept while they overlap enough
+        kept = (
+            frame_predicted_indexes[None, :] == last_predicted_index[frame_gt_indexes][:, None]
+        ) & (frame_ious > 0)
+        kept_rows, kept_columns = np.nonzero(kept)
+        # a prediction kept for several ground truth objects is only kept for the first one, the others are
+        # matched again with the remaining predictions
+        _, first_kept = np.unique(kept_columns, return_index=True)
+        kept_rows, kept_columns = kept_rows[first_kept], kept_columns[first_kept]
+        free_rows = np.setdiff1d(np.arange(len(frame_gt_indexes)), kept_rows)
+        free_columns = np.setdiff1d(np.arange(len(frame_predicted_indexes)), kept_columns)
+        costs = np.where(frame_ious[np.ix_(free_rows, free_columns)] > 0, 0.0, 2.0)
+        costs -= frame_ious[np.ix_(free_rows, free_columns)]
+        # overlapping pairs cost -iou and others 2, above the cost limit, so that as many pairs as possible are
+        # matched, with the largest overlaps
+        new_rows, new_columns = (
+            jv_solver(costs, 1.0) if costs.size else (kept_rows[:0], kept_rows[:0])
+        )
+        rows = np.concatenate([kept_rows, free_rows[new_rows]])
+        columns = np.concatenate([kept_columns, free_columns[new_columns]])
+
+        matched_gt_indexes = frame_gt_indexes[rows]
+        matched_predicted_indexes = frame_predicted_indexes[columns]
+        previous = last_predicted_index[matched_gt_indexes]
+        counts["id_switches"] += int(
+            np.sum((previous >= 0) & (previous != matched_predicted_indexes))
+        )
+        counts["fragmentations"] += int(
+            np.sum((previous >= 0) & ~tracked_at_last_appearance[matched_gt_indexes])
+        )
+        counts["matches"] += len(rows)
+        counts["iou_sum"] += float(frame_ious[rows, columns].sum())
+        matched_counts[matched_gt_indexes] += 1
+        last_predicted_index[matched_gt_indexes] = matched_predicted_indexes
+        tracked_at_last_appearance[frame_gt_indexes] = False
+        tracked_at_last_appearance[matched_gt_indexes] = True
+
+    return counts, matched_counts
+
+
+def _safe_ratio(numerator: float, denominator: float) -> float:
+    return float(numerator) / denominator if denominator else 0.0
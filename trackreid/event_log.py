@@ -0,0 +1,251 @@
+"""
+Compact binary log of the lifecycle events of tracked objects.
+
+When a ReidProcessor is given an EventLog, each event of the reid process is appended to a memory-mapped file as
+a fixed-size record of 40 bytes, written with a single struct.pack_into:
+
+| field          | type    | content                                                                      |
+|----------------|---------|------------------------------------------------------------------------------|
+| frame_id       | int64   | The frame of the event.                                                      |
+| event_type     | uint8   | See EventTypes.                                                              |
+| previous_state | int8    | The state of the object before a state transition, NO_STATE otherwise.      |
+| state          | int8    | The state of the object after a state transition or creation, else NO_STATE. |
+| object_id      | float64 | The object id of the object, i.e. the first tracker id of its re-id chain.   |
+| tracker_id     | float64 | The last tracker id of the object, or the object id of the object split off  |
+|                |         | by a cut or absorbed by a merge.                                             |
+| cost           | float64 | The assignment cost of a merge, NaN otherwise.                               |
+
+The file starts with a 16 bytes header, and is grown by doubling its capacity. Unused capacity is zeroed, so that
+the records of a log whose process was killed before closing it end at the first record with event type 0. Opening
+an existing log appends to it.
+
+read_events maps a log as a structured numpy array, and filters its records by object, tracker id, frame range or
+event type, so that the history of a re-id decision can be inspected without replaying or snapshotting the
+processor.
+
+Example:
+    with EventLog("events.bin") as event_log:
+        reid_processor = ReidProcessor(..., event_log=event_log)
+        ...
+
+    events = read_events("events.bin", object_ids=[12], frame_range=(100, 200))
+"""
+import mmap
+import struct
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
+
+import numpy as np
+
+from trackreid.tracked_object import TrackedObject
+
+
+@dataclass(frozen=True)
+class EventTypes:
+    NEW: int = 1
+    FILTER: int = 2
+    STATE: int = 3
+    CUT: int = 4
+    MERGE: int = 5
+
+
+event_types = EventTypes()
+
+EVENT_NAMES = {getattr(event_types, field.name): field.name for field in fields(EventTypes)}
+
+# state of the records that are not state transitions
+NO_STATE = -128
+
+MAGIC = b"TRIDEVT1"
+HEADER = struct.Struct("<8sI4x")
+RECORD = struct.Struct("<qBbb5xddd")
+RECORD_DTYPE = np.dtype(
+    {
+        "names": [
+            "frame_id",
+            "event_type",
+            "previous_state",
+            "state",
+            "object_id",
+            "tracker_id",
+            "cost",
+        ],
+        "formats": [np.int64, np.uint8, np.int8, np.int8, np.float64, np.float64, np.float64],
+        "offsets": [0, 8, 9, 10, 16, 24, 32],
+        "itemsize": RECORD.size,
+    }
+)
+
+
+class EventLog:
+    """
+    Append-only, memory-mapped log of the lifecycle events of tracked objects, see the module documentation.
+
+    Events are recorded for the frame_id attribute, set by ReidProcessor.update at the start of each frame.
+
+    Args:
+        file_path (Union[str, Path]): The path of the log, appended to if it exists.
+        capacity (int, optional): The initial number of records of the file, doubled when full.
+            Defaults to 4096.
+    """
+
+    def __init__(self, file_path: Union[str, Path], capacity: int = 4096) -> None:
+        self.file_path = Path(file_path)
+        self.frame_id = 0
+
+        if self.file_path.exists() and self.file_path.stat().st_size:
+            self._file = self.file_path.open("r+b")
+            magic, record_size = HEADER.unpack(self._file.read(HEADER.size))
+            if magic != MAGIC or record_size != RECORD.size:
+                self._file.close()
+                raise ValueError(f"{self.file_path} is not an event log.")
+            nb_records = count_records(self.file_path)
+        else:
+            self._file = self.file_path.open("w+b")
+            self._file.write(HEADER.pack(MAGIC, RECORD.size))
+            nb_records = 0
+
+        self._offset = HEADER.size + nb_records * RECORD.size
+        self._size = max(self._offset + capacity * RECORD.size, self.file_path.stat().st_size)
+        self._file.truncate(self._size)
+        self._mmap = mmap.mmap(self._file.fileno(), self._size)
+
+    def __len__(self) -> int:
+        return (self._offset - HEADER.size) // RECORD.size
+
+    def record(
+        self,
+        event_type: int,
+        object_id: float,
+        tracker_id: float,
+        previous_state: int = NO_STATE,
+        state: int = NO_STATE,
+        cost: float = float("nan"),
+    ) -> None:
+        """
+        Appends a record for the current frame.
+        """
+        if self._offset + RECORD.size > self._size:
+            self._grow()
+        RECORD.pack_into(
+            self._mmap,
+            self._offset,
+            self.frame_id,
+            event_type,
+            previous_state,
+            state,
+            object_id,
+            tracker_id,
+            cost,
+        )
+        self._offset += RECORD.size
+
+    def record_transition(
+        self,
+        tracked_object: TrackedObject,
+        previous_state: int,
+        state: int,
+        event_type: int = event_types.STATE,
+    ) -> None:
+        """
+        Appends a state transition of a tracked object, unless its state is unchanged.
+        """
+        if previous_state != state:
+            self.record(
+                event_type,
+                tracked_object.object_id,
+                tracked_object.tracker_id,
+                previous_state=previous_state,
+                state=state,
+            )
+
+    def _grow(self) -> None:
+        self._mmap.close()
+        self._size = HEADER.size + 2 * (self._size - HEADER.size)
+        self._file.truncate(self._size)
+        self._mmap = mmap.mmap(self._file.fileno(), self._size)
+
+    def flush(self) -> None:
+        """
+        Flushes the records to the file.
+        """
+        self._mmap.flush()
+
+    def close(self) -> None:
+        """
+        Flushes the records, and truncates the file to them.
+        """
+        if self._file.closed:
+            return
+        self._mmap.flush()
+        self._mmap.close()
+        self._file.truncate(self._offset)
+        self._file.close()
+
+    def __enter__(self) -> "EventLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _map_records(file_path: Union[str, Path]) -> np.ndarray:
+    """
+    Maps the records of a log, including its unused capacity, as a read-only structured array.
+    """
+    nb_slots = (Path(file_path).stat().st_size - HEADER.size) // RECORD.size
+    if nb_slots <= 0:
+        return np.zeros(0, dtype=RECORD_DTYPE)
+    return np.memmap(file_path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(nb_slots,))
+
+
+def count_records(file_path: Union[str, Path]) -> int:
+    """
+    Counts the records of a log, which end at its first record with event type 0.
+    """
+    records = _map_records(file_path)
+    unused = np.flatnonzero(records["event_type"] == 0)
+    return int(unused[0]) if len(unused) else len(records)
+
+
+def read_events(
+    file_path: Union[str, Path],
+    object_ids: Optional[Iterable[float]] = None,
+    tracker_ids: Optional[Iterable[float]] = None,
+    frame_range: Optional[Tuple[int, int]] = None,
+    event_types: Optional[Iterable[int]] = None,
+) -> np.ndarray:
+    """
+    Reads the records of a log, optionally filtered. Filters are combined with a logical and.
+
+    Args:
+        file_path (Union[str, Path]): The path of the log.
+        object_ids (Optional[Iterable[float]], optional): Keeps the records of these object ids.
+            Defaults to None.
+        tracker_ids (Optional[Iterable[float]], optional): Keeps the records with these tracker ids, including
+            the cuts and merges of these objects. Defaults to None.
+        frame_range (Optional[Tuple[int, int]], optional): Keeps the records of the frames in this inclusive
+            range. Defaults to None.
+        event_types (Optional[Iterable[int]], optional): Keeps the records of these event types, see
+            EventTypes. Defaults to None.
+
+    Returns:
+        np.ndarray: The records, as a structured array of dtype RECORD_DTYPE, memory-mapped if not filtered.
+    """
+    records = _map_records(file_path)
+    records = records[: count_records(file_path)]
+    if object_ids is None and tracker_ids is None and frame_range is None and event_types is None:
+        return records
+
+    mask = np.ones(len(records), dtype=bool)
+    if object_ids is not None:
+        mask &= np.isin(records["object_id"], list(object_ids))
+    if tracker_ids is not None:
+        mask &= np.isin(records["tracker_id"], list(tracker_ids))
+    if frame_range is not None:
+        frame_ids = records["frame_id"]
+        mask &= (frame_ids >= frame_range[0]) & (frame_ids <= frame_range[1])
+    if event_types is not None:
+        mask &= np.isin(records["event_type"], list(event_types))
+    return np.asarray(records[mask])
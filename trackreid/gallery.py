@@ -0,0 +1,534 @@
+"""
+Cross-camera re-identification through a gallery shared by several ReidProcessor instances.
+
+Each ReidProcessor only matches candidates against its own switchers. On multi-camera sites, objects leaving a
+camera usually enter another one: the SharedGallery lets the processors of every camera, possibly running in
+different processes, publish their lost objects (switchers) and query their new objects (candidates) against the
+lost objects of the other cameras.
+
+The gallery is a fixed-size table in shared memory, partitioned by camera. Each camera only writes to its own
+partition, so writes need no lock, and every slot is protected by a sequence counter (seqlock): a writer makes the
+counter odd while it updates the slot, and readers copy the table without locking, then retry the slots whose
+counter was odd or changed during the copy.
+
+Objects are identified across cameras by global ids. An object first seen by camera c gets the global id
+c * GLOBAL_ID_STRIDE + object_id, and an object matched to a gallery entry inherits the global id of the entry,
+so global ids stay consistent without any central process.
+
+When a candidate is matched, the camera records a claim on the entry in its own partition of claims, and claimed
+entries are skipped by later queries. The owner of the entry then removes it, and never publishes the object again.
+A claim is only released once its entry has been removed, so each partition of claims has room for every entry of
+the gallery. Claims are arbitrated by a short lock on the entry, a POSIX record lock on its bytes of the shared
+memory, under which a claim only succeeds if no other camera holds one: when two cameras match the same entry at
+the same instant, the first claim wins and the other camera leaves its candidate unmatched.
+
+Example:
+    gallery = SharedGallery.create(name="site", nb_cameras=2, slots_per_camera=256)
+    topology = CameraTopology({(0, 1): (2.0, 30.0)})  # from camera 0 to camera 1 in 2 to 30 seconds
+    client = GalleryClient(gallery, camera_index=1, topology=topology)
+
+    for frame_id, tracker_output in frames:
+        reid_processor.update(tracker_output, frame_id)
+        client.publish(reid_processor, time=timestamp)
+        client.match_candidates(reid_processor, time=timestamp)
+        global_ids = client.get_global_ids(output[:, output_data_positions.object_id])
+"""
+import fcntl
+import threading
+from multiprocessing import shared_memory
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from trackreid.configs.reid_constants import reid_constants
+from trackreid.reid_processor import ReidProcessor
+from trackreid.solvers import jv_solver
+from trackreid.tracked_object import TrackedObject
+from trackreid.utils import filter_objects_by_state
+
+GLOBAL_ID_STRIDE = 2**40
+HEADER_SIZE = 64
+MAX_READ_ATTEMPTS = 100
+
+# record locks are held per process, so the claims of the threads of a process are also serialized
+_CLAIM_LOCK = threading.Lock()
+
+
+def make_global_id(camera_index: int, object_id: float) -> int:
+    """
+    Builds the global id of an object first seen by a camera.
+
+    Args:
+        camera_index (int): The index of the camera.
+        object_id (float): The object id given by the ReidProcessor of the camera.
+
+    Returns:
+        int: The global id.
+    """
+    return camera_index * GLOBAL_ID_STRIDE + int(object_id)
+
+
+def get_entry_dtype(embedding_dim: int) -> np.dtype:
+    """
+    Returns the dtype of a gallery entry, with an embedding of the given dimension.
+    """
+    return np.dtype(
+        [
+            ("sequence", "u8"),
+            ("active", "u1"),
+            ("global_id", "i8"),
+            ("category", "i4"),
+            ("lost_time", "f8"),
+            ("bbox", "f4", (4,)),
+            ("mean_confidence", "f4"),
+            ("embedding", "f4", (embedding_dim,)),
+        ]
+    )
+
+
+CLAIM_DTYPE = np.dtype([("sequence", "u8"), ("active", "u1"), ("global_id", "i8"), ("time", "f8")])
+
+
+class CameraTopology:
+    """
+    Allowed transitions between cameras, with their minimum and maximum transit times.
+
+    Args:
+        transitions (Dict[Tuple[int, int], Tuple[float, float]]): The (min, max) transit time from a camera to
+            another, by (source camera index, destination camera index). Missing transitions are not allowed.
+    """
+
+    def __init__(self, transitions: Dict[Tuple[int, int], Tuple[float, float]]) -> None:
+        self.transitions = dict(transitions)
+
+    def get_bounds(self, nb_cameras: int, destination: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the minimum and maximum transit times from every camera to the destination camera,
+        NaN for disallowed transitions.
+        """
+        min_transit = np.full(nb_cameras, np.nan)
+        max_transit = np.full(nb_cameras, np.nan)
+        for (source, target), (min_time, max_time) in self.transitions.items():
+            if target == destination and source < nb_cameras:
+                min_transit[source], max_transit[source] = min_time, max_time
+        return min_transit, max_transit
+
+
+class SharedGallery:
+    """
+    Table of lost objects published by several cameras, in shared memory. See the module documentation.
+
+    Use SharedGallery.create in one process, then SharedGallery.attach with the same name in the others.
+
+    Args:
+        shm (shared_memory.SharedMemory): The shared memory block.
+        owner (bool): Whether this instance created the block, and unlinks it on close.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool = False) -> None:
+        self.shm = shm
+        self.owner = owner
+        header = np.ndarray((3,), dtype=np.int64, buffer=shm.buf)
+        self.nb_cameras, self.slots_per_camera, self.embedding_dim = (
+            int(value) for value in header
+        )
+        self.entry_dtype = get_entry_dtype(self.embedding_dim)
+
+        nb_slots = self.nb_cameras * self.slots_per_camera
+        self.entries = np.ndarray(
+            (self.nb_cameras, self.slots_per_camera),
+            dtype=self.entry_dtype,
+            buffer=shm.buf,
+            offset=HEADER_SIZE,
+        )
+        # claims are released once their entry is removed, so a camera may hold a claim on every entry
+        self.claims = np.ndarray(
+            (self.nb_cameras, nb_slots),
+            dtype=CLAIM_DTYPE,
+            buffer=shm.buf,
+            offset=HEADER_SIZE + nb_slots * self.entry_dtype.itemsize,
+        )
+
+    @classmethod
+    def create(
+        cls, name: Optional[str], nb_cameras: int, slots_per_camera: int, embedding_dim: int = 0
+    ) -> "SharedGallery":
+        """
+        Creates a gallery in a new shared memory block.
+
+        Args:
+            name (Optional[str]): The name of the shared memory block, None for a random name.
+            nb_cameras (int): The number of cameras, indexed from 0.
+            slots_per_camera (int): The maximum number of lost objects published by each camera.
+            embedding_dim (int, optional): The dimension of the appearance embeddings, 0 for none. Defaults to 0.
+
+        Returns:
+            SharedGallery: The gallery, which unlinks the block on close.
+        """
+        nb_slots = nb_cameras * slots_per_camera
+        size = HEADER_SIZE + nb_slots * (
+            get_entry_dtype(embedding_dim).itemsize + nb_cameras * CLAIM_DTYPE.itemsize
+        )
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        np.ndarray((size,), dtype=np.uint8, buffer=shm.buf)[:] = 0
+        np.ndarray((3,), dtype=np.int64, buffer=shm.buf)[:] = [
+            nb_cameras,
+            slots_per_camera,
+            embedding_dim,
+        ]
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedGallery":
+        """
+        Attaches to a gallery created by another process.
+
+        Args:
+            name (str): The name of the shared memory block.
+
+        Returns:
+            SharedGallery: The gallery.
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def close(self) -> None:
+        """
+        Releases the views of the shared memory, and unlinks it if this instance created it.
+        """
+        del self.entries, self.claims
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    @staticmethod
+    def _write(table: np.ndarray, slot: int, **values) -> None:
+        """
+        Writes a slot of a single-writer partition under its sequence counter.
+        """
+        table["sequence"][slot] += 1
+        for field, value in values.items():
+            table[field][slot] = value
+        table["sequence"][slot] += 1
+
+    @staticmethod
+    def _read(table: np.ndarray) -> np.ndarray:
+        """
+        Reads a consistent copy of a table without locking: slots written during the copy are read again.
+        """
+        snapshot = table.copy()
+        for _ in range(MAX_READ_ATTEMPTS):
+            unstable = (snapshot["sequence"] % 2 == 1) | (snapshot["sequence"] != table["sequence"])
+            if not unstable.any():
+                return snapshot
+            snapshot[unstable] = table[unstable]
+        # slots still being written are considered empty
+        snapshot["active"][unstable] = 0
+        return snapshot
+
+    def publish(self, camera_index: int, slot: int, **values) -> None:
+        """
+        Writes an entry in a slot of the partition of a camera. Only the camera may write to its partition.
+
+        Args:
+            camera_index (int): The index of the camera.
+            slot (int): The slot in the partition of the camera.
+            **values: The fields of the entry, e.g. global_id, category, lost_time, bbox.
+        """
+        self._write(self.entries[camera_index], slot, active=1, **values)
+
+    def remove(self, camera_index: int, slot: int) -> None:
+        """
+        Removes the entry of a slot of the partition of a camera.
+        """
+        self._write(self.entries[camera_index], slot, active=0)
+
+    def claim(self, camera_index: int, slot: int, global_id: int, time: float) -> bool:
+        """
+        Records that a camera matched one of its candidates to the entry with the given global id, unless the
+        entry was removed or is already claimed, e.g. by another camera that matched it at the same time.
+
+        Args:
+            camera_index (int): The index of the claiming camera.
+            slot (int): A free slot in the partition of claims of the camera.
+            global_id (int): The global id of the matched entry.
+            time (float): The current time of the camera.
+
+        Returns:
+            bool: Whether the claim succeeded. Otherwise, the candidate should be left unmatched.
+        """
+        entries = self._read(self.entries)
+        positions = np.flatnonzero((entries["active"] == 1) & (entries["global_id"] == global_id))
+        if not len(positions):
+            return False
+
+        # lock a byte of the entry, taken by every claim of the entry
+        lock_offset = HEADER_SIZE + int(positions[0]) * self.entry_dtype.itemsize
+        with _CLAIM_LOCK:
+            fcntl.lockf(self.shm._fd, fcntl.LOCK_EX, 1, lock_offset)
+            try:
+                if global_id in self.claimed_global_ids():
+                    return False
+                self._write(
+                    self.claims[camera_index], slot, active=1, global_id=global_id, time=time
+                )
+                return True
+            finally:
+                fcntl.lockf(self.shm._fd, fcntl.LOCK_UN, 1, lock_offset)
+
+    def release_claims(self, camera_index: int) -> None:
+        """
+        Releases the claims of a camera whose entry has been removed by its owner, which no longer publishes
+        the object.
+        """
+        entries = self._read(self.entries)
+        published_global_ids = entries["global_id"][entries["active"] == 1]
+        claims = self.claims[camera_index]
+        for slot in np.flatnonzero(claims["active"] == 1):
+            if claims["global_id"][slot] not in published_global_ids:
+                self._write(claims, slot, active=0)
+
+    def claimed_global_ids(self) -> np.ndarray:
+        """
+        Returns the global ids claimed by any camera.
+        """
+        claims = self._read(self.claims)
+        return claims["global_id"][claims["active"] == 1]
+
+    def query(
+        self,
+        camera_index: int,
+        time: float,
+        categories: np.ndarray,
+        topology: CameraTopology,
+        embeddings: Optional[np.ndarray] = None,
+        max_distance: Optional[float] = None,
+    ) -> np.ndarray:
+        """
+        Matches a batch of candidates of a camera against the unclaimed entries published by the other cameras.
+
+        Entries are selected if they have the category of the candidate, and if the transition from their camera
+        is allowed by the topology, with a transit time between the minimum and maximum transit times. With
+        embeddings, the cost of a pair is the cosine distance of the embeddings, else all selected pairs have
+        the same cost. Candidates are then assigned to entries with the Jonker-Volgenant algorithm.
+
+        Args:
+            camera_index (int): The index of the camera of the candidates.
+            time (float): The current time of the camera, in the unit of the topology.
+            categories (np.ndarray): The category of each of the Q candidates.
+            topology (CameraTopology): The allowed transitions between cameras.
+            embeddings (Optional[np.ndarray], optional): The [Q, embedding_dim] embeddings of the candidates.
+                Defaults to None.
+            max_distance (Optional[float], optional): Maximum cosine distance of a match. Defaults to None.
+
+        Returns:
+            np.ndarray: The global id matched to each candidate, -1 if none.
+        """
+        categories = np.asarray(categories)
+        matched_global_ids = np.full(len(categories), -1, dtype=np.int64)
+        if not len(categories):
+            return matched_global_ids
+
+        entries = self._read(self.entries)
+        min_transit, max_transit = topology.get_bounds(self.nb_cameras, camera_index)
+        elapsed = time - entries["lost_time"]
+        valid = (
+            (entries["active"] == 1)
+            & (elapsed >= min_transit[:, None])
+            & (elapsed <= max_transit[:, None])
+        )
+        valid &= ~np.isin(entries["global_id"], self.claimed_global_ids())
+        entries = entries[valid]
+        if not len(entries):
+            return matched_global_ids
+
+        # rows are candidates, columns are entries
+        selection = categories[:, None] == entries["category"][None, :]
+        if embeddings is not None and self.embedding_dim:
+            candidate_embeddings = _normalize(np.asarray(embeddings, dtype=np.float32))
+            cost = 1 - candidate_embeddings @ _normalize(entries["embedding"]).T
+            if max_distance is not None:
+                selection &= cost <= max_distance
+        else:
+            cost = np.zeros(selection.shape)
+        cost = np.where(selection, cost, reid_constants.MATCHES.DISALLOWED_MATCH)
+
+        rows, columns = jv_solver(cost, reid_constants.MATCHES.DISALLOWED_MATCH - 0.1)
+        matched_global_ids[rows] = entries["global_id"][columns]
+        return matched_global_ids
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+class GalleryClient:
+    """
+    Connects the ReidProcessor of a camera to a SharedGallery: publishes its switchers, matches its candidates
+    against the lost objects of the other cameras, and maps its object ids to global ids.
+
+    Args:
+        gallery (SharedGallery): The shared gallery.
+        camera_index (int): The index of the camera, which owns the matching partition of the gallery.
+        topology (CameraTopology): The allowed transitions between cameras.
+        embedding_function (Optional[Callable], optional): Function returning the appearance embedding of a
+            TrackedObject, if the gallery stores embeddings. Defaults to None.
+        max_distance (Optional[float], optional): Maximum cosine distance of a match. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        gallery: SharedGallery,
+        camera_index: int,
+        topology: CameraTopology,
+        embedding_function: Optional[Callable[[TrackedObject], np.ndarray]] = None,
+        max_distance: Optional[float] = None,
+    ) -> None:
+        if not 0 <= camera_index < gallery.nb_cameras:
+            raise ValueError(
+                f"Camera index {camera_index} not in gallery of {gallery.nb_cameras} cameras."
+            )
+        self.gallery = gallery
+        self.camera_index = camera_index
+        self.topology = topology
+        self.embedding_function = embedding_function
+        self.max_distance = max_distance
+
+        self._global_ids: Dict[float, int] = {}
+        self._queried_objects: set = set()
+        self._published_slots: Dict[float, int] = {}
+        self._lost_times: Dict[float, float] = {}
+        self._claimed_objects: set = set()
+
+    def get_global_id(self, object_id: float) -> int:
+        """
+        Returns the global id of an object id of the camera.
+        """
+        global_id = self._global_ids.get(object_id)
+        if global_id is None:
+            return make_global_id(self.camera_index, object_id)
+        return global_id
+
+    def get_global_ids(self, object_ids: np.ndarray) -> np.ndarray:
+        """
+        Returns the global ids of object ids of the camera, e.g. the object id column of the processor output.
+        """
+        return np.array([self.get_global_id(object_id) for object_id in object_ids], dtype=np.int64)
+
+    def publish(self, reid_processor: ReidProcessor, time: float) -> None:
+        """
+        Publishes the switchers of the processor to the partition of the camera, and removes the entries of
+        objects that are no longer switchers. Objects claimed by another camera are removed and never published
+        again. If the partition is full, the most recently lost objects are kept.
+
+        Args:
+            reid_processor (ReidProcessor): The processor of the camera.
+            time (float): The current time of the camera. Objects are considered lost at the time they are
+                first published.
+        """
+        switchers = filter_objects_by_state(
+            reid_processor.all_tracked_objects, states=reid_constants.STATES.SWITCHER
+        )
+        switchers = {switcher.object_id: switcher for switcher in switchers}
+        for object_id in list(self._lost_times):
+            if object_id not in switchers:
+                del self._lost_times[object_id]
+        for object_id in switchers:
+            self._lost_times.setdefault(object_id, time)
+
+        claimed = set(self.gallery.claimed_global_ids().tolist())
+        self._claimed_objects.update(
+            object_id for object_id in switchers if self.get_global_id(object_id) in claimed
+        )
+        published = sorted(
+            (object_id for object_id in switchers if object_id not in self._claimed_objects),
+            key=self._lost_times.get,
+        )[-self.gallery.slots_per_camera :]
+
+        for object_id in set(self._published_slots) - set(published):
+            self.gallery.remove(self.camera_index, self._published_slots.pop(object_id))
+
+        free_slots = sorted(
+            set(range(self.gallery.slots_per_camera)) - set(self._published_slots.values())
+        )
+        for object_id in published:
+            if object_id in self._published_slots:
+                continue
+            switcher = switchers[object_id]
+            slot = free_slots.pop(0)
+            values = {
+                "global_id": self.get_global_id(object_id),
+                "category": switcher.category,
+                "lost_time": self._lost_times[object_id],
+                "bbox": switcher.bbox,
+                "mean_confidence": switcher.mean_confidence,
+            }
+            if self.embedding_function is not None:
+                values["embedding"] = self.embedding_function(switcher)
+            self.gallery.publish(self.camera_index, slot, **values)
+            self._published_slots[object_id] = slot
+
+    def match_candidates(
+        self, reid_processor: ReidProcessor, time: float
+    ) -> List[Tuple[float, int]]:
+        """
+        Matches the candidates of the processor that were not queried yet against the gallery, in a single
+        batched query. Matched candidates inherit the global id of their entry, which is claimed. Candidates whose
+        entry is claimed first by another camera are left unmatched.
+
+        Args:
+            reid_processor (ReidProcessor): The processor of the camera.
+            time (float): The current time of the camera.
+
+        Returns:
+            List[Tuple[float, int]]: The (object id, global id) of the matched candidates.
+        """
+        candidates = [
+            candidate
+            for candidate in filter_objects_by_state(
+                reid_processor.all_tracked_objects, states=reid_constants.STATES.CANDIDATE
+            )
+            if candidate.object_id not in self._queried_objects
+        ]
+        if not candidates:
+            return []
+        self._queried_objects.update(candidate.object_id for candidate in candidates)
+
+        embeddings = None
+        if self.embedding_function is not None:
+            embeddings = np.stack([self.embedding_function(candidate) for candidate in candidates])
+        global_ids = self.gallery.query(
+            camera_index=self.camera_index,
+            time=time,
+            categories=np.array([candidate.category for candidate in candidates]),
+            topology=self.topology,
+            embeddings=embeddings,
+            max_distance=self.max_distance,
+        )
+
+        matches = []
+        for candidate, global_id in zip(candidates, global_ids.tolist()):
+            if global_id < 0 or not self.gallery.claim(
+                self.camera_index, self._get_free_claim_slot(), global_id, time
+            ):
+                continue
+            self._global_ids[candidate.object_id] = global_id
+            matches.append((candidate.object_id, global_id))
+        return matches
+
+    def _get_free_claim_slot(self) -> int:
+        """
+        Returns a free slot in the partition of claims of the camera, releasing the claims whose entry was
+        removed if none is free. Active claims are never overwritten.
+        """
+        free_slots = np.flatnonzero(self.gallery.claims[self.camera_index]["active"] == 0)
+        if not len(free_slots):
+            self.gallery.release_claims(self.camera_index)
+            free_slots = np.flatnonzero(self.gallery.claims[self.camera_index]["active"] == 0)
+        if not len(free_slots):
+            raise RuntimeError(f"No free claim slot for camera {self.camera_index}.")
+        return int(free_slots[0])
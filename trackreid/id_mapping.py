@@ -0,0 +1,172 @@
+"""
+Flat, vectorized mapping from the tracker ids seen by a ReidProcessor to their corrected object ids.
+
+The re-id chains of the tracked objects are flattened into parallel arrays sorted by tracker id, so that raw
+tracker outputs, or any per-detection data such as embeddings or crops keyed by tracker id, can be relabeled with
+the corrected object ids after processing, in a single vectorized pass with np.searchsorted.
+
+Each tracker id of a chain designates its object from the first frame it was seen in, until the frame before the
+next tracker id of the chain was first seen, or until the last frame the object was seen in for the last tracker id
+of the chain.
+
+Example:
+    id_mapping = reid_processor.export_id_mapping()
+    id_mapping.save("id_mapping.npz")
+
+    tracker_log = np.loadtxt("tracker_log.txt", ndmin=2)
+    relabeled_log = IdMapping.load("id_mapping.npz").relabel(
+        tracker_log, tracker_id_column=5, frame_id_column=0
+    )
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional, Union
+
+import numpy as np
+
+from trackreid.tracked_object import TrackedObject
+
+FIELDS = ("tracker_ids", "object_ids", "first_frame_ids", "last_frame_ids", "states")
+
+
+@dataclass(frozen=True)
+class IdMapping:
+    """
+    Parallel arrays mapping each tracker id to its corrected object id, sorted by tracker id. See the module
+    documentation.
+
+    Args:
+        tracker_ids (np.ndarray): The sorted tracker ids.
+        object_ids (np.ndarray): The object id of each tracker id.
+        first_frame_ids (np.ndarray): The first frame each tracker id designates its object in.
+        last_frame_ids (np.ndarray): The last frame each tracker id designates its object in.
+        states (np.ndarray): The state of the object of each tracker id, see TrackedObject.
+    """
+
+    tracker_ids: np.ndarray
+    object_ids: np.ndarray
+    first_frame_ids: np.ndarray
+    last_frame_ids: np.ndarray
+    states: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.tracker_ids)
+
+    @classmethod
+    def from_tracked_objects(
+        cls, tracked_objects: Iterable[TrackedObject], tracker_id_first_frames: dict
+    ) -> IdMapping:
+        """
+        Flattens the re-id chains of tracked objects.
+
+        Args:
+            tracked_objects (Iterable[TrackedObject]): The tracked objects.
+            tracker_id_first_frames (dict): The first frame each tracker id was seen in.
+
+        Returns:
+            IdMapping: The mapping of the tracker ids of the objects.
+        """
+        tracker_ids, object_ids, first_frame_ids, last_frame_ids, states = [], [], [], [], []
+        for tracked_object in tracked_objects:
+            chain = list(tracked_object.re_id_chain)
+            chain_first_frame_ids = [
+                tracker_id_first_frames.get(tracker_id, tracked_object.metadata.first_frame_id)
+                for tracker_id in chain
+            ]
+            tracker_ids.extend(chain)
+            object_ids.extend([tracked_object.object_id] * len(chain))
+            first_frame_ids.extend(chain_first_frame_ids)
+            last_frame_ids.extend(
+                [first_frame_id - 1 for first_frame_id in chain_first_frame_ids[1:]]
+                + [tracked_object.metadata.last_frame_id]
+            )
+            states.extend([tracked_object.state] * len(chain))
+
+        order = np.argsort(np.asarray(tracker_ids, dtype=float), kind="stable")
+        return cls(
+            tracker_ids=np.asarray(tracker_ids, dtype=float)[order],
+            object_ids=np.asarray(object_ids, dtype=float)[order],
+            first_frame_ids=np.asarray(first_frame_ids, dtype=np.int64)[order],
+            last_frame_ids=np.asarray(last_frame_ids, dtype=np.int64)[order],
+            states=np.asarray(states, dtype=np.int8)[order],
+        )
+
+    def lookup(
+        self,
+        tracker_ids: np.ndarray,
+        frame_ids: Optional[np.ndarray] = None,
+        fill_value: float = -1,
+    ) -> np.ndarray:
+        """
+        Looks up the object ids of tracker ids.
+
+        Args:
+            tracker_ids (np.ndarray): The tracker ids to look up.
+            frame_ids (Optional[np.ndarray], optional): The frame id of each tracker id. If provided, tracker ids
+                outside of their frame range are not mapped. Defaults to None.
+            fill_value (float, optional): The object id of unmapped tracker ids. Defaults to -1.
+
+        Returns:
+            np.ndarray: The object id of each tracker id, as float64.
+        """
+        tracker_ids = np.asarray(tracker_ids, dtype=float)
+        indexes = np.searchsorted(self.tracker_ids, tracker_ids)
+        indexes = np.minimum(indexes, max(len(self) - 1, 0))
+        if not len(self):
+            return np.full(tracker_ids.shape, fill_value, dtype=float)
+
+        found = self.tracker_ids[indexes] == tracker_ids
+        if frame_ids is not None:
+            frame_ids = np.asarray(frame_ids)
+            found &= (self.first_frame_ids[indexes] <= frame_ids) & (
+                frame_ids <= self.last_frame_ids[indexes]
+            )
+        return np.where(found, self.object_ids[indexes], fill_value)
+
+    def relabel(
+        self,
+        array: np.ndarray,
+        tracker_id_column: int = 4,
+        frame_id_column: Optional[int] = None,
+        fill_value: float = -1,
+        inplace: bool = False,
+    ) -> np.ndarray:
+        """
+        Replaces the tracker ids of the rows of an array with their object ids, see lookup.
+
+        Args:
+            array (np.ndarray): A 2D array with one row per detection, e.g. a tracker output or a tracker log.
+            tracker_id_column (int, optional): The column of the tracker ids. Defaults to 4, the object id
+                column of the tracker output expected by ReidProcessor.update.
+            frame_id_column (Optional[int], optional): The column of the frame ids, if the rows of tracker ids
+                outside of their frame range should not be mapped. Defaults to None.
+            fill_value (float, optional): The object id of unmapped rows. Defaults to -1.
+            inplace (bool, optional): Whether to relabel the array in place rather than a copy.
+                Defaults to False.
+
+        Returns:
+            np.ndarray: The relabeled array.
+        """
+        if not inplace:
+            array = array.copy()
+        frame_ids = None if frame_id_column is None else array[:, frame_id_column]
+        array[:, tracker_id_column] = self.lookup(
+            array[:, tracker_id_column], frame_ids=frame_ids, fill_value=fill_value
+        )
+        return array
+
+    def save(self, file_path: Union[str, Path]) -> None:
+        """
+        Saves the mapping to a .npz file.
+        """
+        np.savez(file_path, **{field: getattr(self, field) for field in FIELDS})
+
+    @classmethod
+    def load(cls, file_path: Union[str, Path]) -> IdMapping:
+        """
+        Loads a mapping saved with save.
+        """
+        with np.load(file_path) as data:
+            return cls(**{field: data[field] for field in FIELDS})
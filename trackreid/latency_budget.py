@@ -0,0 +1,180 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+from trackreid.tracked_object import TrackedObject
+
+# smoothing factor of the moving averages of the per-operation costs of matching
+RATE_SMOOTHING = 0.5
+
+
+class LatencyBudget:
+    """
+    Per-frame latency budget of a ReidProcessor, with a deterministic degradation of matching on crowded frames.
+
+    The elapsed time of each stage of a frame is measured, and the cost of matching is predicted from the size of
+    the assignment, with per-operation costs learned from the previous matches: the cost of computing a cell of
+    the cost and selection matrices, and the cost of an assignment with the Jonker-Volgenant solver, cubic in the
+    size of the problem, or with the greedy solver, proportional to the number of cells.
+
+    When the predicted matching time exceeds the remaining budget of the frame, matching is degraded along the
+    following ladder, stopping at the first level that fits in the budget:
+        1. the assignment is limited to the most recently seen switchers,
+        2. the greedy solver is used instead of the Jonker-Volgenant solver, on the most recently seen switchers,
+        3. matching is deferred to the next frame.
+
+    Degradation events are counted in counters, and the elapsed times of the stages of the last frame are
+    available in stage_timings, in milliseconds.
+
+    Args:
+        budget_ms (float): The latency budget of a frame, in milliseconds.
+    """
+
+    def __init__(self, budget_ms: float) -> None:
+        if budget_ms < 0:
+            raise ValueError(f"Latency budget should be positive, got {budget_ms}.")
+        self.budget_ms = budget_ms
+        self.stage_timings: Dict[str, float] = {}
+        self.counters = {
+            "frames": 0,
+            "over_budget_frames": 0,
+            "capped_matchings": 0,
+            "greedy_matchings": 0,
+            "deferred_matchings": 0,
+        }
+        # seconds per matrix cell, per cubed assignment size, and per cell for the greedy solver
+        self.rates = {"matrices": 0.0, "lapjv": 0.0, "greedy": 0.0}
+        self._frame_start = time.perf_counter()
+        self._last_mark = self._frame_start
+
+    def start_frame(self) -> None:
+        """
+        Starts measuring a new frame.
+        """
+        self._frame_start = self._last_mark = time.perf_counter()
+        self.stage_timings = {}
+        self.counters["frames"] += 1
+
+    def mark(self, stage: str) -> None:
+        """
+        Records the elapsed time since the previous mark as the time of the given stage.
+        """
+        now = time.perf_counter()
+        self.stage_timings[stage] = (
+            self.stage_timings.get(stage, 0.0) + (now - self._last_mark) * 1e3
+        )
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        """
+        Records the total time of the frame, and whether it exceeded the budget.
+        """
+        total_ms = (time.perf_counter() - self._frame_start) * 1e3
+        self.stage_timings["total"] = total_ms
+        if total_ms > self.budget_ms:
+            self.counters["over_budget_frames"] += 1
+
+    @property
+    def remaining_ms(self) -> float:
+        return self.budget_ms - (time.perf_counter() - self._frame_start) * 1e3
+
+    def predict_matching_ms(self, nb_switchers: int, nb_candidates: int, greedy: bool) -> float:
+        """
+        Predicts the time of a match between the given numbers of switchers and candidates, in milliseconds.
+        """
+        nb_cells = nb_switchers * nb_candidates
+        if greedy:
+            assignment = self.rates["greedy"] * nb_cells
+        else:
+            assignment = self.rates["lapjv"] * max(nb_switchers, nb_candidates) ** 3
+        return (self.rates["matrices"] * nb_cells + assignment) * 1e3
+
+    def plan_matching(self, nb_switchers: int, nb_candidates: int) -> Optional[Tuple[int, bool]]:
+        """
+        Chooses the degradation level of the matching of the current frame, see the ladder above.
+
+        Args:
+            nb_switchers (int): The number of switchers.
+            nb_candidates (int): The number of candidates.
+
+        Returns:
+            Optional[Tuple[int, bool]]: The number of most recent switchers to match and whether to use the greedy
+            solver, or None if matching is deferred to the next frame.
+        """
+        remaining_ms = self.remaining_ms
+        for greedy in (False, True):
+            nb_kept = self._get_max_switchers(nb_switchers, nb_candidates, greedy, remaining_ms)
+            if nb_kept:
+                if nb_kept < nb_switchers:
+                    self.counters["capped_matchings"] += 1
+                if greedy:
+                    self.counters["greedy_matchings"] += 1
+                return nb_kept, greedy
+        self.counters["deferred_matchings"] += 1
+        return None
+
+    def _get_max_switchers(
+        self, nb_switchers: int, nb_candidates: int, greedy: bool, remaining_ms: float
+    ) -> int:
+        """
+        Finds the largest number of switchers whose predicted matching time fits in the remaining time, by
+        bisection since the predicted time increases with the number of switchers.
+        """
+        if self.predict_matching_ms(nb_switchers, nb_candidates, greedy) <= remaining_ms:
+            return nb_switchers
+        low, high = 0, nb_switchers
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.predict_matching_ms(middle, nb_candidates, greedy) <= remaining_ms:
+                low = middle
+            else:
+                high = middle
+        return low
+
+    def record_matching(
+        self, timings: Dict[str, float], nb_switchers: int, nb_candidates: int, greedy: bool
+    ) -> None:
+        """
+        Updates the per-operation costs of matching with the timings of a match, in seconds.
+
+        Args:
+            timings (Dict[str, float]): The time spent computing the matrices, and in the assignment.
+            nb_switchers (int): The number of matched switchers.
+            nb_candidates (int): The number of candidates.
+            greedy (bool): Whether the greedy solver was used.
+        """
+        nb_cells = nb_switchers * nb_candidates
+        self._update_rate("matrices", timings["matrices"] / nb_cells)
+        if "assignment" in timings:
+            if greedy:
+                self._update_rate("greedy", timings["assignment"] / nb_cells)
+            else:
+                self._update_rate(
+                    "lapjv", timings["assignment"] / max(nb_switchers, nb_candidates) ** 3
+                )
+
+    def _update_rate(self, name: str, rate: float) -> None:
+        if self.rates[name]:
+            self.rates[name] += RATE_SMOOTHING * (rate - self.rates[name])
+        else:
+            self.rates[name] = rate
+
+
+def select_most_recent_switchers(
+    switchers: List[TrackedObject], nb_kept: int
+) -> List[TrackedObject]:
+    """
+    Selects the switchers last seen most recently, keeping their order. Ties are broken by position, so that the
+    selection is deterministic.
+
+    Args:
+        switchers (List[TrackedObject]): The switchers.
+        nb_kept (int): The number of switchers to keep.
+
+    Returns:
+        List[TrackedObject]: The selected switchers.
+    """
+    ranks = sorted(
+        range(len(switchers)),
+        key=lambda index: (-switchers[index].metadata.last_frame_id, index),
+    )
+    return [switchers[index] for index in sorted(ranks[:nb_kept])]
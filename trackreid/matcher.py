@@ -1,10 +1,13 @@
-from typing import Callable, Dict, List, Optional, Union
+import time
+from sys import getsizeof
+from typing import Callable, Dict, Hashable, List, Optional, Tuple, Union
 
-import lap
 import numpy as np
 
 from trackreid.configs.reid_constants import reid_constants
+from trackreid.solvers import get_solver, greedy_solver, jv_solver
 from trackreid.tracked_object import TrackedObject
+from trackreid.utils import get_cache_key, is_batched
 
 
 class Matcher:
@@ -13,6 +16,8 @@ class Matcher:
         cost_function: Callable,
         selection_function: Callable,
         cost_function_threshold: Optional[Union[int, float]] = None,
+        cache_costs: bool = False,
+        solver: Union[str, Callable] = "jv",
     ) -> None:
         """
         Initializes the Matcher object with the provided cost function, selection function, and cost function threshold.
@@ -20,7 +25,11 @@ class Matcher:
         Args:
             cost_function (Callable): A function that calculates the cost of matching two objects. This function should take two TrackedObject instances as input and return a numerical value representing the cost of matching these two objects. A lower cost indicates a higher likelihood of a match.
             selection_function (Callable): A function that determines whether two objects should be considered for matching. This function should take two TrackedObject instances as input and return a binary value (0 or 1). A return value of 1 indicates that the pair should be considered for matching, while a return value of 0 indicates that the pair should not be considered.
+
+            Cost and selection functions decorated with trackreid.utils.batched are called once with the lists of candidates and switchers, and must return the full [N, M] matrix, with one row per switcher and one column per candidate.
             cost_function_threshold (Optional[Union[int, float]]): An optional threshold value for the cost function. If provided, any pair of objects with a matching cost greater than this threshold will not be considered for matching. If not provided, all selected pairs will be considered regardless of their matching cost.
+            cache_costs (bool): Whether to cache costs and selections across calls to match. Cached values of a pair are reused as long as both objects keep the same state, number of tracker ids and metadata version, so only the rows and columns of new or changed objects are recomputed, and the previous assignment is reused if nothing changed. Only valid for cost and selection functions that depend on the two objects alone. Defaults to False.
+            solver (Union[str, Callable]): The assignment solver, see trackreid.solvers: "jv" for the optimal Jonker-Volgenant solver, "greedy" for the greedy solver, "auction" for the auction solver, "trivial" for single switcher or candidate problems, "auto" to pick one by size and density of the problem, or a custom solver. Defaults to "jv".
 
         Returns:
             None
@@ -28,12 +37,28 @@ class Matcher:
         self.cost_function = cost_function
         self.selection_function = selection_function
         self.cost_function_threshold = cost_function_threshold
+        self.cache_costs = cache_costs
+        self.solver = get_solver(solver)
+        # time spent computing the matrices and in the assignment during the last match, in seconds
+        self.last_timings: Dict[str, float] = {}
+        # cost of each match of the last match, in the order of the matches
+        self.last_match_costs: List[float] = []
+        self.reset_cache()
+
+    def reset_cache(self) -> None:
+        """
+        Clears the cached costs, selections and assignment, and the cache counters.
+        """
+        self._cost_cache = PairwiseMatrixCache(get_cache_key(self.cost_function))
+        self._selection_cache = PairwiseMatrixCache(get_cache_key(self.selection_function))
+        self._cached_assignment: Optional[List[Tuple[int, int]]] = None
+        self.nb_reused_assignments = 0
 
     def compute_cost_matrix(
         self, candidates: List[TrackedObject], switchers: List[TrackedObject]
     ) -> np.ndarray:
-        """Computes a cost matrix of size [M, N] between a list of M TrackedObjects candidates,
-        and a list of N TrackedObjects switchers.
+        """Computes a cost matrix of size [N, M] between a list of M TrackedObjects candidates,
+        and a list of N TrackedObjects switchers. Rows are switchers, columns are candidates.
 
         Args:
             candidates (List[TrackedObject]): list of candidates for matches.
@@ -45,7 +70,10 @@ class Matcher:
         if not candidates or not switchers:
             return np.array([])  # Return an empty array if either list is empty
 
-        # Create matrices with all combinations of candidates and switchers
+        if is_batched(self.cost_function):
+            return np.asarray(self.cost_function(candidates, switchers), dtype=float)
+
+        # Create matrices with all combinations of switchers (rows) and candidates (columns)
         candidates_matrix, switchers_matrix = np.meshgrid(candidates, switchers)
 
         # Use np.vectorize to apply the scoring function to all combinations
@@ -56,8 +84,8 @@ class Matcher:
     def compute_selection_matrix(
         self, candidates: List[TrackedObject], switchers: List[TrackedObject]
     ) -> np.ndarray:
-        """Computes a selection matrix of size [M, N] between a list of M TrackedObjects candidates,
-        and a list of N TrackedObjects switchers.
+        """Computes a selection matrix of size [N, M] between a list of M TrackedObjects candidates,
+        and a list of N TrackedObjects switchers. Rows are switchers, columns are candidates.
 
         Args:
             candidates (List[TrackedObject]): list of candidates for matches.
@@ -69,7 +97,10 @@ class Matcher:
         if not candidates or not switchers:
             return np.array([])  # Return an empty array if either list is empty
 
-        # Create matrices with all combinations of candidates and switchers
+        if is_batched(self.selection_function):
+            return np.asarray(self.selection_function(candidates, switchers))
+
+        # Create matrices with all combinations of switchers (rows) and candidates (columns)
         candidates_matrix, switchers_matrix = np.meshgrid(candidates, switchers)
 
         # Use np.vectorize to apply the scoring function to all combinations
@@ -80,23 +111,60 @@ class Matcher:
         return selection_matrix
 
     def match(
-        self, candidates: List[TrackedObject], switchers: List[TrackedObject]
+        self, candidates: List[TrackedObject], switchers: List[TrackedObject], greedy: bool = False
     ) -> List[Dict[TrackedObject, TrackedObject]]:
         """Computes a dict of matching between objects in list candidates and objects in switchers.
 
         Args:
             candidates (List[TrackedObject]): list of candidates for matches.
             switchers (List[TrackedObject]): list of objects to be matched.
+            greedy (bool, optional): Whether to use the greedy solver instead of the solver of the matcher.
+                Defaults to False.
 
         Returns:
             List[Dict[TrackedObject, TrackedObject]]: list of pairs of TrackedObjects
             if there is a match.
         """
+        self.last_match_costs = []
         if not candidates or not switchers:
             return []  # Return an empty array if either list is empty
 
+        if self.cache_costs:
+            return self._match_with_cache(candidates, switchers, greedy=greedy)
+
+        start = time.perf_counter()
         cost_matrix = self.compute_cost_matrix(candidates, switchers)
         selection_matrix = self.compute_selection_matrix(candidates, switchers)
+        matrices_end = time.perf_counter()
+
+        matches = self._assign(cost_matrix, selection_matrix, candidates, switchers, greedy=greedy)
+        self.last_timings = {
+            "matrices": matrices_end - start,
+            "assignment": time.perf_counter() - matrices_end,
+        }
+        return matches
+
+    def _assign(
+        self,
+        cost_matrix: np.ndarray,
+        selection_matrix: np.ndarray,
+        candidates: List[TrackedObject],
+        switchers: List[TrackedObject],
+        greedy: bool = False,
+    ) -> List[Dict[TrackedObject, TrackedObject]]:
+        """Discards the pairs that are not selected or above the cost threshold, and solves the assignment.
+
+        Args:
+            cost_matrix (np.ndarray): [N, M] cost matrix, modified in place.
+            selection_matrix (np.ndarray): [N, M] selection matrix.
+            candidates (List[TrackedObject]): list of candidates for matches.
+            switchers (List[TrackedObject]): list of objects to be matched.
+            greedy (bool, optional): Whether to use the greedy solver. Defaults to False.
+
+        Returns:
+            List[Dict[TrackedObject, TrackedObject]]: list of pairs of TrackedObjects
+            if there is a match.
+        """
 
         # Set a elements values to be discard at DISALLOWED_MATCH value, large cost
         cost_matrix[selection_matrix == 0] = reid_constants.MATCHES.DISALLOWED_MATCH
@@ -105,10 +173,102 @@ class Matcher:
                 cost_matrix > self.cost_function_threshold
             ] = reid_constants.MATCHES.DISALLOWED_MATCH
 
-        matches = self.linear_assigment(cost_matrix, candidates=candidates, switchers=switchers)
+        solver = greedy_solver if greedy else self.solver
+        switcher_indexes, candidate_indexes = solver(
+            cost_matrix, reid_constants.MATCHES.DISALLOWED_MATCH - 0.1
+        )
+        self.last_match_costs = cost_matrix[switcher_indexes, candidate_indexes].tolist()
+        return self._to_matches(switcher_indexes, candidate_indexes, candidates, switchers)
+
+    @staticmethod
+    def _to_matches(
+        switcher_indexes: np.ndarray,
+        candidate_indexes: np.ndarray,
+        candidates: List[TrackedObject],
+        switchers: List[TrackedObject],
+    ) -> List[Dict[TrackedObject, TrackedObject]]:
+        return [
+            {candidates[candidate_idx]: switchers[switcher_idx]}
+            for switcher_idx, candidate_idx in zip(
+                switcher_indexes.tolist(), candidate_indexes.tolist()
+            )
+        ]
+
+    def _match_with_cache(
+        self, candidates: List[TrackedObject], switchers: List[TrackedObject], greedy: bool = False
+    ) -> List[Dict[TrackedObject, TrackedObject]]:
+        """Computes the matches like match, reusing the costs and selections of unchanged pairs from the
+        previous call, and the previous assignment if neither matrix changed. Greedy assignments are not
+        reused, so that they are recomputed optimally when possible.
+
+        Args:
+            candidates (List[TrackedObject]): list of candidates for matches.
+            switchers (List[TrackedObject]): list of objects to be matched.
+            greedy (bool, optional): Whether to use the greedy solver. Defaults to False.
+
+        Returns:
+            List[Dict[TrackedObject, TrackedObject]]: list of pairs of TrackedObjects
+            if there is a match.
+        """
+        start = time.perf_counter()
+        cost_matrix, cost_unchanged = self._cost_cache.compute(
+            self.compute_cost_matrix, candidates, switchers
+        )
+        selection_matrix, selection_unchanged = self._selection_cache.compute(
+            self.compute_selection_matrix, candidates, switchers
+        )
+
+        matrices_end = time.perf_counter()
+        self.last_timings = {"matrices": matrices_end - start}
+
+        if cost_unchanged and selection_unchanged and self._cached_assignment is not None:
+            self.nb_reused_assignments += 1
+            self.last_match_costs = [
+                float(cost_matrix[switcher_idx, candidate_idx])
+                for candidate_idx, switcher_idx in self._cached_assignment
+            ]
+            return [
+                {candidates[candidate_idx]: switchers[switcher_idx]}
+                for candidate_idx, switcher_idx in self._cached_assignment
+            ]
+
+        matches = self._assign(
+            cost_matrix.copy(), selection_matrix, candidates, switchers, greedy=greedy
+        )
+        self.last_timings["assignment"] = time.perf_counter() - matrices_end
+        if greedy:
+            self._cached_assignment = None
+            return matches
 
+        candidate_positions = {id(candidate): idx for idx, candidate in enumerate(candidates)}
+        switcher_positions = {id(switcher): idx for idx, switcher in enumerate(switchers)}
+        self._cached_assignment = [
+            (candidate_positions[id(candidate)], switcher_positions[id(switcher)])
+            for match in matches
+            for candidate, switcher in match.items()
+        ]
         return matches
 
+    @property
+    def cache_nbytes(self) -> int:
+        """
+        Estimated size in bytes of the cached matrices and of their object indexes.
+        """
+        return self._cost_cache.nbytes + self._selection_cache.nbytes
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        Counters of the cache: number of computed and reused costs and selections, and of reused assignments.
+        """
+        return {
+            "computed_costs": self._cost_cache.nb_computed,
+            "reused_costs": self._cost_cache.nb_reused,
+            "computed_selections": self._selection_cache.nb_computed,
+            "reused_selections": self._selection_cache.nb_reused,
+            "reused_assignments": self.nb_reused_assignments,
+        }
+
     @staticmethod
     def linear_assigment(
         cost_matrix: np.ndarray, candidates: List[TrackedObject], switchers: List[TrackedObject]
@@ -121,7 +281,8 @@ class Matcher:
         each cell represents the cost of assigning a candidate to a switcher.
 
         Args:
-            cost_matrix (np.ndarray): A 2D array representing the cost of assigning each candidate to each switcher.
+            cost_matrix (np.ndarray): A [N, M] array representing the cost of assigning each candidate (columns)
+                to each switcher (rows).
             candidates (List[TrackedObject]): A list of candidate TrackedObjects for matching.
             switchers (List[TrackedObject]): A list of switcher TrackedObjects to be matched.
 
@@ -129,13 +290,149 @@ class Matcher:
             List[Dict[TrackedObject, TrackedObject]]: A list of dictionaries where each dictionary represents a match.
             The key is a candidate and the value is the corresponding switcher.
         """
-        _, _, row_cols = lap.lapjv(
-            cost_matrix, extend_cost=True, cost_limit=reid_constants.MATCHES.DISALLOWED_MATCH - 0.1
+        switcher_indexes, candidate_indexes = jv_solver(
+            cost_matrix, reid_constants.MATCHES.DISALLOWED_MATCH - 0.1
         )
+        return Matcher._to_matches(switcher_indexes, candidate_indexes, candidates, switchers)
 
-        matches = []
-        for candidate_idx, switcher_idx in enumerate(row_cols):
-            if switcher_idx >= 0:
-                matches.append({candidates[candidate_idx]: switchers[switcher_idx]})
+    @staticmethod
+    def greedy_assignment(
+        cost_matrix: np.ndarray, candidates: List[TrackedObject], switchers: List[TrackedObject]
+    ) -> List[Dict[TrackedObject, TrackedObject]]:
+        """
+        Performs a greedy assignment on the cost matrix: allowed pairs are matched by increasing cost, skipping
+        the pairs whose candidate or switcher is already matched, see trackreid.solvers.greedy_solver. The
+        assignment is not optimal, but it only costs a few vectorized passes on the matrix, which makes it a
+        cheap fallback for large problems.
 
-        return matches
+        Args:
+            cost_matrix (np.ndarray): A [N, M] array representing the cost of assigning each candidate (columns)
+                to each switcher (rows).
+            candidates (List[TrackedObject]): A list of candidate TrackedObjects for matching.
+            switchers (List[TrackedObject]): A list of switcher TrackedObjects to be matched.
+
+        Returns:
+            List[Dict[TrackedObject, TrackedObject]]: A list of dictionaries where each dictionary represents a match.
+            The key is a candidate and the value is the corresponding switcher.
+        """
+        switcher_indexes, candidate_indexes = greedy_solver(
+            cost_matrix, reid_constants.MATCHES.DISALLOWED_MATCH - 0.1
+        )
+        return Matcher._to_matches(switcher_indexes, candidate_indexes, candidates, switchers)
+
+
+class PairwiseMatrixCache:
+    """
+    Cache of a [N, M] matrix of values computed on pairs of switchers (rows) and candidates (columns), reused
+    across calls for the pairs whose objects did not change.
+
+    Objects are identified by identity, and considered unchanged as long as their cache key is the same. The
+    default key is (state, number of tracker ids, metadata version), which changes whenever the object is
+    updated, merged or cut. Functions that only read part of the objects can declare a coarser key with
+    trackreid.utils.cache_key, e.g. the category for select_by_category, so that their values are reused even
+    for objects updated in the current frame.
+
+    Args:
+        key_function (Optional[Callable]): Function computing the cache key of a TrackedObject.
+            Defaults to None, i.e. the default key.
+    """
+
+    def __init__(self, key_function: Optional[Callable] = None) -> None:
+        self.key_function = key_function or self.default_key
+        self._candidates: Dict[int, Tuple[int, TrackedObject, Hashable]] = {}
+        self._switchers: Dict[int, Tuple[int, TrackedObject, Hashable]] = {}
+        self._matrix = np.zeros((0, 0))
+        self.nb_computed = 0
+        self.nb_reused = 0
+
+    @staticmethod
+    def default_key(tracked_object: TrackedObject) -> Tuple[int, int, int]:
+        return tracked_object.state, tracked_object.nb_ids, tracked_object.metadata.version
+
+    def _get_cached_indexes(
+        self, tracked_objects: List[TrackedObject], cached_objects: Dict[int, Tuple]
+    ) -> Tuple[np.ndarray, Dict[int, Tuple]]:
+        """
+        Finds the index of each object in the cached matrix, or -1 if the object is new or changed since then.
+
+        Args:
+            tracked_objects (List[TrackedObject]): The objects of the current call.
+            cached_objects (Dict[int, Tuple]): The (index, object, key) of the cached objects, by object id().
+
+        Returns:
+            Tuple[np.ndarray, Dict[int, Tuple]]: The cached index of each object, and the cache entries of
+            the current objects.
+        """
+        cached_indexes = np.full(len(tracked_objects), -1)
+        new_cached_objects = {}
+        for index, tracked_object in enumerate(tracked_objects):
+            key = self.key_function(tracked_object)
+            cached = cached_objects.get(id(tracked_object))
+            # cached objects are referenced by the cache, so their id() cannot be reused by another object
+            if cached is not None and cached[1] is tracked_object and cached[2] == key:
+                cached_indexes[index] = cached[0]
+            new_cached_objects[id(tracked_object)] = (index, tracked_object, key)
+        return cached_indexes, new_cached_objects
+
+    def compute(
+        self,
+        compute_matrix: Callable,
+        candidates: List[TrackedObject],
+        switchers: List[TrackedObject],
+    ) -> Tuple[np.ndarray, bool]:
+        """
+        Builds the [N, M] matrix from the cached values of the unchanged pairs, and computes the rows of new or
+        changed switchers and the columns of new or changed candidates with compute_matrix.
+
+        Args:
+            compute_matrix (Callable): Computes the matrix of a list of candidates and a list of switchers.
+            candidates (List[TrackedObject]): The M candidates.
+            switchers (List[TrackedObject]): The N switchers.
+
+        Returns:
+            Tuple[np.ndarray, bool]: The matrix, and whether it is the same as in the previous call.
+        """
+        candidate_indexes, cached_candidates = self._get_cached_indexes(
+            candidates, self._candidates
+        )
+        switcher_indexes, cached_switchers = self._get_cached_indexes(switchers, self._switchers)
+        unchanged = (
+            self._matrix.shape == (len(switchers), len(candidates))
+            and np.array_equal(candidate_indexes, np.arange(len(candidates)))
+            and np.array_equal(switcher_indexes, np.arange(len(switchers)))
+        )
+
+        cached_rows, new_rows = np.flatnonzero(switcher_indexes >= 0), np.flatnonzero(
+            switcher_indexes < 0
+        )
+        cached_cols, new_cols = np.flatnonzero(candidate_indexes >= 0), np.flatnonzero(
+            candidate_indexes < 0
+        )
+
+        matrix = np.empty((len(switchers), len(candidates)))
+        matrix[np.ix_(cached_rows, cached_cols)] = self._matrix[
+            np.ix_(switcher_indexes[cached_rows], candidate_indexes[cached_cols])
+        ]
+        if new_rows.size:
+            matrix[new_rows, :] = compute_matrix(candidates, [switchers[i] for i in new_rows])
+        if new_cols.size and cached_rows.size:
+            matrix[np.ix_(cached_rows, new_cols)] = compute_matrix(
+                [candidates[i] for i in new_cols], [switchers[i] for i in cached_rows]
+            )
+
+        nb_reused = cached_rows.size * cached_cols.size
+        self.nb_reused += nb_reused
+        self.nb_computed += matrix.size - nb_reused
+        self._candidates, self._switchers, self._matrix = (
+            cached_candidates,
+            cached_switchers,
+            matrix,
+        )
+        return matrix, unchanged
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Estimated size in bytes of the cached matrix and of its object indexes.
+        """
+        return self._matrix.nbytes + getsizeof(self._candidates) + getsizeof(self._switchers)
@@ -0,0 +1,173 @@
+"""
+Memory estimates of the ReidProcessor.
+
+Estimates are computed from counters, the number of tracked objects, tracker ids and class count entries per state,
+multiplied by unit sizes measured once on a sample object. The counters are maintained by the ReidProcessor where
+objects are created, change state, are merged or cut, or get a new class count entry, fast path included, so that
+reporting does not walk the tracked objects, whose number grows over a long stream.
+"""
+from dataclasses import fields
+from functools import lru_cache
+from sys import getsizeof
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from trackreid.configs.reid_constants import reid_constants
+from trackreid.tracked_object import TrackedObject
+
+STATE_NAMES = {
+    getattr(reid_constants.STATES, field.name): field.name
+    for field in fields(reid_constants.STATES)
+}
+
+
+@lru_cache(maxsize=None)
+def get_unit_sizes(
+    num_classes: Optional[int] = None,
+    velocity_smoothing: Optional[float] = None,
+    trajectory_capacity: Optional[int] = None,
+) -> Dict[str, int]:
+    """
+    Measures the size in bytes of the components of a tracked object created with the given metadata options.
+
+    Args:
+        num_classes (Optional[int], optional): See TrackedObjectMetaData. Defaults to None.
+        velocity_smoothing (Optional[float], optional): See TrackedObjectMetaData. Defaults to None.
+        trajectory_capacity (Optional[int], optional): See TrackedObjectMetaData. Defaults to None.
+
+    Returns:
+        Dict[str, int]: The size of a TrackedObject without chain and metadata ("object"), of an empty re-id chain
+        ("chain") and of each of its tracker ids ("chain_node"), of metadata without class counts ("metadata"),
+        and of each class count entry when class counts are stored in a dictionary ("class_entry").
+    """
+    tracked_object = TrackedObject(
+        object_ids=0.5,
+        state=reid_constants.STATES.TRACKER_OUTPUT,
+        metadata=np.full(7, 0.5),
+        frame_id=0,
+        num_classes=num_classes,
+        velocity_smoothing=velocity_smoothing,
+        trajectory_capacity=trajectory_capacity,
+    )
+    metadata = tracked_object.metadata
+
+    metadata_bytes = getsizeof(metadata) + getsizeof(metadata.__dict__)
+    for name, value in vars(metadata).items():
+        if name == "class_counts" and isinstance(value, dict):
+            metadata_bytes += getsizeof({})
+        elif isinstance(value, list):
+            metadata_bytes += getsizeof(value) + sum(getsizeof(item) for item in value)
+        elif isinstance(value, (float, np.ndarray)):
+            metadata_bytes += getsizeof(value)
+
+    nb_entries = 8
+    return {
+        "object": getsizeof(tracked_object) + getsizeof(tracked_object.__dict__),
+        "chain": getsizeof(tracked_object.re_id_chain),
+        "chain_node": getsizeof(tracked_object.re_id_chain.first) + getsizeof(0.5),
+        "metadata": metadata_bytes,
+        "class_entry": (getsizeof(dict.fromkeys(range(nb_entries), 0)) - getsizeof({}))
+        // nb_entries,
+    }
+
+
+class MemoryCounters:
+    """
+    Counts of the tracked objects, tracker ids and class count entries in each state, and the longest re-id chains,
+    updated by the ReidProcessor as objects change.
+
+    Counters are moved between states with move, and objects whose re-id chain or class counts change are removed
+    before the change and added back after it. The longest chains are kept in a table of nb_longest_chains
+    objects: a chain shortened by a cut stays in the table with its new length, so the table is an estimate once
+    chains have been cut.
+
+    Args:
+        nb_longest_chains (int): Number of longest chains to keep.
+    """
+
+    def __init__(self, nb_longest_chains: int) -> None:
+        self.nb_longest_chains = nb_longest_chains
+        self.counters: Dict[int, List[int]] = {state: [0, 0, 0] for state in STATE_NAMES}
+        self._chains: Dict[int, Tuple[int, TrackedObject]] = {}
+
+    def add(self, tracked_object: TrackedObject) -> None:
+        """
+        Counts a tracked object in its current state.
+        """
+        nb_ids = len(tracked_object.re_id_chain)
+        counter = self.counters[tracked_object.state]
+        counter[0] += 1
+        counter[1] += nb_ids
+        counter[2] += get_nb_class_entries(tracked_object)
+        self._offer_chain(tracked_object, nb_ids)
+
+    def remove(self, tracked_object: TrackedObject) -> None:
+        """
+        Uncounts a tracked object from its current state, before it is dropped, merged or cut.
+        """
+        counter = self.counters[tracked_object.state]
+        counter[0] -= 1
+        counter[1] -= len(tracked_object.re_id_chain)
+        counter[2] -= get_nb_class_entries(tracked_object)
+        self._chains.pop(id(tracked_object), None)
+
+    def move(self, tracked_object: TrackedObject, previous_state: int) -> None:
+        """
+        Moves the counts of a tracked object from its previous state to its current one.
+        """
+        if previous_state == tracked_object.state:
+            return
+        counts = (
+            1,
+            len(tracked_object.re_id_chain),
+            get_nb_class_entries(tracked_object),
+        )
+        previous_counter = self.counters[previous_state]
+        counter = self.counters[tracked_object.state]
+        for position, count in enumerate(counts):
+            previous_counter[position] -= count
+            counter[position] += count
+
+    def add_class_entries(self, state: int, nb_class_entries: int) -> None:
+        """
+        Counts the class count entries added to an object in the given state by a metadata update.
+        """
+        self.counters[state][2] += nb_class_entries
+
+    def get_longest_chains(self) -> List[Tuple[int, float]]:
+        """
+        Returns the (nb tracker ids, object id) of the longest chains, longest first.
+        """
+        return sorted(
+            (
+                (nb_ids, tracked_object.object_id)
+                for nb_ids, tracked_object in self._chains.values()
+            ),
+            key=lambda chain: chain[0],
+            reverse=True,
+        )
+
+    def _offer_chain(self, tracked_object: TrackedObject, nb_ids: int) -> None:
+        """
+        Keeps the chain of an object in the table of longest chains if it is longer than the shortest one.
+        """
+        key = id(tracked_object)
+        if key in self._chains or len(self._chains) < self.nb_longest_chains:
+            self._chains[key] = (nb_ids, tracked_object)
+            return
+        # single tracker id chains never replace any chain of a full table
+        if nb_ids <= 1 or not self._chains:
+            return
+        shortest_key = min(self._chains, key=lambda chain_key: self._chains[chain_key][0])
+        if nb_ids > self._chains[shortest_key][0]:
+            del self._chains[shortest_key]
+            self._chains[key] = (nb_ids, tracked_object)
+
+
+def get_nb_class_entries(tracked_object: TrackedObject) -> int:
+    """
+    Returns the number of class count entries of a tracked object, 0 for dense class counts.
+    """
+    class_counts = tracked_object.metadata.class_counts
+    return len(class_counts) if isinstance(class_counts, dict) else 0
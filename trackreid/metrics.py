@@ -0,0 +1,467 @@
+"""
+Operational metrics of ReidProcessor, exported in the Prometheus text format.
+
+ReidMetrics aggregates counters and histograms updated in the hot path of the processors it is given to: frames,
+detections, fast path frames, corrections and matchings, the duration of each frame and of each of its stages, and
+the numbers of switchers and candidates of each matching. Updates are a few additions and a bisection in fixed
+bucket bounds, and nothing is formatted until a scrape.
+
+Gauges are computed when the metrics are rendered: the throughput in frames per second and the corrections per
+minute over a sliding window, the number of tracked objects in each state of reid_constants.STATES and the
+estimated size of the object store (see ReidProcessor.memory_report), summed over the processors using the
+metrics, and any gauge added with add_gauge, e.g. the queue depth of a ReidServer. Object counts and sizes are
+snapshotted by each processor at the end of its frames, from the counters it maintains (see trackreid.memory), so
+that a scrape from an exporter thread only reads plain numbers and never the state of a processor being updated.
+
+The rendered text is served by an exporter: TextfileExporter writes it periodically to a file, e.g. for the
+textfile collector of the node exporter, and HttpExporter serves it on a local HTTP endpoint.
+
+Example:
+    metrics = ReidMetrics(labels={"camera": "entrance"})
+    reid_processor = ReidProcessor(..., metrics=metrics)
+    with HttpExporter(metrics, port=9100):
+        for frame_id, tracker_output in stream:
+            reid_processor.update(tracker_output, frame_id)
+"""
+import os
+import sys
+import threading
+import time
+import weakref
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from trackreid.memory import STATE_NAMES
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+# upper bounds of the duration buckets, in seconds
+DURATION_BUCKETS = (1e-4, 2.5e-4, 5e-4, 1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0)
+# upper bounds of the matching problem size buckets, in number of switchers or candidates
+SIZE_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# content type of the Prometheus text format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+COUNTERS = {
+    "frames": "Frames processed.",
+    "detections": "Detections received in tracker outputs.",
+    "fast_path_frames": "Steady-state frames processed by the fast path.",
+    "matchings": "Matchings of candidates with switchers.",
+    "corrections": "Candidates matched with a switcher, i.e. corrected tracker ids.",
+}
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        for value in labels.values()
+    )
+    return "{" + ",".join(f'{name}="{value}"' for name, value in zip(labels, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    Histogram with fixed bucket bounds, rendered as a Prometheus histogram.
+
+    Args:
+        buckets (Sequence[float]): The increasing upper bounds of the buckets, without +Inf.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name: str, labels: Dict[str, str]) -> List[str]:
+        """
+        Returns the sample lines of the histogram, with cumulative bucket counts.
+        """
+        lines = []
+        cumulative_count = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative_count += count
+            bucket_labels = _format_labels({**labels, "le": _format_value(float(bound))})
+            lines.append(f"{name}_bucket{bucket_labels} {cumulative_count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(self.sum)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {self.count}")
+        return lines
+
+
+class ReidMetrics:
+    """
+    Counters, histograms and gauges of one or several ReidProcessor, see the module documentation.
+
+    A ReidMetrics may be shared by several processors, e.g. the streams of a ReidServer: counters and histograms
+    are aggregated, and gauges are summed over the processors still alive. Frame timings assume the processors
+    are updated from a single thread, as in ReidServer.
+
+    Args:
+        labels (Optional[Dict[str, str]], optional): Labels added to all the samples, e.g. the camera.
+            Defaults to None.
+        duration_buckets (Sequence[float], optional): Upper bounds of the buckets of the frame and stage
+            durations, in seconds. Defaults to DURATION_BUCKETS.
+        size_buckets (Sequence[float], optional): Upper bounds of the buckets of the numbers of switchers and
+            candidates of matchings. Defaults to SIZE_BUCKETS.
+        rate_window_s (float, optional): Duration of the sliding window of the frames per second and corrections
+            per minute gauges, in seconds. Defaults to 60.
+    """
+
+    def __init__(
+        self,
+        labels: Optional[Dict[str, str]] = None,
+        duration_buckets: Sequence[float] = DURATION_BUCKETS,
+        size_buckets: Sequence[float] = SIZE_BUCKETS,
+        rate_window_s: float = 60.0,
+    ) -> None:
+        self.labels = dict(labels or {})
+        self.duration_buckets = tuple(duration_buckets)
+        self.rate_window_s = rate_window_s
+
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.frame_durations = Histogram(self.duration_buckets)
+        self.stage_durations: Dict[str, Histogram] = {}
+        self.matching_sizes = {
+            "switchers": Histogram(size_buckets),
+            "candidates": Histogram(size_buckets),
+        }
+        self.gauges: Dict[str, Tuple[str, Callable[[], float]]] = {}
+
+        # processor -> (object store bytes, number of objects of each state), snapshotted by end_frame
+        self._snapshots: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._snapshots_lock = threading.Lock()
+        self._frame_start = self._last_mark = time.perf_counter()
+        # (time, frames, corrections) sampled at most once per second, for the rate gauges
+        self._rate_samples: deque = deque()
+        self._rate_samples.append((time.monotonic(), 0, 0))
+
+    def bind(self, reid_processor) -> None:
+        """
+        Adds a processor to the gauges of tracked objects. Called by ReidProcessor on creation.
+        """
+        self._snapshot(reid_processor)
+
+    def _snapshot(self, reid_processor) -> None:
+        snapshot = (
+            reid_processor.memory_report()["total_bytes"],
+            {
+                STATE_NAMES[state]: nb_objects
+                for state, (nb_objects, _, _) in reid_processor._memory_counters.counters.items()
+            },
+        )
+        with self._snapshots_lock:
+            self._snapshots[reid_processor] = snapshot
+
+    def _get_snapshots(self) -> List[Tuple[int, Dict[str, int]]]:
+        with self._snapshots_lock:
+            return list(self._snapshots.values())
+
+    def add_gauge(self, name: str, help_text: str, function: Callable[[], float]) -> None:
+        """
+        Adds a gauge whose value is computed by a function when the metrics are rendered.
+
+        Args:
+            name (str): The name of the gauge, e.g. "trackreid_server_queue_depth".
+            help_text (str): The description of the gauge.
+            function (Callable[[], float]): Returns the value of the gauge.
+        """
+        self.gauges[name] = (help_text, function)
+
+    def start_frame(self) -> None:
+        self._frame_start = self._last_mark = time.perf_counter()
+
+    def mark(self, stage: str) -> None:
+        """
+        Records the elapsed time since the previous mark as the duration of the given stage.
+        """
+        now = time.perf_counter()
+        histogram = self.stage_durations.get(stage)
+        if histogram is None:
+            histogram = self.stage_durations[stage] = Histogram(self.duration_buckets)
+        histogram.observe(now - self._last_mark)
+        self._last_mark = now
+
+    def end_frame(self, reid_processor, nb_detections: int, fast_path: bool) -> None:
+        """
+        Records the duration of the frame, counts it with its detections, and snapshots the object counts and
+        object store size of the processor for the gauges.
+        """
+        self.frame_durations.observe(time.perf_counter() - self._frame_start)
+        self._snapshot(reid_processor)
+        self.counters["frames"] += 1
+        self.counters["detections"] += nb_detections
+        self.counters["fast_path_frames"] += fast_path
+
+        now = time.monotonic()
+        if now - self._rate_samples[-1][0] >= 1:
+            self._rate_samples.append((now, self.counters["frames"], self.counters["corrections"]))
+            while now - self._rate_samples[0][0] > self.rate_window_s:
+                self._rate_samples.popleft()
+
+    def observe_matching(self, nb_switchers: int, nb_candidates: int, nb_matches: int) -> None:
+        """
+        Records the size of a matching, and counts its matches as corrections.
+        """
+        self.matching_sizes["switchers"].observe(nb_switchers)
+        self.matching_sizes["candidates"].observe(nb_candidates)
+        self.counters["matchings"] += 1
+        self.counters["corrections"] += nb_matches
+
+    def get_rates(self) -> Tuple[float, float]:
+        """
+        Returns the frames per second and corrections per minute over the sliding window.
+        """
+        start_time, start_frames, start_corrections = self._rate_samples[0]
+        elapsed = time.monotonic() - start_time
+        if elapsed <= 0:
+            return 0.0, 0.0
+        return (
+            (self.counters["frames"] - start_frames) / elapsed,
+            (self.counters["corrections"] - start_corrections) * 60 / elapsed,
+        )
+
+    def get_state_counts(self) -> Dict[str, int]:
+        """
+        Returns the number of tracked objects in each state at the end of the last frames, summed over the
+        processors.
+        """
+        state_counts = dict.fromkeys(STATE_NAMES.values(), 0)
+        for _, processor_state_counts in self._get_snapshots():
+            for state, nb_objects in processor_state_counts.items():
+                state_counts[state] += nb_objects
+        return state_counts
+
+    def render(self) -> str:
+        """
+        Renders the metrics in the Prometheus text format.
+
+        Returns:
+            str: The exposition text.
+        """
+        labels = self.labels
+        lines = []
+
+        def add_metric(name: str, metric_type: str, help_text: str, samples: List[str]) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {metric_type}")
+            lines.extend(samples)
+
+        for counter, help_text in COUNTERS.items():
+            name = f"trackreid_{counter}_total"
+            value = self.counters[counter]
+            add_metric(name, "counter", help_text, [f"{name}{_format_labels(labels)} {value}"])
+
+        add_metric(
+            "trackreid_frame_duration_seconds",
+            "histogram",
+            "Duration of ReidProcessor.update.",
+            self.frame_durations.render("trackreid_frame_duration_seconds", labels),
+        )
+        stage_samples = []
+        for stage, histogram in list(self.stage_durations.items()):
+            stage_samples.extend(
+                histogram.render("trackreid_stage_duration_seconds", {**labels, "stage": stage})
+            )
+        add_metric(
+            "trackreid_stage_duration_seconds",
+            "histogram",
+            "Duration of each stage of ReidProcessor.update.",
+            stage_samples,
+        )
+        size_samples = []
+        for role, histogram in self.matching_sizes.items():
+            size_samples.extend(
+                histogram.render("trackreid_matching_size", {**labels, "role": role})
+            )
+        add_metric(
+            "trackreid_matching_size",
+            "histogram",
+            "Number of switchers and candidates of each matching.",
+            size_samples,
+        )
+
+        frames_per_second, corrections_per_minute = self.get_rates()
+        gauges = {
+            "trackreid_frames_per_second": (
+                f"Frames processed per second over the last {self.rate_window_s:g} seconds.",
+                frames_per_second,
+            ),
+            "trackreid_corrections_per_minute": (
+                f"Corrections per minute over the last {self.rate_window_s:g} seconds.",
+                corrections_per_minute,
+            ),
+            "trackreid_object_store_bytes": (
+                "Estimated memory of the tracked objects and indexes of the processors.",
+                sum(object_store_bytes for object_store_bytes, _ in self._get_snapshots()),
+            ),
+        }
+        for name, (help_text, function) in list(self.gauges.items()):
+            gauges[name] = (help_text, function())
+        for name, (help_text, value) in gauges.items():
+            add_metric(name, "gauge", help_text, [f"{name}{_format_labels(labels)} {value}"])
+
+        add_metric(
+            "trackreid_tracked_objects",
+            "gauge",
+            "Tracked objects in each state.",
+            [
+                f"trackreid_tracked_objects{_format_labels({**labels, 'state': state})} {count}"
+                for state, count in self.get_state_counts().items()
+            ],
+        )
+        return "\n".join(lines) + "\n"
+
+
+class MetricsExporter(ABC):
+    """
+    Base class of the exporters of ReidMetrics, which render the metrics on demand. Exporters are started with
+    start and stopped with stop, or used as context managers.
+
+    Args:
+        metrics (ReidMetrics): The exported metrics.
+    """
+
+    def __init__(self, metrics: ReidMetrics) -> None:
+        self.metrics = metrics
+
+    @abstractmethod
+    def start(self) -> "MetricsExporter":
+        """
+        Starts exporting the metrics, and returns the exporter.
+        """
+
+    @abstractmethod
+    def stop(self) -> None:
+        """
+        Stops exporting the metrics.
+        """
+
+    def __enter__(self) -> "MetricsExporter":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+
+class TextfileExporter(MetricsExporter):
+    """
+    Writes the metrics to a text file every interval_s seconds, and once more when stopped. The file is replaced
+    atomically, so that readers never see a partial file. A failed periodic write is reported on stderr and the
+    next one is attempted at the following interval.
+
+    Args:
+        metrics (ReidMetrics): The exported metrics.
+        file_path (Union[str, Path]): The path of the file, ending with .prom for the node exporter.
+        interval_s (float, optional): The interval between two writes, in seconds. Defaults to 15.
+    """
+
+    def __init__(
+        self, metrics: ReidMetrics, file_path: Union[str, Path], interval_s: float = 15.0
+    ) -> None:
+        super().__init__(metrics)
+        self.file_path = Path(file_path)
+        self.interval_s = interval_s
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def write(self) -> None:
+        """
+        Renders the metrics and replaces the file with them.
+        """
+        temporary_path = self.file_path.with_name(f".{self.file_path.name}.{os.getpid()}.tmp")
+        temporary_path.write_text(self.metrics.render())
+        temporary_path.replace(self.file_path)
+
+    def start(self) -> "TextfileExporter":
+        def run():
+            while not self._stopped.wait(self.interval_s):
+                try:
+                    self.write()
+                except Exception as exception:  # noqa: BLE001
+                    print(
+                        f"Failed to write metrics to {self.file_path}: "
+                        f"{type(exception).__name__}: {exception}",
+                        file=sys.stderr,
+                    )
+
+        self._stopped.clear()
+        self.write()
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+            self.write()
+
+
+class HttpExporter(MetricsExporter):
+    """
+    Serves the metrics on http://host:port/metrics from a background thread, rendering them on each request.
+
+    Args:
+        metrics (ReidMetrics): The exported metrics.
+        host (str, optional): The host to bind. Defaults to "127.0.0.1", i.e. local scrapers only.
+        port (int, optional): The port to bind, 0 for any free port, see address. Defaults to 0.
+    """
+
+    def __init__(self, metrics: ReidMetrics, host: str = "127.0.0.1", port: int = 0) -> None:
+        super().__init__(metrics)
+        self.address: Tuple[str, int] = (host, port)
+        self._server: Optional["ThreadingHTTPServer"] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "HttpExporter":
+        # imported here so that http.server is not loaded with trackreid
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self.metrics
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):  # noqa: ARG002
+                pass
+
+        self._server = ThreadingHTTPServer(self.address, MetricsHandler)
+        self._server.daemon_threads = True
+        self.address = self._server.server_address[:2]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
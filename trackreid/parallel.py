@@ -0,0 +1,187 @@
+"""
+Temporal chunk parallelism for long tracker logs.
+
+A long tracker log is split into consecutive chunks of frames, each processed by its own ReidProcessor in a worker
+process. Each worker starts `overlap` frames before its chunk, so that objects lost shortly before the chunk boundary
+are known when the chunk starts. Since a lost object can only be rematched within max_frames_to_rematch frames, an
+overlap of at least max_frames_to_rematch frames lets every chunk take the rematching decisions of the serial process.
+
+Object ids are then stitched across boundaries: in the overlap, the rows of a chunk are matched by
+(frame_id, tracker_id) with the already stitched rows of the previous chunks, and each object id of the chunk is
+replaced by the object id that the previous chunks assigned to the same tracklet. Object ids of a chunk that are not
+found in the overlap keep their value unless the previous chunks already emitted it for another object, in which case
+they are renumbered after the largest object id emitted so far.
+
+Since a worker only sees `overlap` frames of history, metadata such as the mean confidence or the category of objects
+living across a boundary can differ from the serial output, and so can the rare rematches depending on them.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from trackreid.configs.output_data_positions import output_data_positions
+from trackreid.reid_processor import ReidProcessor
+from trackreid.tracker_log import process_tracker_log
+
+
+def process_tracker_log_in_chunks(
+    frame_ids: np.ndarray,
+    frame_tracker_outputs: List[np.ndarray],
+    processor_kwargs: Dict,
+    nb_chunks: int,
+    overlap: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> List[np.ndarray]:
+    """
+    Runs the reid process over a tracker log split in overlapping chunks processed in parallel, and stitches
+    the object ids across chunk boundaries.
+
+    Args:
+        frame_ids (np.ndarray): The sorted frame ids, as returned by trackreid.tracker_log.split_tracker_log.
+        frame_tracker_outputs (List[np.ndarray]): The tracker output of each frame.
+        processor_kwargs (Dict): The ReidProcessor parameters. Cost and selection functions must be picklable,
+            i.e. defined at module level, when max_workers is not 1.
+        nb_chunks (int): The number of chunks.
+        overlap (Optional[int], optional): Number of frames processed before each chunk to warm up its processor.
+            Defaults to max_frames_to_rematch, and must not be lower.
+        max_workers (Optional[int], optional): Number of worker processes. Chunks are processed in the current
+            process if set to 1. Defaults to None, i.e. the number of processors.
+
+    Returns:
+        List[np.ndarray]: The stitched output of the processor for each frame.
+    """
+    max_frames_to_rematch = processor_kwargs["max_frames_to_rematch"]
+    if overlap is None:
+        overlap = max_frames_to_rematch
+    if overlap < max_frames_to_rematch:
+        raise ValueError(
+            f"overlap ({overlap}) must be at least max_frames_to_rematch ({max_frames_to_rematch})."
+        )
+    if nb_chunks < 1:
+        raise ValueError(f"nb_chunks must be a positive integer, got {nb_chunks}.")
+
+    frame_ids = np.asarray(frame_ids)
+    processor_kwargs = {**processor_kwargs, "save_to_txt": False}
+
+    # chunk boundaries are frame indexes, and each chunk starts processing at its warm up index
+    chunk_starts = np.linspace(0, len(frame_ids), nb_chunks + 1).astype(int)
+    chunk_bounds = [
+        (start, end) for start, end in zip(chunk_starts[:-1], chunk_starts[1:]) if end > start
+    ]
+    warm_up_starts = [
+        np.searchsorted(frame_ids, frame_ids[start] - overlap) for start, _ in chunk_bounds
+    ]
+    tasks = [
+        (frame_ids[warm_up_start:end], frame_tracker_outputs[warm_up_start:end], processor_kwargs)
+        for warm_up_start, (_, end) in zip(warm_up_starts, chunk_bounds)
+    ]
+
+    if max_workers == 1:
+        chunk_outputs = [_process_chunk(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            chunk_outputs = list(executor.map(_process_chunk, *zip(*tasks)))
+
+    reid_outputs = []
+    emitted_object_ids = set()
+    for warm_up_start, (start, end), outputs in zip(warm_up_starts, chunk_bounds, chunk_outputs):
+        mapping = _get_object_id_mapping(
+            chunk_outputs=outputs[: start - warm_up_start],
+            stitched_outputs=reid_outputs[warm_up_start:start],
+        )
+        outputs = outputs[start - warm_up_start :]
+        _renumber_colliding_object_ids(mapping, outputs, emitted_object_ids)
+        for output in outputs:
+            reid_outputs.append(_relabel_object_ids(output, mapping))
+            if output.size:
+                emitted_object_ids.update(_get_column(output, "object_id").tolist())
+
+    return reid_outputs
+
+
+def _process_chunk(
+    frame_ids: np.ndarray, frame_tracker_outputs: List[np.ndarray], processor_kwargs: Dict
+) -> List[np.ndarray]:
+    reid_processor = ReidProcessor(**processor_kwargs)
+    return process_tracker_log(reid_processor, frame_ids, frame_tracker_outputs)
+
+
+def _get_column(reid_output: np.ndarray, name: str) -> np.ndarray:
+    if reid_output.dtype.names is not None:
+        return reid_output[name]
+    return reid_output[:, getattr(output_data_positions, name)]
+
+
+def _get_object_id_mapping(
+    chunk_outputs: List[np.ndarray], stitched_outputs: List[np.ndarray]
+) -> Dict[float, float]:
+    """
+    Maps the object ids of a chunk to the stitched object ids, by matching their rows in the overlap on
+    tracker ids. Later frames take precedence, since both processors have seen more of the objects.
+
+    Args:
+        chunk_outputs (List[np.ndarray]): The outputs of the chunk processor in the overlap.
+        stitched_outputs (List[np.ndarray]): The stitched outputs of the same frames.
+
+    Returns:
+        Dict[float, float]: The object ids of the chunk mapped to the stitched ones.
+    """
+    mapping = {}
+    for chunk_output, stitched_output in zip(chunk_outputs, stitched_outputs):
+        if not chunk_output.size or not stitched_output.size:
+            continue
+        stitched_object_ids = dict(
+            zip(
+                _get_column(stitched_output, "tracker_id").tolist(),
+                _get_column(stitched_output, "object_id").tolist(),
+            )
+        )
+        for tracker_id, object_id in zip(
+            _get_column(chunk_output, "tracker_id").tolist(),
+            _get_column(chunk_output, "object_id").tolist(),
+        ):
+            if tracker_id in stitched_object_ids:
+                mapping[object_id] = stitched_object_ids[tracker_id]
+    return mapping
+
+
+def _renumber_colliding_object_ids(
+    mapping: Dict[float, float], chunk_outputs: List[np.ndarray], emitted_object_ids: Set[float]
+) -> None:
+    """
+    Maps the object ids of a chunk that were not stitched in the overlap, but were already emitted by the previous
+    chunks for other objects, to new object ids following the largest object id emitted so far.
+
+    Args:
+        mapping (Dict[float, float]): The object ids of the chunk mapped to the stitched ones, updated in place.
+        chunk_outputs (List[np.ndarray]): The outputs of the chunk processor after the overlap.
+        emitted_object_ids (Set[float]): The object ids emitted by the previous chunks.
+    """
+    chunk_object_ids = {
+        object_id
+        for output in chunk_outputs
+        if output.size
+        for object_id in _get_column(output, "object_id").tolist()
+    }
+    colliding_object_ids = sorted((chunk_object_ids - mapping.keys()) & emitted_object_ids)
+    if not colliding_object_ids:
+        return
+    next_object_id = max(emitted_object_ids | chunk_object_ids | set(mapping.values())) + 1
+    for object_id in colliding_object_ids:
+        mapping[object_id] = next_object_id
+        next_object_id += 1
+
+
+def _relabel_object_ids(reid_output: np.ndarray, mapping: Dict[float, float]) -> np.ndarray:
+    if not mapping or not reid_output.size:
+        return reid_output
+    object_ids = [
+        mapping.get(object_id, object_id)
+        for object_id in _get_column(reid_output, "object_id").tolist()
+    ]
+    if reid_output.dtype.names is not None:
+        reid_output["object_id"] = object_ids
+    else:
+        reid_output[:, output_data_positions.object_id] = object_ids
+    return reid_output
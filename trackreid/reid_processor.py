@@ -1,24 +1,64 @@
 from __future__ import annotations
 
-from typing import Callable, Dict, List, Optional, Set, Union
+import json
+from collections import deque
+from sys import getsizeof
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
 
 from trackreid.configs.input_data_positions import input_data_positions
-from trackreid.configs.output_data_positions import output_data_positions
+from trackreid.configs.output_data_positions import (
+    output_data_dtypes,
+    output_data_positions,
+)
 from trackreid.configs.reid_constants import reid_constants
 from trackreid.cost_functions import bounding_box_distance
+from trackreid.event_log import EventLog, event_types
+from trackreid.id_mapping import IdMapping
+from trackreid.latency_budget import LatencyBudget, select_most_recent_switchers
 from trackreid.matcher import Matcher
+from trackreid.memory import STATE_NAMES, MemoryCounters, get_unit_sizes
 from trackreid.selection_functions import select_by_category
 from trackreid.tracked_object import TrackedObject
 from trackreid.tracked_object_filter import TrackedObjectFilter
 from trackreid.utils import (
     filter_objects_by_state,
     get_nb_output_cols,
+    get_output_columns,
+    get_output_dtype,
     get_top_list_correction,
     reshape_tracker_result,
 )
 
+if TYPE_CHECKING:
+    from trackreid.metrics import ReidMetrics
+
+# states of the objects whose rows are emitted in the lagged output, see emission_lag
+EMITTED_STATES = (
+    reid_constants.STATES.STABLE,
+    reid_constants.STATES.SWITCHER,
+    reid_constants.STATES.LOST_FOREVER,
+)
+# input positions of the output variables observed in each row, rather than properties of its object
+OBSERVED_INPUT_POSITIONS = {
+    "bbox": input_data_positions.bbox,
+    "confidence": input_data_positions.confidence,
+    "tracker_id": input_data_positions.object_id,
+}
+
 
 class ReidProcessor:
     """
@@ -68,8 +108,33 @@ class ReidProcessor:
         save_to_txt (bool): A flag indicating whether to save the results to a text file. If set to True, the results will be saved to a text file specified by the file_path parameter.
 
         file_path (str): The path to the text file where the results will be saved if save_to_txt is set to True.
+
+        num_classes (Optional[int]): Number of categories, if categories are known integers in [0, num_classes). Class counts of tracked objects are then stored in dense vectors instead of dictionaries, which makes merges and category lookups cheaper. Leave to None for open-ended category ids.
+
+        output_format (str): Format of the output of update. With "array" (default), the output is a float64 array with the columns described above. With "structured", the output is a structured numpy array with one named field per output variable (int32 frame_id, object_id, category and tracker_id, float32 bbox, confidence and mean_confidence), which halves the output size and lets consumers read fields by name.
+
+        velocity_smoothing (Optional[float]): If provided, each tracked object maintains a constant-velocity motion model, an exponential moving average of its bounding box displacement per frame with this smoothing factor in (0, 1]. It is used by motion-aware cost functions such as predicted_bounding_box_distance_batched to compare candidates with the extrapolated position of switchers.
+
+        trajectory_capacity (Optional[int]): If provided, each tracked object keeps its last trajectory_capacity observations (frame_id, bbox and confidence) in a fixed-size ring buffer, available to trajectory-aware cost functions through metadata.trajectory.
+
+        cache_costs (bool): Whether the matcher caches costs and selections across frames. Pairs of switchers and candidates whose state, number of tracker ids and metadata are unchanged since the previous match are not recomputed, and the previous assignment is reused if no object changed. Only valid for cost and selection functions that depend on the two objects alone. Defaults to False.
+
+        solver (Union[str, Callable]): The assignment solver of the matcher, see trackreid.solvers: "jv" for the optimal Jonker-Volgenant solver, "greedy" for a cheap greedy solver, "auction" for the auction solver, "trivial" for single switcher or candidate problems, "auto" to pick one by size and density of each problem, or a custom solver. Defaults to "jv".
+
+        time_unit (str): Unit of filter_time_threshold, max_frames_to_rematch and max_attempt_to_match, either "frames" (default) or "seconds". With "seconds", update must be given the timestamp of each frame, and thresholds are durations: an object must be seen continuously for filter_time_threshold seconds to enter the reid process, a switcher is lost forever after max_frames_to_rematch seconds, and a candidate becomes stable max_attempt_to_match seconds after its first appearance. Timing then does not depend on the frame rate, so that decimated or variable-rate streams behave like full-rate ones with the same thresholds.
+
+        emission_lag (Optional[int]): If provided, the output of a frame is emitted emission_lag frames later, once the re-id decisions covering it are final, instead of immediately: update returns the rows of the frames that are emission_lag frames old, with the ids, categories and mean confidences of their objects at emission time. Rows of candidates that have been matched or have become stable since then are emitted, with their corrected ids, while they are missing from the immediate output. An emission lag of at least max_attempt_to_match frames ensures candidates are resolved. Rows still pending at the end of a sequence are emitted by flush_pending_frames. Defaults to None.
+
+        latency_budget_ms (Optional[float]): If provided, the latency budget of a frame in milliseconds. The elapsed time of each stage is measured, and when the predicted matching time exceeds the remaining budget, matching is degraded deterministically: first limited to the most recently seen switchers, then solved with a greedy solver, and finally deferred to the next frame. Stage timings and degradation counters are available through latency_stats. Defaults to None.
+
+        metrics (Optional[ReidMetrics]): If provided, operational metrics updated at each frame: frame and stage durations, detections, fast path frames, matching sizes and corrections, with gauges of the tracked objects per state and of the object store size, exported in the Prometheus text format, see trackreid.metrics. A ReidMetrics may be shared by several processors. Defaults to None.
+
+        event_log (Optional[EventLog]): If provided, every creation, filter change, state transition, re-id chain cut and merge of the tracked objects is appended to this memory-mapped log as a fixed-size binary record, to be inspected with trackreid.event_log.read_events. Defaults to None.
     """  # noqa: E501
 
+    # number of longest re-id chains listed in the memory report
+    NB_LONGEST_CHAINS = 10
+
     def __init__(
         self,
         filter_confidence_threshold: float,
@@ -81,30 +146,82 @@ class ReidProcessor:
         cost_function_threshold: Optional[Union[int, float]] = None,
         save_to_txt: bool = False,
         file_path: str = "tracks.txt",
+        num_classes: Optional[int] = None,
+        velocity_smoothing: Optional[float] = None,
+        output_format: str = "array",
+        trajectory_capacity: Optional[int] = None,
+        cache_costs: bool = False,
+        latency_budget_ms: Optional[float] = None,
+        time_unit: str = "frames",
+        emission_lag: Optional[int] = None,
+        solver: Union[str, Callable] = "jv",
+        metrics: Optional[ReidMetrics] = None,
+        event_log: Optional[EventLog] = None,
     ) -> None:
+        if time_unit not in ("frames", "seconds"):
+            raise ValueError(f"Unknown time unit {time_unit}, use 'frames' or 'seconds'.")
+        if emission_lag is not None and emission_lag < 0:
+            raise ValueError(f"emission_lag must be a non-negative integer, got {emission_lag}.")
+
         self.matcher = Matcher(
             cost_function=cost_function,
             selection_function=selection_function,
             cost_function_threshold=cost_function_threshold,
+            cache_costs=cache_costs,
+            solver=solver,
         )
 
         self.tracked_filter = TrackedObjectFilter(
             confidence_threshold=filter_confidence_threshold,
             frames_seen_threshold=filter_time_threshold,
+            time_unit=time_unit,
         )
 
         self.all_tracked_objects: List[TrackedObject] = []
         self.last_frame_tracked_objects: Set[TrackedObject] = set()
+        self._export_signatures: Dict[Union[int, float], Tuple[int, int, int]] = {}
+        self._tracker_id_first_frames: Dict[Union[int, float], int] = {}
+        self._reset_fast_path()
+        self._reset_memory_counters()
 
         self.max_frames_to_rematch = max_frames_to_rematch
         self.max_attempt_to_match = max_attempt_to_match
+        self.num_classes = num_classes
+        self.velocity_smoothing = velocity_smoothing
+        self.trajectory_capacity = trajectory_capacity
+        self.time_unit = time_unit
+        self.emission_lag = emission_lag
+        self._pending_frames: Deque[Tuple[int, np.ndarray]] = deque()
 
         self.frame_id = 0
+        self.timestamp: Optional[float] = None
+        self._previous_timestamp: Optional[float] = None
         self.nb_output_cols = get_nb_output_cols(output_positions=output_data_positions)
+        self._output_columns = get_output_columns(output_positions=output_data_positions)
+        for required_variable, _ in self._output_columns:
+            if required_variable != "frame_id" and not hasattr(TrackedObject, required_variable):
+                raise NameError(
+                    f"Attribute {required_variable} not in TrackedObject. Check your required output names."
+                )
+
+        if output_format not in ("array", "structured"):
+            raise ValueError(f"Unknown output format {output_format}, use 'array' or 'structured'.")
+        self.output_format = output_format
+        self.output_dtype = get_output_dtype(
+            output_positions=output_data_positions, output_dtypes=output_data_dtypes
+        )
 
         self.save_to_txt = save_to_txt
         self.file_path = file_path
 
+        self.latency_budget = (
+            LatencyBudget(budget_ms=latency_budget_ms) if latency_budget_ms is not None else None
+        )
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.bind(self)
+        self.event_log = event_log
+
     def reset(self) -> None:
         """
         Resets the ReID processor state for a new processing sequence.
@@ -114,8 +231,32 @@ class ReidProcessor:
         for a new sequence of frames.
         """
         self.frame_id = 0
+        self.timestamp = None
+        self._previous_timestamp = None
+        self._pending_frames = deque()
         self.all_tracked_objects: List[TrackedObject] = []
         self.last_frame_tracked_objects: Set[TrackedObject] = set()
+        self._export_signatures = {}
+        self._tracker_id_first_frames = {}
+        self._reset_fast_path()
+        self._reset_memory_counters()
+        self.matcher.reset_cache()
+
+    def _reset_fast_path(self) -> None:
+        """
+        Clears the index of tracked objects by tracker id, and the steady state used by the fast path.
+        """
+        self._tracked_objects_by_id: Dict[Union[int, float], TrackedObject] = {}
+        self._steady_tracker_ids: Optional[Set[Union[int, float]]] = None
+        self._steady_objects: Dict[Union[int, float], TrackedObject] = {}
+        self._steady_output_objects: List[TrackedObject] = []
+
+    def _reset_memory_counters(self) -> None:
+        """
+        Clears the counters of the memory report.
+        """
+        self._memory_counters = MemoryCounters(nb_longest_chains=self.NB_LONGEST_CHAINS)
+        self._last_output_nbytes = 0
 
     def set_file_path(self, new_file_path: str) -> None:
         """
@@ -190,7 +331,9 @@ class ReidProcessor:
         else:
             return 0
 
-    def update(self, tracker_output: np.ndarray, frame_id: int) -> np.ndarray:
+    def update(
+        self, tracker_output: np.ndarray, frame_id: int, timestamp: Optional[float] = None
+    ) -> np.ndarray:
         """
         Processes the tracker output and updates internal states.
 
@@ -218,28 +361,332 @@ class ReidProcessor:
 
         You can use ReidProcessor.print_output_data_format_information() for more insight.
 
+        Steady-state frames, with the same tracker ids as the previous frame and no pending candidate or switcher,
+        take a fast path that only updates the metadata of the present objects and formats the output.
+
         Args:
             tracker_output (np.ndarray): The tracker output.
             frame_id (int): The frame id.
+            timestamp (Optional[float]): The timestamp of the frame, in seconds. Required with time_unit "seconds", optional otherwise, in which case timestamps are only recorded in the metadata of the tracked objects.
 
         Returns:
             np.ndarray: The processed output.
         """  # noqa: E501
+        if self.latency_budget is not None:
+            self.latency_budget.start_frame()
+        if self.metrics is not None:
+            self.metrics.start_frame()
+        if self.event_log is not None:
+            self.event_log.frame_id = frame_id
+
+        if timestamp is None and self.time_unit == "seconds":
+            raise ValueError("A timestamp is required for each frame with time_unit 'seconds'.")
+        self.timestamp = timestamp
+
+        fast_path = False
         if tracker_output.size:  # empty tracking
-            self.all_tracked_objects, current_tracker_ids = self._preprocess(
-                tracker_output=tracker_output, frame_id=frame_id
-            )
-            self._perform_reid_process(current_tracker_ids=current_tracker_ids)
-            reid_output = self._postprocess(current_tracker_ids=current_tracker_ids)
+            tracker_output = reshape_tracker_result(tracker_output=tracker_output)
+            current_tracker_ids = list(tracker_output[:, input_data_positions.object_id])
+
+            if self._is_steady_frame(current_tracker_ids=current_tracker_ids):
+                reid_output = self._fast_update(
+                    tracker_output=tracker_output,
+                    current_tracker_ids=current_tracker_ids,
+                    frame_id=frame_id,
+                )
+                self._mark_stage("fast_path")
+                fast_path = True
+            else:
+                self.all_tracked_objects, current_tracker_ids = self._preprocess(
+                    tracker_output=tracker_output, frame_id=frame_id
+                )
+                self._mark_stage("preprocess")
+                reid_output = self._process_frame(current_tracker_ids=current_tracker_ids)
+                self._mark_stage("output")
+
+        elif self.output_format == "structured":
+            reid_output = np.zeros(0, dtype=self.output_dtype)
 
         else:
             reid_output = tracker_output
 
+        if self.emission_lag is not None:
+            reid_output = self._emit_lagged_output(tracker_output=tracker_output, frame_id=frame_id)
+
+        self._last_output_nbytes = reid_output.nbytes
         if self.save_to_txt:
             self._save_results_to_txt(file_path=self.file_path, reid_output=reid_output)
 
+        self._previous_timestamp = timestamp
+        if self.latency_budget is not None:
+            self.latency_budget.end_frame()
+        if self.metrics is not None:
+            self.metrics.end_frame(
+                reid_processor=self,
+                nb_detections=len(tracker_output) if tracker_output.size else 0,
+                fast_path=fast_path,
+            )
         return reid_output
 
+    def _emit_lagged_output(self, tracker_output: np.ndarray, frame_id: int) -> np.ndarray:
+        """
+        Adds the current frame to the pending frames, and formats the rows of the pending frames that are
+        emission_lag frames old.
+
+        Args:
+            tracker_output (np.ndarray): The reshaped tracker output of the current frame.
+            frame_id (int): The current frame id.
+
+        Returns:
+            np.ndarray: The rows of the emitted frames.
+        """
+        self._pending_frames.append((frame_id, tracker_output.copy()))
+        emitted_frames = []
+        while self._pending_frames and self._pending_frames[0][0] <= frame_id - self.emission_lag:
+            emitted_frames.append(self._pending_frames.popleft())
+        return self._format_lagged_output(frames=emitted_frames)
+
+    def flush_pending_frames(self) -> np.ndarray:
+        """
+        Emits the rows of all the pending frames with the current re-id decisions, e.g. at the end of a
+        sequence processed with an emission lag.
+
+        Returns:
+            np.ndarray: The rows of the pending frames.
+        """
+        emitted_frames = list(self._pending_frames)
+        self._pending_frames.clear()
+        reid_output = self._format_lagged_output(frames=emitted_frames)
+        if self.save_to_txt:
+            self._save_results_to_txt(file_path=self.file_path, reid_output=reid_output)
+        return reid_output
+
+    def _format_lagged_output(self, frames: List[Tuple[int, np.ndarray]]) -> np.ndarray:
+        """
+        Formats the rows of past frames whose objects are now stable, or were stable before being lost. Frame
+        ids, bounding boxes, confidences and tracker ids are those of the rows, while object ids, categories and
+        mean confidences are those of their objects at emission time, so that corrections apply retroactively.
+
+        Args:
+            frames (List[Tuple[int, np.ndarray]]): The (frame id, reshaped tracker output) of the emitted frames.
+
+        Returns:
+            np.ndarray: The formatted rows, a float64 array or a structured array depending on output_format.
+        """
+        frame_ids, data_lines, tracked_objects = [], [], []
+        for frame_id, tracker_output in frames:
+            for data_line in tracker_output:
+                tracked_object = self._tracked_objects_by_id.get(
+                    data_line[input_data_positions.object_id]
+                )
+                if tracked_object is not None and tracked_object.state in EMITTED_STATES:
+                    frame_ids.append(frame_id)
+                    data_lines.append(data_line)
+                    tracked_objects.append(tracked_object)
+
+        if self.output_format == "structured":
+            reid_output = np.zeros(len(data_lines), dtype=self.output_dtype)
+        else:
+            reid_output = np.zeros((len(data_lines), self.nb_output_cols))
+        if not data_lines:
+            return reid_output
+
+        data_lines = np.stack(data_lines)
+        for required_variable, positions in self._output_columns:
+            if required_variable == "frame_id":
+                output = frame_ids
+            elif required_variable in OBSERVED_INPUT_POSITIONS:
+                output = data_lines[:, OBSERVED_INPUT_POSITIONS[required_variable]]
+            else:
+                output = [
+                    getattr(tracked_object, required_variable) for tracked_object in tracked_objects
+                ]
+
+            if self.output_format == "structured":
+                reid_output[required_variable] = output
+            else:
+                reid_output[:, positions] = output
+
+        return reid_output
+
+    def _get_threshold_timestamp(self) -> Optional[float]:
+        """
+        Returns the current timestamp if thresholds are in seconds, else None so that they apply to frame ids.
+        """
+        return self.timestamp if self.time_unit == "seconds" else None
+
+    def _mark_stage(self, stage: str) -> None:
+        """
+        Records the elapsed time of a stage of the current frame, if a latency budget or metrics are set.
+        """
+        if self.latency_budget is not None:
+            self.latency_budget.mark(stage)
+        if self.metrics is not None:
+            self.metrics.mark(stage)
+
+    @property
+    def latency_stats(self) -> Optional[Dict[str, Dict[str, float]]]:
+        """
+        Stage timings of the last frame in milliseconds, and degradation counters of the latency budget,
+        or None if no latency budget is set.
+        """
+        if self.latency_budget is None:
+            return None
+        return {
+            "stage_timings": dict(self.latency_budget.stage_timings),
+            "counters": dict(self.latency_budget.counters),
+        }
+
+    def _match(
+        self, candidates: List[TrackedObject], switchers: List[TrackedObject]
+    ) -> List[Dict[TrackedObject, TrackedObject]]:
+        """
+        Matches candidates and switchers, degrading the matching if its predicted time exceeds the remaining
+        latency budget of the frame, and records the size of the matching in the metrics.
+
+        Args:
+            candidates (List[TrackedObject]): The candidates.
+            switchers (List[TrackedObject]): The switchers.
+
+        Returns:
+            List[Dict[TrackedObject, TrackedObject]]: The matches.
+        """
+        if not candidates or not switchers:
+            return self.matcher.match(candidates, switchers)
+
+        if self.latency_budget is None:
+            matches = self.matcher.match(candidates, switchers)
+        else:
+            plan = self.latency_budget.plan_matching(len(switchers), len(candidates))
+            if plan is None:
+                return []
+            nb_switchers, greedy = plan
+            if nb_switchers < len(switchers):
+                switchers = select_most_recent_switchers(switchers, nb_switchers)
+
+            matches = self.matcher.match(candidates, switchers, greedy=greedy)
+            self.latency_budget.record_matching(
+                self.matcher.last_timings, len(switchers), len(candidates), greedy
+            )
+
+        if self.metrics is not None:
+            self.metrics.observe_matching(len(switchers), len(candidates), len(matches))
+        return matches
+
+    def _is_steady_frame(self, current_tracker_ids: List[Union[int, float]]) -> bool:
+        """
+        Checks whether the current frame can take the fast path: the previous frame left the processor in a
+        steady state, i.e. without any candidate, switcher or state change after filtering, and the tracker
+        output contains the same tracker ids as the previous frame.
+
+        Args:
+            current_tracker_ids (List[Union[int, float]]): The current tracker IDs.
+
+        Returns:
+            bool: True if the frame is a steady-state frame.
+        """
+        return self._steady_tracker_ids is not None and self._steady_tracker_ids == set(
+            current_tracker_ids
+        )
+
+    def _fast_update(
+        self,
+        tracker_output: np.ndarray,
+        current_tracker_ids: List[Union[int, float]],
+        frame_id: int,
+    ) -> np.ndarray:
+        """
+        Processes a steady-state frame. In a steady state, the reid process cannot change anything as long as
+        filtering leaves the states of the present objects unchanged: only their metadata are updated, and the
+        output is formatted from the stable objects of the previous frame. If filtering changes a state, the
+        frame falls back to the full reid process.
+
+        Args:
+            tracker_output (np.ndarray): The reshaped tracker output.
+            current_tracker_ids (List[Union[int, float]]): The current tracker IDs.
+            frame_id (int): The frame id.
+
+        Returns:
+            np.ndarray: The processed output.
+        """
+        self.frame_id = frame_id
+        for object_id, data_line in zip(
+            tracker_output[:, input_data_positions.object_id], tracker_output
+        ):
+            self._update_metadata(self._steady_objects[object_id], data_line, frame_id)
+
+        state_changed = False
+        for tracked_object in self._steady_objects.values():
+            state = tracked_object.state
+            self.tracked_filter.update(tracked_object)
+            if tracked_object.state != state:
+                state_changed = True
+                self._memory_counters.move(tracked_object, state)
+                if self.event_log is not None:
+                    self.event_log.record_transition(
+                        tracked_object, state, tracked_object.state, event_type=event_types.FILTER
+                    )
+
+        if state_changed:
+            self.all_tracked_objects = self._apply_filtering()
+            return self._process_frame(current_tracker_ids=current_tracker_ids)
+
+        return self._format_output(stable_objects=self._steady_output_objects)
+
+    def _process_frame(self, current_tracker_ids: List[Union[int, float]]) -> np.ndarray:
+        """
+        Runs the full reid process on a filtered frame, formats its output, and records whether the
+        processor reached a steady state for the next frame.
+
+        Args:
+            current_tracker_ids (List[Union[int, float]]): The current tracker IDs.
+
+        Returns:
+            np.ndarray: The processed output.
+        """
+        objects_before = [id(tracked_object) for tracked_object in self.all_tracked_objects]
+        states_before = [tracked_object.state for tracked_object in self.all_tracked_objects]
+
+        self._perform_reid_process(current_tracker_ids=current_tracker_ids)
+        stable_objects = self._get_stable_objects(current_tracker_ids=current_tracker_ids)
+
+        states_after = [tracked_object.state for tracked_object in self.all_tracked_objects]
+        is_steady = (
+            states_before == states_after
+            and objects_before
+            == [id(tracked_object) for tracked_object in self.all_tracked_objects]
+            and not set(states_after).intersection(
+                [
+                    reid_constants.STATES.FILTERED_OUTPUT,
+                    reid_constants.STATES.CANDIDATE,
+                    reid_constants.STATES.SWITCHER,
+                ]
+            )
+        )
+        if is_steady:
+            self._steady_tracker_ids = set(current_tracker_ids)
+            self._steady_objects = {
+                tracker_id: self._tracked_objects_by_id[tracker_id]
+                for tracker_id in self._steady_tracker_ids
+            }
+            self._steady_output_objects = stable_objects
+        else:
+            self._steady_tracker_ids = None
+            self._steady_objects = {}
+            self._steady_output_objects = []
+
+        return self._format_output(stable_objects=stable_objects)
+
+    def _index_tracked_objects(self) -> None:
+        """
+        Rebuilds the index of tracked objects by tracker id, after re-id chains were cut or merged.
+        """
+        self._tracked_objects_by_id = {
+            tracker_id: tracked_object
+            for tracked_object in self.all_tracked_objects
+            for tracker_id in tracked_object.re_id_chain
+        }
+
     def _preprocess(self, tracker_output: np.ndarray, frame_id: int) -> List["TrackedObject"]:
         """
         Preprocesses the tracker output.
@@ -277,21 +724,63 @@ class ReidProcessor:
         for object_id, data_line in zip(
             tracker_output[:, input_data_positions.object_id], tracker_output
         ):
-            if object_id not in self.all_tracked_objects:
+            tracked_object = self._tracked_objects_by_id.get(object_id)
+            if tracked_object is None:
                 new_tracked_object = TrackedObject(
                     object_ids=object_id,
                     state=reid_constants.STATES.TRACKER_OUTPUT,
                     frame_id=frame_id,
                     metadata=data_line,
+                    num_classes=self.num_classes,
+                    velocity_smoothing=self.velocity_smoothing,
+                    trajectory_capacity=self.trajectory_capacity,
+                    timestamp=self.timestamp,
                 )
                 self.all_tracked_objects.append(new_tracked_object)
+                self._memory_counters.add(new_tracked_object)
+                self._tracked_objects_by_id[object_id] = new_tracked_object
+                self._tracker_id_first_frames[object_id] = frame_id
+                if self.event_log is not None:
+                    self.event_log.record(
+                        event_types.NEW,
+                        object_id,
+                        object_id,
+                        state=reid_constants.STATES.TRACKER_OUTPUT,
+                    )
             else:
-                self.all_tracked_objects[self.all_tracked_objects.index(object_id)].update_metadata(
-                    data_line, frame_id=frame_id
-                )
+                self._update_metadata(tracked_object, data_line, frame_id)
 
         return self.all_tracked_objects
 
+    def _update_metadata(
+        self, tracked_object: TrackedObject, data_line: np.ndarray, frame_id: int
+    ) -> None:
+        """
+        Updates the metadata of a tracked object with a detection, and counts the class count entry it may add.
+
+        Args:
+            tracked_object (TrackedObject): The tracked object.
+            data_line (np.ndarray): The detection.
+            frame_id (int): The frame id.
+        """
+        if self.num_classes is not None:
+            tracked_object.update_metadata(
+                data_line,
+                frame_id=frame_id,
+                timestamp=self.timestamp,
+                previous_frame_timestamp=self._previous_timestamp,
+            )
+            return
+        nb_class_entries = len(tracked_object.metadata.class_counts)
+        tracked_object.update_metadata(
+            data_line,
+            frame_id=frame_id,
+            timestamp=self.timestamp,
+            previous_frame_timestamp=self._previous_timestamp,
+        )
+        if len(tracked_object.metadata.class_counts) != nb_class_entries:
+            self._memory_counters.add_class_entries(tracked_object.state, 1)
+
     def _get_current_frame_tracked_objects(
         self, current_tracker_ids: Set[Union[int, float]]
     ) -> Set[Union[int, float]]:
@@ -304,13 +793,14 @@ class ReidProcessor:
         Returns:
             Set[Union[int, float]]: The set of tracked objects for the current frame.
         """
-        tracked_objects = filter_objects_by_state(
-            self.all_tracked_objects, states=reid_constants.STATES.TRACKER_OUTPUT, exclusion=True
-        )
-
-        current_frame_tracked_objects = set(
-            [tracked_id for tracked_id in tracked_objects if tracked_id in current_tracker_ids]
-        )
+        current_frame_tracked_objects = set()
+        for tracker_id in current_tracker_ids:
+            tracked_object = self._tracked_objects_by_id.get(tracker_id)
+            if (
+                tracked_object is not None
+                and tracked_object.state != reid_constants.STATES.TRACKER_OUTPUT
+            ):
+                current_frame_tracked_objects.add(tracked_object)
 
         return current_frame_tracked_objects
 
@@ -322,7 +812,14 @@ class ReidProcessor:
             List[TrackedObject]: The filtered tracked objects.
         """
         for tracked_object in self.all_tracked_objects:
+            state = tracked_object.state
             self.tracked_filter.update(tracked_object)
+            if tracked_object.state != state:
+                self._memory_counters.move(tracked_object, state)
+                if self.event_log is not None:
+                    self.event_log.record_transition(
+                        tracked_object, state, tracked_object.state, event_type=event_types.FILTER
+                    )
 
         return self.all_tracked_objects
 
@@ -350,9 +847,18 @@ class ReidProcessor:
             current_tracker_ids (List[Union[int, float]]): The current tracker IDs.
         """
 
+        has_chains_to_correct = any(
+            self._tracked_objects_by_id[tracker_id].tracker_id != tracker_id
+            for tracker_id in current_tracker_ids
+        )
         self.all_tracked_objects = self._correct_reid_chains(
-            all_tracked_objects=self.all_tracked_objects, current_tracker_ids=current_tracker_ids
+            all_tracked_objects=self.all_tracked_objects,
+            current_tracker_ids=current_tracker_ids,
+            event_log=self.event_log,
+            memory_counters=self._memory_counters,
         )
+        if has_chains_to_correct:
+            self._index_tracked_objects()
 
         current_frame_tracked_objects = self._get_current_frame_tracked_objects(
             current_tracker_ids=current_tracker_ids
@@ -363,22 +869,32 @@ class ReidProcessor:
             current_frame_tracked_objects=current_frame_tracked_objects,
             max_frames_to_rematch=self.max_frames_to_rematch,
             frame_id=self.frame_id,
+            timestamp=self._get_threshold_timestamp(),
+            event_log=self.event_log,
+            memory_counters=self._memory_counters,
         )
 
         self.all_tracked_objects = self._update_candidates_states(
             all_tracked_objects=self.all_tracked_objects,
             max_attempt_to_match=self.max_attempt_to_match,
             frame_id=self.frame_id,
+            timestamp=self._get_threshold_timestamp(),
+            event_log=self.event_log,
+            memory_counters=self._memory_counters,
         )
 
         self.all_tracked_objects = self._identify_switchers(
             current_frame_tracked_objects=current_frame_tracked_objects,
             last_frame_tracked_objects=self.last_frame_tracked_objects,
             all_tracked_objects=self.all_tracked_objects,
+            event_log=self.event_log,
+            memory_counters=self._memory_counters,
         )
 
         self.all_tracked_objects = self._identify_candidates(
-            all_tracked_objects=self.all_tracked_objects
+            all_tracked_objects=self.all_tracked_objects,
+            event_log=self.event_log,
+            memory_counters=self._memory_counters,
         )
 
         candidates = filter_objects_by_state(
@@ -388,12 +904,20 @@ class ReidProcessor:
             self.all_tracked_objects, states=reid_constants.STATES.SWITCHER, exclusion=False
         )
 
-        matches = self.matcher.match(candidates, switchers)
+        self._mark_stage("reid")
+        matches = self._match(candidates, switchers)
+        self._mark_stage("matching")
 
+        has_matches = bool(matches)
         self.all_tracked_objects = self._process_matches(
             all_tracked_objects=self.all_tracked_objects,
             matches=matches,
+            event_log=self.event_log,
+            costs=self.matcher.last_match_costs,
+            memory_counters=self._memory_counters,
         )
+        if has_matches:
+            self._index_tracked_objects()
 
         current_frame_tracked_objects = self._get_current_frame_tracked_objects(
             current_tracker_ids=current_tracker_ids
@@ -406,6 +930,8 @@ class ReidProcessor:
         all_tracked_objects: List["TrackedObject"],
         current_frame_tracked_objects: Set["TrackedObject"],
         last_frame_tracked_objects: Set["TrackedObject"],
+        event_log: Optional[EventLog] = None,
+        memory_counters: Optional[MemoryCounters] = None,
     ) -> List["TrackedObject"]:
         """
         Identifies switchers in the list of all tracked objects, and
@@ -416,6 +942,8 @@ class ReidProcessor:
             all_tracked_objects (List["TrackedObject"]): List of all objects being tracked.
             current_frame_tracked_objects (Set["TrackedObject"]): Set of currently tracked objects.
             last_frame_tracked_objects Set["TrackedObject"]: Set of last timestep tracked objects.
+            event_log (Optional[EventLog], optional): Log of the state transitions. Defaults to None.
+            memory_counters (Optional[MemoryCounters], optional): Counters of the memory report. Defaults to None.
 
         Returns:
             List["TrackedObject"]: Updated list of all tracked objects after state changes.
@@ -424,12 +952,23 @@ class ReidProcessor:
 
         for tracked_object in all_tracked_objects:
             if tracked_object in lost_objects:
+                if event_log is not None:
+                    event_log.record_transition(
+                        tracked_object, tracked_object.state, reid_constants.STATES.SWITCHER
+                    )
+                previous_state = tracked_object.state
                 tracked_object.state = reid_constants.STATES.SWITCHER
+                if memory_counters is not None:
+                    memory_counters.move(tracked_object, previous_state)
 
         return all_tracked_objects
 
     @staticmethod
-    def _identify_candidates(all_tracked_objects: List["TrackedObject"]) -> List["TrackedObject"]:
+    def _identify_candidates(
+        all_tracked_objects: List["TrackedObject"],
+        event_log: Optional[EventLog] = None,
+        memory_counters: Optional[MemoryCounters] = None,
+    ) -> List["TrackedObject"]:
         """
         Identifies candidates in the list of all tracked objects, and
         update their states. A candidate is an object that was never seen before and
@@ -437,6 +976,8 @@ class ReidProcessor:
 
         Args:
             all_tracked_objects (List["TrackedObject"]): List of all objects being tracked.
+            event_log (Optional[EventLog], optional): Log of the state transitions. Defaults to None.
+            memory_counters (Optional[MemoryCounters], optional): Counters of the memory report. Defaults to None.
 
         Returns:
             List["TrackedObject"]: Updated list of all tracked objects after state changes.
@@ -446,13 +987,21 @@ class ReidProcessor:
         )
         for current_object in tracked_objects:
             if current_object.state == reid_constants.STATES.FILTERED_OUTPUT:
+                if event_log is not None:
+                    event_log.record_transition(
+                        current_object, current_object.state, reid_constants.STATES.CANDIDATE
+                    )
                 current_object.state = reid_constants.STATES.CANDIDATE
+                if memory_counters is not None:
+                    memory_counters.move(current_object, reid_constants.STATES.FILTERED_OUTPUT)
         return all_tracked_objects
 
     @staticmethod
     def _correct_reid_chains(
         all_tracked_objects: List["TrackedObject"],
         current_tracker_ids: List[Union[int, float]],
+        event_log: Optional[EventLog] = None,
+        memory_counters: Optional[MemoryCounters] = None,
     ) -> List["TrackedObject"]:
         """
         Corrects the reid chains to prevent duplicates when an object reappears with a corrected id.
@@ -468,6 +1017,8 @@ class ReidProcessor:
         Args:
             all_tracked_objects (List["TrackedObject"]): List of all objects being tracked.
             current_tracker_ids (List[Union[int, float]]): The current tracker IDs.
+            event_log (Optional[EventLog], optional): Log of the cuts and state transitions. Defaults to None.
+            memory_counters (Optional[MemoryCounters], optional): Counters of the memory report. Defaults to None.
 
         Returns:
             List["TrackedObject"]: The corrected tracked objects.
@@ -478,18 +1029,39 @@ class ReidProcessor:
         for current_object in to_correct:
             tracked_id = all_tracked_objects[all_tracked_objects.index(current_object)]
             all_tracked_objects.remove(tracked_id)
+            if memory_counters is not None:
+                memory_counters.remove(tracked_id)
             new_object, tracked_id = tracked_id.cut(current_object)
+            if event_log is not None:
+                event_log.record(event_types.CUT, tracked_id.object_id, new_object.object_id)
+                event_log.record_transition(
+                    tracked_id, tracked_id.state, reid_constants.STATES.STABLE
+                )
 
             tracked_id.state = reid_constants.STATES.STABLE
             all_tracked_objects.append(tracked_id)
+            if memory_counters is not None:
+                memory_counters.add(tracked_id)
 
             if new_object in current_tracker_ids:
+                if event_log is not None:
+                    event_log.record_transition(
+                        new_object, new_object.state, reid_constants.STATES.CANDIDATE
+                    )
                 new_object.state = reid_constants.STATES.CANDIDATE
                 all_tracked_objects.append(new_object)
+                if memory_counters is not None:
+                    memory_counters.add(new_object)
 
             elif new_object.nb_corrections > 1:
+                if event_log is not None:
+                    event_log.record_transition(
+                        new_object, new_object.state, reid_constants.STATES.SWITCHER
+                    )
                 new_object.state = reid_constants.STATES.SWITCHER
                 all_tracked_objects.append(new_object)
+                if memory_counters is not None:
+                    memory_counters.add(new_object)
 
         return all_tracked_objects
 
@@ -497,6 +1069,9 @@ class ReidProcessor:
     def _process_matches(
         all_tracked_objects: List["TrackedObject"],
         matches: Dict["TrackedObject", "TrackedObject"],
+        event_log: Optional[EventLog] = None,
+        costs: Optional[List[float]] = None,
+        memory_counters: Optional[MemoryCounters] = None,
     ) -> List["TrackedObject"]:
         """
         Processes the matches.
@@ -504,14 +1079,34 @@ class ReidProcessor:
         Args:
             all_tracked_objects (List["TrackedObject"]): List of all objects being tracked.
             matches (Dict["TrackedObject", "TrackedObject"]): The matches.
+            event_log (Optional[EventLog], optional): Log of the merges and state transitions. Defaults to None.
+            costs (Optional[List[float]], optional): The assignment cost of each match, for the event log.
+                Defaults to None.
+            memory_counters (Optional[MemoryCounters], optional): Counters of the memory report. Defaults to None.
 
         Returns:
             List["TrackedObject"]: The processed tracked objects.
         """
-        for match in matches:
+        for match_idx, match in enumerate(matches):
             candidate_match, switcher_match = match.popitem()
+            previous_state = switcher_match.state
+            if memory_counters is not None:
+                memory_counters.remove(candidate_match)
+                memory_counters.remove(switcher_match)
             switcher_match.merge(candidate_match)
             switcher_match.state = reid_constants.STATES.STABLE
+            if memory_counters is not None:
+                memory_counters.add(switcher_match)
+            if event_log is not None:
+                event_log.record(
+                    event_types.MERGE,
+                    switcher_match.object_id,
+                    candidate_match.object_id,
+                    cost=costs[match_idx] if costs else float("nan"),
+                )
+                event_log.record_transition(
+                    switcher_match, previous_state, reid_constants.STATES.STABLE
+                )
             all_tracked_objects.remove(candidate_match)
 
         return all_tracked_objects
@@ -522,6 +1117,9 @@ class ReidProcessor:
         current_frame_tracked_objects: Set["TrackedObject"],
         max_frames_to_rematch: int,
         frame_id: int,
+        timestamp: Optional[float] = None,
+        event_log: Optional[EventLog] = None,
+        memory_counters: Optional[MemoryCounters] = None,
     ) -> List["TrackedObject"]:
         """
         Updates the state of switchers in the list of all tracked objects:
@@ -532,8 +1130,11 @@ class ReidProcessor:
         Args:
             all_tracked_objects (List["TrackedObject"]): List of all objects being tracked.
             current_frame_tracked_objects (Set["TrackedObject"]): Set of currently tracked objects.
-            max_frames_to_rematch (int): Maximum number of frames to rematch.
+            max_frames_to_rematch (int): Maximum number of frames to rematch, or seconds if a timestamp is given.
             frame_id (int): Current frame id.
+            timestamp (Optional[float], optional): Current timestamp, if thresholds are in seconds.
+            event_log (Optional[EventLog], optional): Log of the state transitions. Defaults to None.
+            memory_counters (Optional[MemoryCounters], optional): Counters of the memory report. Defaults to None.
 
         Returns:
             List["TrackedObject"]: Updated list of all tracked objects after state changes.
@@ -545,15 +1146,31 @@ class ReidProcessor:
 
         for switcher in switchers:
             if switcher in switchers_to_drop:
-                switcher.state = reid_constants.STATES.STABLE
-            elif switcher.get_nb_frames_since_last_appearance(frame_id) > max_frames_to_rematch:
-                switcher.state = reid_constants.STATES.LOST_FOREVER
+                new_state = reid_constants.STATES.STABLE
+            elif (
+                switcher.get_nb_frames_since_last_appearance(frame_id, timestamp=timestamp)
+                > max_frames_to_rematch
+            ):
+                new_state = reid_constants.STATES.LOST_FOREVER
+            else:
+                continue
+            if event_log is not None:
+                event_log.record_transition(switcher, switcher.state, new_state)
+            previous_state = switcher.state
+            switcher.state = new_state
+            if memory_counters is not None:
+                memory_counters.move(switcher, previous_state)
 
         return all_tracked_objects
 
     @staticmethod
     def _update_candidates_states(
-        all_tracked_objects: List["TrackedObject"], max_attempt_to_match: int, frame_id: int
+        all_tracked_objects: List["TrackedObject"],
+        max_attempt_to_match: int,
+        frame_id: int,
+        timestamp: Optional[float] = None,
+        event_log: Optional[EventLog] = None,
+        memory_counters: Optional[MemoryCounters] = None,
     ) -> List["TrackedObject"]:
         """
         Updates the state of candidates in the list of all tracked objects.
@@ -562,8 +1179,11 @@ class ReidProcessor:
 
         Args:
             all_tracked_objects (List["TrackedObject"]): List of all objects being tracked.
-            max_attempt_to_match (int): Maximum attempt to match a candidate.
+            max_attempt_to_match (int): Maximum attempt to match a candidate, or seconds if a timestamp is given.
             frame_id (int): Current frame id.
+            timestamp (Optional[float], optional): Current timestamp, if thresholds are in seconds.
+            event_log (Optional[EventLog], optional): Log of the state transitions. Defaults to None.
+            memory_counters (Optional[MemoryCounters], optional): Counters of the memory report. Defaults to None.
 
         Returns:
             List["TrackedObject"]: Updated list of all tracked objects after state changes.
@@ -575,45 +1195,74 @@ class ReidProcessor:
         )
 
         for candidate in candidates:
-            if candidate.get_age(frame_id) >= max_attempt_to_match:
+            if candidate.get_age(frame_id, timestamp=timestamp) >= max_attempt_to_match:
+                if event_log is not None:
+                    event_log.record_transition(
+                        candidate, candidate.state, reid_constants.STATES.STABLE
+                    )
                 candidate.state = reid_constants.STATES.STABLE
+                if memory_counters is not None:
+                    memory_counters.move(candidate, reid_constants.STATES.CANDIDATE)
         return all_tracked_objects
 
-    def _postprocess(
+    def _get_stable_objects(
         self,
         current_tracker_ids: List[Union[int, float]],
-    ) -> np.ndarray:
+    ) -> List[TrackedObject]:
         """
-        Postprocesses the current tracker IDs.
-        It selects the stable TrackedObjects, and formats their datas in the output
-        to match requirements.
+        Selects the stable TrackedObjects present in the current frame, in the order of all_tracked_objects.
 
         Args:
             current_tracker_ids (List[Union[int, float]]): The current tracker IDs.
 
         Returns:
-            np.ndarray: The postprocessed output.
+            List[TrackedObject]: The stable objects to output.
         """
+        current_objects = set(
+            self._tracked_objects_by_id[tracker_id] for tracker_id in current_tracker_ids
+        )
         stable_objects = [
             obj
             for obj in self.all_tracked_objects
-            if obj.get_state() == reid_constants.STATES.STABLE and obj in current_tracker_ids
+            if obj.get_state() == reid_constants.STATES.STABLE and obj in current_objects
         ]
+        return stable_objects
 
-        reid_output = np.zeros((len(stable_objects), self.nb_output_cols))
+    def _format_output(self, stable_objects: List[TrackedObject]) -> np.ndarray:
+        """
+        Postprocesses the stable TrackedObjects of the current frame, and formats their datas in the output
+        to match requirements. The output is filled column by column, with a single assignment per variable.
 
-        for idx, stable_object in enumerate(stable_objects):
-            for required_variable in output_data_positions.model_json_schema()["properties"].keys():
-                output = (
-                    self.frame_id
-                    if required_variable == "frame_id"
-                    else getattr(stable_object, required_variable, None)
-                )
-                if output is None:
-                    raise NameError(
-                        f"Attribute {required_variable} not in TrackedObject. Check your required output names."
-                    )
-                reid_output[idx, getattr(output_data_positions, required_variable)] = output
+        Args:
+            stable_objects (List[TrackedObject]): The stable objects to output.
+
+        Returns:
+            np.ndarray: The postprocessed output, a float64 array or a structured array depending on output_format.
+            Empty with an emission lag, as the rows of the current frame are formatted once they are emitted.
+        """
+        if self.emission_lag is not None:
+            stable_objects = []
+
+        if self.output_format == "structured":
+            reid_output = np.zeros(len(stable_objects), dtype=self.output_dtype)
+        else:
+            reid_output = np.zeros((len(stable_objects), self.nb_output_cols))
+
+        if not stable_objects:
+            return reid_output
+
+        for required_variable, positions in self._output_columns:
+            if required_variable == "frame_id":
+                output = self.frame_id
+            else:
+                output = [
+                    getattr(stable_object, required_variable) for stable_object in stable_objects
+                ]
+
+            if self.output_format == "structured":
+                reid_output[required_variable] = output
+            else:
+                reid_output[:, positions] = output
 
         return reid_output
 
@@ -625,6 +1274,8 @@ class ReidProcessor:
             file_path (str): The path to the txt file.
             reid_output (np.ndarray): The output of _post_process.
         """
+        if reid_output.dtype.names is not None:
+            reid_output = structured_to_unstructured(reid_output, dtype=float)
         with open(file_path, "a") as f:  # noqa: PTH123
             for row in reid_output:
                 line = " ".join(
@@ -644,6 +1295,153 @@ class ReidProcessor:
             data[tracked_object.object_id] = tracked_object.to_dict()
         return data
 
+    def memory_report(self) -> Dict:
+        """
+        Estimates the memory used by the processor, in bytes.
+
+        Estimates are computed from counters of the tracked objects, tracker ids and class count entries of
+        each state, maintained as objects change (see trackreid.memory), so that the report does not walk the
+        tracked objects and is cheap enough to be polled regularly, e.g. to drive eviction or alerting.
+
+        Returns:
+            Dict: A report with the following keys:
+                - total_bytes: The total estimate.
+                - by_state: The number of objects and bytes of the objects in each state.
+                - by_component: The bytes of the tracked objects, of their re-id chains, of their metadata,
+                of the indexes of the processor, of the last output and of the matcher caches.
+                - longest_chains: The object id, number of tracker ids and bytes of the longest re-id chains.
+        """
+        unit_sizes = get_unit_sizes(
+            num_classes=self.num_classes,
+            velocity_smoothing=self.velocity_smoothing,
+            trajectory_capacity=self.trajectory_capacity,
+        )
+
+        by_state = {}
+        by_component = {"objects": 0, "chains": 0, "metadata": 0}
+        for state, (nb_objects, nb_ids, nb_class_entries) in self._memory_counters.counters.items():
+            components = {
+                "objects": nb_objects * unit_sizes["object"],
+                "chains": nb_objects * unit_sizes["chain"] + nb_ids * unit_sizes["chain_node"],
+                "metadata": nb_objects * unit_sizes["metadata"]
+                + nb_class_entries * unit_sizes["class_entry"],
+            }
+            by_state[STATE_NAMES[state]] = {
+                "objects": nb_objects,
+                "bytes": sum(components.values()),
+            }
+            for component, nbytes in components.items():
+                by_component[component] += nbytes
+
+        by_component["indexes"] = (
+            getsizeof(self.all_tracked_objects)
+            + getsizeof(self._tracked_objects_by_id)
+            + getsizeof(self.last_frame_tracked_objects)
+            + getsizeof(self._steady_objects)
+            + getsizeof(self._steady_output_objects)
+            + getsizeof(self._export_signatures)
+            + getsizeof(self._tracker_id_first_frames)
+        )
+        by_component["output_buffers"] = self._last_output_nbytes + sum(
+            tracker_output.nbytes for _, tracker_output in self._pending_frames
+        )
+        by_component["matcher_caches"] = self.matcher.cache_nbytes
+
+        longest_chains = [
+            {
+                "object_id": object_id,
+                "nb_ids": nb_ids,
+                "bytes": unit_sizes["object"]
+                + unit_sizes["chain"]
+                + nb_ids * unit_sizes["chain_node"]
+                + unit_sizes["metadata"],
+            }
+            for nb_ids, object_id in self._memory_counters.get_longest_chains()
+        ]
+
+        return {
+            "total_bytes": sum(by_component.values()),
+            "by_state": by_state,
+            "by_component": by_component,
+            "longest_chains": longest_chains,
+        }
+
+    def iter_jsonl(self, only_changed: bool = False) -> Iterator[str]:
+        """
+        Streams the tracked objects as compact JSON lines, one TrackedObject.to_dict per line, without building
+        the whole state in memory.
+
+        Each export records a signature (state, number of tracker ids and metadata version) of the exported
+        objects. With only_changed, only the objects whose signature changed since the previous export are
+        streamed, and objects exported previously but no longer tracked, e.g. merged into another object by a
+        re-identification, are streamed as tombstones {"object_id": ..., "removed": true}. Periodic exports
+        then serialize only the delta.
+
+        Args:
+            only_changed (bool, optional): Whether to stream only the objects that changed since the previous
+                export. Defaults to False.
+
+        Yields:
+            str: A JSON line, without trailing newline.
+        """
+        # the signatures are only recorded once the export is complete, so that an export stopped early is
+        # entirely streamed again by the next one
+        previous_signatures = self._export_signatures
+        signatures = {}
+
+        for tracked_object in self.all_tracked_objects:
+            object_id = tracked_object.object_id
+            signature = (
+                tracked_object.state,
+                tracked_object.nb_ids,
+                tracked_object.metadata.version,
+            )
+            signatures[object_id] = signature
+            if only_changed and previous_signatures.get(object_id) == signature:
+                continue
+            yield json.dumps(tracked_object.to_dict(), separators=(",", ":"))
+
+        if only_changed:
+            for object_id in previous_signatures.keys() - signatures.keys():
+                yield json.dumps(
+                    {"object_id": float(object_id), "removed": True}, separators=(",", ":")
+                )
+
+        self._export_signatures = signatures
+
+    def export_id_mapping(self) -> IdMapping:
+        """
+        Flattens the re-id chains of the tracked objects into a mapping from tracker ids to corrected object ids,
+        sorted by tracker id, with the frame range each tracker id designates its object in. The mapping can
+        relabel raw tracker outputs, or any per-detection data keyed by tracker id, in a single vectorized pass,
+        see trackreid.id_mapping.
+
+        Returns:
+            IdMapping: The mapping of all the tracker ids seen since the last reset.
+        """
+        return IdMapping.from_tracked_objects(
+            self.all_tracked_objects, tracker_id_first_frames=self._tracker_id_first_frames
+        )
+
+    def export_jsonl(self, file_path: str, only_changed: bool = False) -> int:
+        """
+        Appends the tracked objects to a JSON lines file, see iter_jsonl.
+
+        Args:
+            file_path (str): The path to the JSON lines file.
+            only_changed (bool, optional): Whether to export only the objects that changed since the previous
+                export. Defaults to False.
+
+        Returns:
+            int: The number of exported lines.
+        """
+        nb_lines = 0
+        with open(file_path, "a") as f:  # noqa: PTH123
+            for line in self.iter_jsonl(only_changed=only_changed):
+                f.write(line + "\n")
+                nb_lines += 1
+        return nb_lines
+
     @staticmethod
     def print_input_data_format_requirements():
         """
@@ -663,7 +1461,9 @@ class ReidProcessor:
         the sixth column represents the category of the detected object, and the seventh column represents
         the confidence score of the detection.
         """
-        input_schema = input_data_positions.model_json_schema()
+        from trackreid.configs.schemas import InputDataPositions
+
+        input_schema = InputDataPositions.model_json_schema()
 
         print("Input Data Format Requirements:")
         for name, properties in input_schema["properties"].items():
@@ -686,7 +1486,9 @@ class ReidProcessor:
         | 2            | 2             | 0            | 50,60,120,80 | 0.54         | 0.60              | 2                |
 
         """  # noqa: E501
-        output_schema = output_data_positions.model_json_schema()
+        from trackreid.configs.schemas import OutputDataPositions
+
+        output_schema = OutputDataPositions.model_json_schema()
 
         print("\nOutput Data Format:")
         for name, properties in output_schema["properties"].items():
@@ -0,0 +1,253 @@
+"""
+Ingest stage reordering frames delivered out of order before they reach a ReidProcessor.
+
+ReidProcessor.update must be called with increasing frame ids. When detection and tracking run in parallel
+upstream stages, frames may arrive out of order: the ReorderBuffer buffers submitted frames in a bounded min-heap
+keyed by frame id, and feeds them to the processor in order as soon as the next expected frame is available.
+
+A missing frame is waited for until the buffer is full, or until a buffered frame has waited for longer than the
+timeout. The missing frames are then given up, according to the gap policy: with "empty", an empty tracker output
+is processed for each missing frame, so that consumers receive one output per frame id; with "skip", missing
+frames are not processed at all. Frames submitted after their frame id was released or given up are dropped.
+
+Example:
+    reorder_buffer = ReorderBuffer(reid_processor, max_size=32, timeout=0.5, start_frame_id=0)
+
+    for frame_id, tracker_output in detector_results:  # in any order
+        for released_frame_id, reid_output in reorder_buffer.submit(frame_id, tracker_output):
+            ...
+    for released_frame_id, reid_output in reorder_buffer.flush():
+        ...
+"""
+import heapq
+import threading
+import time
+from itertools import count
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from trackreid.reid_processor import ReidProcessor
+
+GAP_POLICIES = ("empty", "skip")
+
+
+class ReorderBuffer:
+    """
+    Reorders frames submitted out of order before processing them with a ReidProcessor. See the module
+    documentation. Methods are thread safe, so frames can be submitted from several upstream workers.
+
+    Args:
+        reid_processor (ReidProcessor): The processor fed with the frames, in order.
+        max_size (int, optional): Maximum number of buffered frames. When a frame is submitted to a full buffer,
+            the frames missing before the first buffered frame are given up. Defaults to 64.
+        timeout (Optional[float], optional): Maximum time in seconds a buffered frame waits for the frames before
+            it, None to wait until the buffer is full. Defaults to None.
+        gap_policy (str, optional): "empty" to process an empty tracker output for each missing frame, or "skip"
+            to skip missing frames. Defaults to "empty".
+        start_frame_id (Optional[int], optional): The first expected frame id. If None, the frame id of the first
+            submitted frame. Defaults to None.
+        frame_step (int, optional): The step between consecutive frame ids, e.g. 3 if only every third frame is
+            processed. Defaults to 1.
+        clock (Callable[[], float], optional): The clock measuring waiting times, in seconds.
+            Defaults to time.monotonic.
+    """
+
+    def __init__(
+        self,
+        reid_processor: ReidProcessor,
+        max_size: int = 64,
+        timeout: Optional[float] = None,
+        gap_policy: str = "empty",
+        start_frame_id: Optional[int] = None,
+        frame_step: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if gap_policy not in GAP_POLICIES:
+            raise ValueError(f"Unknown gap policy {gap_policy}, use one of {GAP_POLICIES}.")
+        if max_size < 1:
+            raise ValueError(f"max_size must be a positive integer, got {max_size}.")
+        self.reid_processor = reid_processor
+        self.max_size = max_size
+        self.timeout = timeout
+        self.gap_policy = gap_policy
+        self.frame_step = frame_step
+        self.clock = clock
+
+        self.next_frame_id = start_frame_id
+        self._heap: List[Tuple[int, int, np.ndarray, Optional[float], float]] = []
+        self._buffered_frame_ids = set()
+        self._submission_order = count()
+        self._last_timestamp: Optional[float] = None
+        self._lock = threading.Lock()
+        self.stats = {
+            "submitted_frames": 0,
+            "released_frames": 0,
+            "late_frames": 0,
+            "duplicate_frames": 0,
+            "missing_frames": 0,
+            "timeouts": 0,
+            "max_reorder_depth": 0,
+            "max_buffered_frames": 0,
+        }
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def submit(
+        self, frame_id: int, tracker_output: np.ndarray, timestamp: Optional[float] = None
+    ) -> List[Tuple[int, np.ndarray]]:
+        """
+        Submits a frame, and processes the frames that can be released in order.
+
+        The reorder depth of a frame is the number of frames it arrived ahead of the next expected frame.
+
+        Args:
+            frame_id (int): The frame id.
+            tracker_output (np.ndarray): The tracker output of the frame.
+            timestamp (Optional[float], optional): The timestamp of the frame, passed to ReidProcessor.update.
+                Defaults to None.
+
+        Returns:
+            List[Tuple[int, np.ndarray]]: The (frame id, processed output) of the released frames, in order.
+        """
+        with self._lock:
+            self.stats["submitted_frames"] += 1
+            if self.next_frame_id is None:
+                self.next_frame_id = frame_id
+
+            if frame_id < self.next_frame_id:
+                self.stats["late_frames"] += 1
+            elif frame_id in self._buffered_frame_ids:
+                self.stats["duplicate_frames"] += 1
+            else:
+                depth = (frame_id - self.next_frame_id) // self.frame_step
+                self.stats["max_reorder_depth"] = max(self.stats["max_reorder_depth"], depth)
+                heapq.heappush(
+                    self._heap,
+                    (
+                        frame_id,
+                        next(self._submission_order),
+                        tracker_output,
+                        timestamp,
+                        self.clock(),
+                    ),
+                )
+                self._buffered_frame_ids.add(frame_id)
+                self.stats["max_buffered_frames"] = max(
+                    self.stats["max_buffered_frames"], len(self._heap)
+                )
+            return self._release()
+
+    def poll(self) -> List[Tuple[int, np.ndarray]]:
+        """
+        Releases the frames whose missing predecessors timed out, without submitting a frame.
+
+        Returns:
+            List[Tuple[int, np.ndarray]]: The (frame id, processed output) of the released frames, in order.
+        """
+        with self._lock:
+            return self._release()
+
+    def flush(self) -> List[Tuple[int, np.ndarray]]:
+        """
+        Releases all the buffered frames, giving up the missing ones, e.g. at the end of a stream.
+
+        Returns:
+            List[Tuple[int, np.ndarray]]: The (frame id, processed output) of the released frames, in order.
+        """
+        with self._lock:
+            return self._release(flush=True)
+
+    def _release(self, flush: bool = False) -> List[Tuple[int, np.ndarray]]:
+        """
+        Processes the buffered frames in order, up to the first missing frame that is still waited for.
+
+        Args:
+            flush (bool, optional): Whether to give up all the missing frames. Defaults to False.
+
+        Returns:
+            List[Tuple[int, np.ndarray]]: The (frame id, processed output) of the released frames, in order.
+        """
+        released = []
+        while self._heap:
+            frame_id = self._heap[0][0]
+            if frame_id > self.next_frame_id:
+                if not flush and not self._give_up_missing_frames():
+                    break
+                released.extend(self._skip_missing_frames(until_frame_id=frame_id))
+
+            frame_id, _, tracker_output, timestamp, _ = heapq.heappop(self._heap)
+            self._buffered_frame_ids.discard(frame_id)
+            released.append((frame_id, self._process(tracker_output, frame_id, timestamp)))
+            self.next_frame_id = frame_id + self.frame_step
+        return released
+
+    def _give_up_missing_frames(self) -> bool:
+        """
+        Whether the frames missing before the first buffered frame should be given up: the buffer is full, or a
+        buffered frame timed out.
+        """
+        if len(self._heap) >= self.max_size:
+            return True
+        if self.timeout is not None:
+            oldest_arrival = min(arrival for *_, arrival in self._heap)
+            if self.clock() - oldest_arrival >= self.timeout:
+                self.stats["timeouts"] += 1
+                return True
+        return False
+
+    def _skip_missing_frames(self, until_frame_id: int) -> List[Tuple[int, np.ndarray]]:
+        """
+        Gives up the frames missing before until_frame_id, according to the gap policy.
+
+        Args:
+            until_frame_id (int): The first buffered frame id.
+
+        Returns:
+            List[Tuple[int, np.ndarray]]: The (frame id, processed output) of the missing frames with the "empty"
+            policy, else an empty list.
+        """
+        missing_frame_ids = range(self.next_frame_id, until_frame_id, self.frame_step)
+        self.stats["missing_frames"] += len(missing_frame_ids)
+        self.next_frame_id = until_frame_id
+        if self.gap_policy == "skip":
+            return []
+
+        # missing frames are timestamped by interpolation, for processors with thresholds in seconds
+        next_timestamp = self._heap[0][3]
+        released = []
+        for index, missing_frame_id in enumerate(missing_frame_ids):
+            timestamp = next_timestamp
+            if self._last_timestamp is not None and next_timestamp is not None:
+                weight = (index + 1) / (len(missing_frame_ids) + 1)
+                timestamp = self._last_timestamp + weight * (next_timestamp - self._last_timestamp)
+            empty_output = np.zeros((0, 0))
+            released.append(
+                (missing_frame_id, self._process(empty_output, missing_frame_id, timestamp))
+            )
+        return released
+
+    def _process(
+        self, tracker_output: np.ndarray, frame_id: int, timestamp: Optional[float]
+    ) -> np.ndarray:
+        output = self.reid_processor.update(tracker_output, frame_id, timestamp=timestamp)
+        if timestamp is not None:
+            self._last_timestamp = timestamp
+        self.stats["released_frames"] += 1
+        return output
+
+    @property
+    def buffered_frame_ids(self) -> List[int]:
+        """
+        The ids of the buffered frames, in order.
+        """
+        return sorted(self._buffered_frame_ids)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Returns the counters of the buffer: submitted, released, late (dropped), duplicate (dropped) and missing
+        frames, timeouts, maximum reorder depth and maximum number of buffered frames.
+        """
+        with self._lock:
+            return dict(self.stats)
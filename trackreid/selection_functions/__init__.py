@@ -1 +1,4 @@
-from .select_by_category import select_by_category  # noqa: F401
+from .select_by_category import (  # noqa: F401
+    select_by_category,
+    select_by_category_batched,
+)
@@ -1,6 +1,13 @@
+from operator import attrgetter
+from typing import List
+
+import numpy as np
+
 from trackreid.tracked_object import TrackedObject
+from trackreid.utils import batched, cache_key
 
 
+@cache_key(attrgetter("category"))
 def select_by_category(candidate: TrackedObject, switcher: TrackedObject) -> int:
     """
     Compares the categories of two TrackedObject instances.
@@ -16,3 +23,25 @@ def select_by_category(candidate: TrackedObject, switcher: TrackedObject) -> int
     """
     # Compare the categories of the two objects
     return 1 if candidate.category == switcher.category else 0
+
+
+@batched
+@cache_key(attrgetter("category"))
+def select_by_category_batched(
+    candidates: List[TrackedObject], switchers: List[TrackedObject]
+) -> np.ndarray:
+    """
+    Batched version of select_by_category, comparing the categories of all pairs of candidates
+    and switchers at once.
+
+    Args:
+        candidates (List[TrackedObject]): The M candidates.
+        switchers (List[TrackedObject]): The N switchers.
+
+    Returns:
+        np.ndarray: A [N, M] array, 1 where the categories of the switcher (row) and the candidate (column)
+        are the same, otherwise 0.
+    """
+    candidates_categories = np.array([candidate.category for candidate in candidates])
+    switchers_categories = np.array([switcher.category for switcher in switchers])
+    return (switchers_categories[:, None] == candidates_categories[None, :]).astype(int)
@@ -0,0 +1,458 @@
+"""
+Re-identification as a local service shared by several tracker processes.
+
+The ReidServer listens on a Unix domain socket (address given as a path) or on a TCP port (address given as a
+(host, port) tuple), and keeps one ReidProcessor per stream, identified by a stream id chosen by the clients.
+Any connection may send frames of any stream, and several requests may be sent on a connection before reading
+the responses.
+
+Requests received while the server is busy are processed together in a batch, in their order of arrival, so the
+frames of a stream are always processed in order. Each response carries the corrected output, along with the time
+the request waited in the queue and the time spent in ReidProcessor.update.
+
+Messages are framed in binary, little endian:
+    request: header (request id u64, kind u8, frame id i64, stream id length u16, nb rows u32, nb cols u32),
+        followed by the utf-8 stream id and the float64 tracker output.
+    response: header (request id u64, status u8, nb rows u32, nb cols u32, message length u32, queue time f64,
+        process time f64), followed by the float64 output, or the utf-8 error message if the status is not OK.
+
+Example:
+    python -m trackreid.server --unix-socket /tmp/reid.sock --filter-confidence-threshold 0.1 \
+        --filter-time-threshold 5 --max-frames-to-rematch 500 --max-attempt-to-match 5
+
+    client = ReidClient("/tmp/reid.sock")
+    corrected_output = client.update("camera_1", tracker_output, frame_id)
+"""
+import argparse
+import asyncio
+import socket
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from trackreid import cost_functions, selection_functions
+from trackreid.cli import (
+    add_processor_arguments,
+    get_processor_kwargs,
+    resolve_function,
+)
+from trackreid.metrics import HttpExporter, ReidMetrics, TextfileExporter
+from trackreid.reid_processor import ReidProcessor
+
+Address = Union[str, Tuple[str, int]]
+
+REQUEST_HEADER = struct.Struct("<QBqHII")
+RESPONSE_HEADER = struct.Struct("<QBIIIdd")
+
+UPDATE, CLOSE_STREAM = 0, 1
+STATUS_OK, STATUS_ERROR = 0, 1
+
+
+@dataclass
+class Request:
+    request_id: int
+    kind: int
+    frame_id: int
+    stream_id: str
+    tracker_output: np.ndarray
+    writer: asyncio.StreamWriter
+    received_time: float
+
+
+def encode_request(
+    request_id: int, kind: int, stream_id: str, tracker_output: np.ndarray, frame_id: int
+) -> bytes:
+    """
+    Encodes a request, see the module documentation for the framing.
+    """
+    tracker_output = np.ascontiguousarray(tracker_output, dtype=np.float64)
+    if tracker_output.ndim == 1:  # single detection, as accepted by ReidProcessor.update
+        tracker_output = tracker_output.reshape(1, -1) if tracker_output.size else np.zeros((0, 0))
+    encoded_stream_id = stream_id.encode()
+    header = REQUEST_HEADER.pack(
+        request_id, kind, frame_id, len(encoded_stream_id), *tracker_output.shape
+    )
+    return header + encoded_stream_id + tracker_output.tobytes()
+
+
+def encode_response(
+    request_id: int,
+    output: Optional[np.ndarray],
+    queue_time: float,
+    process_time: float,
+    error: Optional[str] = None,
+) -> bytes:
+    """
+    Encodes a response, see the module documentation for the framing.
+    """
+    if error is not None:
+        message = error.encode()
+        header = RESPONSE_HEADER.pack(
+            request_id, STATUS_ERROR, 0, 0, len(message), queue_time, process_time
+        )
+        return header + message
+    output = np.ascontiguousarray(output, dtype=np.float64)
+    if output.ndim != 2:
+        output = output.reshape(1, -1) if output.size else np.zeros((0, 0))
+    header = RESPONSE_HEADER.pack(request_id, STATUS_OK, *output.shape, 0, queue_time, process_time)
+    return header + output.tobytes()
+
+
+class ReidServer:
+    """
+    Serves the re-identification process of many streams, each with its own ReidProcessor.
+
+    Args:
+        address (Address): Path of the Unix domain socket, or (host, port) of the TCP socket.
+        processor_kwargs (Dict): Parameters of the ReidProcessor of each stream. Only the "array" output format
+            is supported, and metrics are given with the metrics argument.
+        max_batch_size (int, optional): Maximum number of requests processed in a batch. Defaults to 256.
+        metrics (Optional[ReidMetrics], optional): If provided, metrics shared by the processors of all the
+            streams, with gauges of the number of streams and of the depth of the request queue.
+            Defaults to None.
+    """
+
+    def __init__(
+        self,
+        address: Address,
+        processor_kwargs: Dict,
+        max_batch_size: int = 256,
+        metrics: Optional[ReidMetrics] = None,
+    ) -> None:
+        if processor_kwargs.get("output_format", "array") != "array":
+            raise ValueError("ReidServer only supports the 'array' output format.")
+        if "metrics" in processor_kwargs:
+            raise ValueError(
+                "Give the metrics of ReidServer with its metrics argument, not in processor_kwargs."
+            )
+        self.address = address
+        self.processor_kwargs = processor_kwargs
+        self.max_batch_size = max_batch_size
+
+        self.processors: Dict[str, ReidProcessor] = {}
+        self.stats = {"nb_requests": 0, "nb_batches": 0, "max_batch_size": 0}
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._server = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        # processors are only used from this thread, so that the event loop keeps reading requests
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+        self.metrics = metrics
+        if metrics is not None:
+            metrics.add_gauge(
+                "trackreid_server_streams",
+                "Streams with a processor.",
+                lambda: len(self.processors),
+            )
+            metrics.add_gauge(
+                "trackreid_server_queue_depth",
+                "Requests waiting to be processed.",
+                lambda: self._queue.qsize() if self._queue is not None else 0,
+            )
+
+    async def serve(self, started: Optional[threading.Event] = None) -> None:
+        """
+        Serves requests until the task is cancelled.
+
+        Args:
+            started (Optional[threading.Event], optional): Set once the server is listening. Defaults to None.
+        """
+        self._queue = asyncio.Queue()
+        if isinstance(self.address, str):
+            self._server = await asyncio.start_unix_server(
+                self._handle_connection, path=self.address
+            )
+        else:
+            host, port = self.address
+            self._server = await asyncio.start_server(self._handle_connection, host=host, port=port)
+            # resolve port 0 to the port actually bound
+            self.address = self._server.sockets[0].getsockname()[:2]
+        if started is not None:
+            started.set()
+
+        batcher = asyncio.ensure_future(self._process_batches())
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            batcher.cancel()
+
+    def start(self) -> "ReidServer":
+        """
+        Starts serving in a background thread, and returns once the server is listening.
+        """
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._serve_task = self._loop.create_task(self.serve(started))
+            try:
+                self._loop.run_until_complete(self._serve_task)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._loop.close()
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+        started.wait()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops a server started with start.
+        """
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._serve_task.cancel)
+            self._thread.join()
+            self._thread = None
+        self._executor.shutdown()
+        if isinstance(self.address, str):
+            Path(self.address).unlink(missing_ok=True)
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                header = await reader.readexactly(REQUEST_HEADER.size)
+                (
+                    request_id,
+                    kind,
+                    frame_id,
+                    stream_id_length,
+                    nb_rows,
+                    nb_cols,
+                ) = REQUEST_HEADER.unpack(header)
+                stream_id = (await reader.readexactly(stream_id_length)).decode()
+                data = await reader.readexactly(nb_rows * nb_cols * 8)
+                tracker_output = np.frombuffer(data, dtype=np.float64).reshape(nb_rows, nb_cols)
+                await self._queue.put(
+                    Request(
+                        request_id=request_id,
+                        kind=kind,
+                        frame_id=frame_id,
+                        stream_id=stream_id,
+                        tracker_output=tracker_output,
+                        writer=writer,
+                        received_time=time.perf_counter(),
+                    )
+                )
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    async def _process_batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            responses = await loop.run_in_executor(self._executor, self._process_batch, batch)
+            writers = set()
+            for request, response in zip(batch, responses):
+                if not request.writer.is_closing():
+                    request.writer.write(response)
+                    writers.add(request.writer)
+            for writer in writers:
+                try:
+                    await writer.drain()
+                except ConnectionError:
+                    writer.close()
+
+            self.stats["nb_requests"] += len(batch)
+            self.stats["nb_batches"] += 1
+            self.stats["max_batch_size"] = max(self.stats["max_batch_size"], len(batch))
+
+    def _process_batch(self, batch: List[Request]) -> List[bytes]:
+        start = time.perf_counter()
+        responses = []
+        for request in batch:
+            request_start = time.perf_counter()
+            queue_time = start - request.received_time
+            try:
+                output = self._process_request(request)
+                error = None
+            except Exception as exception:  # noqa: BLE001
+                output, error = None, f"{type(exception).__name__}: {exception}"
+            responses.append(
+                encode_response(
+                    request.request_id,
+                    output,
+                    queue_time=queue_time,
+                    process_time=time.perf_counter() - request_start,
+                    error=error,
+                )
+            )
+        return responses
+
+    def _process_request(self, request: Request) -> np.ndarray:
+        if request.kind == CLOSE_STREAM:
+            self.processors.pop(request.stream_id, None)
+            return np.zeros((0, 0))
+        if request.kind != UPDATE:
+            raise ValueError(f"Unknown request kind {request.kind}.")
+
+        reid_processor = self.processors.get(request.stream_id)
+        if reid_processor is None:
+            reid_processor = ReidProcessor(**self.processor_kwargs, metrics=self.metrics)
+            self.processors[request.stream_id] = reid_processor
+        return reid_processor.update(request.tracker_output, request.frame_id)
+
+
+class ReidClient:
+    """
+    Blocking client of a ReidServer.
+
+    After each request, last_stats holds the queue and process times reported by the server, and the round trip
+    time measured by the client, in seconds.
+
+    Args:
+        address (Address): Path of the Unix domain socket, or (host, port) of the TCP socket.
+    """
+
+    def __init__(self, address: Address) -> None:
+        if isinstance(address, str):
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.socket.connect(address)
+        self.last_stats: Dict[str, float] = {}
+        self._next_request_id = 0
+
+    def close(self) -> None:
+        self.socket.close()
+
+    def __enter__(self) -> "ReidClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def update(self, stream_id: str, tracker_output: np.ndarray, frame_id: int) -> np.ndarray:
+        """
+        Runs ReidProcessor.update on the server, for the given stream.
+
+        Args:
+            stream_id (str): The stream id. A processor is created for unknown stream ids.
+            tracker_output (np.ndarray): The tracker output.
+            frame_id (int): The frame id.
+
+        Returns:
+            np.ndarray: The processed output.
+        """
+        return self._request(UPDATE, stream_id, tracker_output, frame_id)
+
+    def close_stream(self, stream_id: str) -> None:
+        """
+        Deletes the processor of a stream on the server.
+        """
+        self._request(CLOSE_STREAM, stream_id, np.zeros((0, 0)), 0)
+
+    def _request(
+        self, kind: int, stream_id: str, tracker_output: np.ndarray, frame_id: int
+    ) -> np.ndarray:
+        start = time.perf_counter()
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        self.socket.sendall(encode_request(request_id, kind, stream_id, tracker_output, frame_id))
+
+        header = self._receive(RESPONSE_HEADER.size)
+        (
+            response_id,
+            status,
+            nb_rows,
+            nb_cols,
+            message_length,
+            queue_time,
+            process_time,
+        ) = RESPONSE_HEADER.unpack(header)
+        if status != STATUS_OK:
+            raise RuntimeError(f"ReidServer error: {self._receive(message_length).decode()}")
+        output = np.frombuffer(self._receive(nb_rows * nb_cols * 8), dtype=np.float64)
+        if response_id != request_id:
+            raise RuntimeError(f"Response {response_id} received for request {request_id}.")
+
+        self.last_stats = {
+            "queue_time": queue_time,
+            "process_time": process_time,
+            "round_trip_time": time.perf_counter() - start,
+        }
+        return output.reshape(nb_rows, nb_cols)
+
+    def _receive(self, size: int) -> bytes:
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        while view:
+            nb_bytes = self.socket.recv_into(view)
+            if not nb_bytes:
+                raise ConnectionError("Connection closed by the ReidServer.")
+            view = view[nb_bytes:]
+        return bytes(buffer)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m trackreid.server",
+        description="Serve the re-identification process over a local socket.",
+    )
+    address = parser.add_mutually_exclusive_group(required=True)
+    address.add_argument("--unix-socket", help="Path of the Unix domain socket.")
+    address.add_argument("--port", type=int, help="TCP port, on --host.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument(
+        "--metrics-port", type=int, help="Serve Prometheus metrics on this port, on --host."
+    )
+    parser.add_argument("--metrics-textfile", help="Write Prometheus metrics to this file.")
+    add_processor_arguments(parser)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    processor_kwargs = get_processor_kwargs(args)
+    processor_kwargs["cost_function"] = resolve_function(args.cost_function, cost_functions)
+    processor_kwargs["selection_function"] = resolve_function(
+        args.selection_function, selection_functions
+    )
+    address = args.unix_socket if args.unix_socket else (args.host, args.port)
+
+    metrics, exporters = None, []
+    if args.metrics_port is not None or args.metrics_textfile:
+        metrics = ReidMetrics()
+        if args.metrics_port is not None:
+            exporters.append(HttpExporter(metrics, host=args.host, port=args.metrics_port))
+        if args.metrics_textfile:
+            exporters.append(TextfileExporter(metrics, args.metrics_textfile))
+
+    server = ReidServer(
+        address, processor_kwargs, max_batch_size=args.max_batch_size, metrics=metrics
+    )
+    print(f"Serving on {address}.", file=sys.stderr)
+    for exporter in exporters:
+        exporter.start()
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for exporter in exporters:
+            exporter.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
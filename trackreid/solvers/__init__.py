@@ -0,0 +1,36 @@
+from typing import Callable, Union
+
+from .auction import auction_solver  # noqa: F401
+from .auto import auto_solver  # noqa: F401
+from .greedy import greedy_solver  # noqa: F401
+from .jv import jv_solver  # noqa: F401
+from .trivial import trivial_solver  # noqa: F401
+
+SOLVERS = {
+    "jv": jv_solver,
+    "greedy": greedy_solver,
+    "auction": auction_solver,
+    "trivial": trivial_solver,
+    "auto": auto_solver,
+}
+
+
+def get_solver(solver: Union[str, Callable]) -> Callable:
+    """
+    Returns an assignment solver from its name, one of "jv", "greedy", "auction", "trivial" or "auto".
+
+    A solver is a function taking a [N, M] cost matrix, with one row per switcher and one column per candidate,
+    and a cost limit above which pairs are not matched, and returning the row and column indexes of the matched
+    pairs, sorted by column. Custom solvers with this signature can be given instead of a name.
+
+    Args:
+        solver (Union[str, Callable]): The solver name, or a solver.
+
+    Returns:
+        Callable: The solver.
+    """
+    if callable(solver):
+        return solver
+    if solver not in SOLVERS:
+        raise ValueError(f"Unknown solver {solver}, use one of {list(SOLVERS)} or a callable.")
+    return SOLVERS[solver]
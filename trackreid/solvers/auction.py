@@ -0,0 +1,140 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from trackreid.solvers.greedy import greedy_solver
+
+# factor by which epsilon decreases between two phases of the auction
+EPSILON_SCALING = 5.0
+
+
+def auction_solver(
+    cost_matrix: np.ndarray,
+    cost_limit: float,
+    epsilon: Optional[float] = None,
+    max_iterations: int = 10_000,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solves the assignment with the auction algorithm, with epsilon scaling and simultaneous (Jacobi) bidding of all
+    unassigned bidders, so that each bidding round is a vectorized pass on the matrix.
+
+    Bidders are the rows, or the columns if there are fewer columns than rows, and objects the other dimension.
+    As with the extended cost of the Jonker-Volgenant solver, leaving a row and a column unassigned costs the cost
+    limit, so the benefit of a pair is the cost limit minus its cost, and each bidder has a private outside option
+    of zero benefit, which it keeps once the prices make it its best option. Each phase of the auction assigns all
+    bidders with a given epsilon, starting from a fifth of the range of the allowed costs and divided by
+    EPSILON_SCALING after each phase. Prices are kept across phases, lowered so that assigned bidders still prefer
+    their object to their outside option, and reset for objects left unassigned. Bidders and objects left
+    unassigned by the last phase are finally matched greedily.
+
+    On square problems where all pairs are allowed, the total cost of the assignment is within the number of
+    bidders times the final epsilon of the optimal one. Otherwise, the auction is an approximate solver, whose
+    cost grows with the matrix size rather than cubically in the worst case.
+
+    Args:
+        cost_matrix (np.ndarray): A [N, M] cost matrix, with one row per switcher and one column per candidate.
+        cost_limit (float): Pairs whose cost is above the cost limit are not matched.
+        epsilon (Optional[float], optional): The final epsilon. Defaults to None, i.e. 1e-6 times the range of
+            the allowed costs divided by the number of bidders.
+        max_iterations (int, optional): Maximum number of bidding rounds of a phase, after which the bidders
+            still unassigned are left unassigned. Defaults to 10000.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row and column indexes of the matched pairs, sorted by column.
+    """
+    transposed = cost_matrix.shape[0] > cost_matrix.shape[1]
+    costs = cost_matrix.T if transposed else cost_matrix
+    allowed = costs < cost_limit
+    if not allowed.any():
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+    benefits = np.where(allowed, cost_limit - np.where(allowed, costs, 0), -np.inf)
+    nb_bidders, nb_objects = benefits.shape
+    cost_range = max(np.ptp(costs[allowed]), 1e-6)
+    final_epsilon = epsilon if epsilon is not None else 1e-6 * cost_range / nb_bidders
+    current_epsilon = max(cost_range / EPSILON_SCALING, final_epsilon)
+
+    prices = np.zeros(nb_objects)
+    while True:
+        bidder_objects, prices = _run_auction_phase(
+            benefits, prices, current_epsilon, max_iterations
+        )
+        if current_epsilon <= final_epsilon:
+            break
+        # assigned bidders should still prefer their object to their outside option in the next phase
+        bidders = np.flatnonzero(bidder_objects >= 0)
+        objects = bidder_objects[bidders]
+        unassigned = np.ones(nb_objects, dtype=bool)
+        unassigned[objects] = False
+        prices[objects] = np.minimum(prices[objects], benefits[bidders, objects])
+        prices[unassigned] = 0.0
+        current_epsilon = max(current_epsilon / EPSILON_SCALING, final_epsilon)
+
+    # pairs of bidders and objects both left unassigned are matched greedily, each such match lowering the cost
+    free_bidders = np.flatnonzero(bidder_objects < 0)
+    free_objects = np.setdiff1d(np.arange(nb_objects), bidder_objects)
+    if free_bidders.size and free_objects.size:
+        free_rows, free_columns = greedy_solver(
+            costs[np.ix_(free_bidders, free_objects)], cost_limit
+        )
+        bidder_objects[free_bidders[free_rows]] = free_objects[free_columns]
+
+    bidders = np.flatnonzero(bidder_objects >= 0)
+    objects = bidder_objects[bidders]
+    rows, columns = (objects, bidders) if transposed else (bidders, objects)
+    order = np.argsort(columns)
+    return rows[order], columns[order]
+
+
+def _run_auction_phase(
+    benefits: np.ndarray, prices: np.ndarray, epsilon: float, max_iterations: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs a phase of the auction from scratch with the given prices, until every bidder is assigned or keeps its
+    outside option.
+
+    Args:
+        benefits (np.ndarray): The [bidders, objects] benefits, -inf for disallowed pairs.
+        prices (np.ndarray): The prices of the objects at the start of the phase.
+        epsilon (float): The minimal bid increment.
+        max_iterations (int): Maximum number of bidding rounds.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The object of each bidder, -1 if unassigned, and the final prices.
+    """
+    nb_bidders, nb_objects = benefits.shape
+    prices = prices.copy()
+    bidder_objects = np.full(nb_bidders, -1)
+    object_bidders = np.full(nb_objects, -1)
+    outside = np.zeros(nb_bidders, dtype=bool)
+
+    for _ in range(max_iterations):
+        bidders = np.flatnonzero((bidder_objects < 0) & ~outside)
+        if not bidders.size:
+            break
+
+        values = benefits[bidders] - prices
+        best_objects = values.argmax(axis=1)
+        best_values = values[np.arange(bidders.size), best_objects]
+        values[np.arange(bidders.size), best_objects] = -np.inf
+        # the outside option, of zero value, bounds the second best value
+        second_values = np.maximum(values.max(axis=1), 0.0)
+
+        keeps_outside = best_values <= 0
+        outside[bidders[keeps_outside]] = True
+        bidding = ~keeps_outside
+        bidders, best_objects = bidders[bidding], best_objects[bidding]
+        bids = prices[best_objects] + best_values[bidding] - second_values[bidding] + epsilon
+
+        # each object goes to its highest bid
+        order = np.lexsort((-bids, best_objects))
+        won_objects, first_bids = np.unique(best_objects[order], return_index=True)
+        winners = bidders[order][first_bids]
+
+        evicted = object_bidders[won_objects]
+        bidder_objects[evicted[evicted >= 0]] = -1
+        object_bidders[won_objects] = winners
+        bidder_objects[winners] = won_objects
+        prices[won_objects] = bids[order][first_bids]
+
+    return bidder_objects, prices
@@ -0,0 +1,47 @@
+from typing import Tuple
+
+import numpy as np
+
+from trackreid.solvers.auction import auction_solver
+from trackreid.solvers.greedy import greedy_solver
+from trackreid.solvers.jv import jv_solver
+from trackreid.solvers.trivial import trivial_solver
+
+# largest number of rows or columns solved exactly with the Jonker-Volgenant solver
+AUTO_MAX_EXACT_SIZE = 2000
+# fraction of allowed pairs above which larger problems are solved greedily rather than with the auction solver
+AUTO_DENSE_FRACTION = 0.1
+
+
+def auto_solver(cost_matrix: np.ndarray, cost_limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Picks a solver by size and density of the problem:
+        - a single row or column is solved exactly by the trivial solver,
+        - problems without conflicts, where each row and each column has at most one allowed pair, are solved
+        exactly by the greedy solver,
+        - problems of at most AUTO_MAX_EXACT_SIZE rows and columns are solved exactly by the Jonker-Volgenant
+        solver,
+        - larger problems are solved approximately, by the greedy solver if more than AUTO_DENSE_FRACTION of the
+        pairs are allowed, since it then matches nearly as many pairs as the optimal assignment, else by the
+        auction solver, which does not leave pairs unmatched like the greedy solver on sparse problems.
+
+    Args:
+        cost_matrix (np.ndarray): A [N, M] cost matrix, with one row per switcher and one column per candidate.
+        cost_limit (float): Pairs whose cost is above the cost limit are not matched.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row and column indexes of the matched pairs, sorted by column.
+    """
+    if min(cost_matrix.shape) <= 1:
+        return trivial_solver(cost_matrix, cost_limit)
+
+    allowed = cost_matrix < cost_limit
+    if allowed.sum(axis=0).max() <= 1 and allowed.sum(axis=1).max() <= 1:
+        return greedy_solver(cost_matrix, cost_limit)
+
+    if max(cost_matrix.shape) <= AUTO_MAX_EXACT_SIZE:
+        return jv_solver(cost_matrix, cost_limit)
+
+    if allowed.mean() > AUTO_DENSE_FRACTION:
+        return greedy_solver(cost_matrix, cost_limit)
+    return auction_solver(cost_matrix, cost_limit)
@@ -0,0 +1,49 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def greedy_solver(cost_matrix: np.ndarray, cost_limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solves the assignment greedily: allowed pairs are matched by increasing cost, skipping the pairs whose row or
+    column is already matched. The assignment is not optimal, but costs a few vectorized passes on the matrix.
+
+    The greedy assignment is computed by rounds of mutual nearest pairs: a pair whose cost is the lowest of both
+    its row and its column is matched by the greedy assignment whatever the other pairs, so all the mutual nearest
+    pairs of the remaining rows and columns are matched at once in each round. Ties are broken by row then column
+    index, as with a stable sort of the pairs.
+
+    Args:
+        cost_matrix (np.ndarray): A [N, M] cost matrix, with one row per switcher and one column per candidate.
+        cost_limit (float): Pairs whose cost is above the cost limit are not matched.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row and column indexes of the matched pairs, sorted by column.
+    """
+    costs = np.where(cost_matrix < cost_limit, cost_matrix, np.inf)
+    matched_rows, matched_columns = [], []
+    rows, columns = np.arange(costs.shape[0]), np.arange(costs.shape[1])
+    while rows.size and columns.size:
+        row_argmins = costs.argmin(axis=1)
+        row_mins = costs[np.arange(rows.size), row_argmins]
+        column_argmins = costs.argmin(axis=0)
+        mutual = np.flatnonzero(
+            (column_argmins[row_argmins] == np.arange(rows.size)) & np.isfinite(row_mins)
+        )
+        if not mutual.size:
+            break
+        matched_rows.append(rows[mutual])
+        matched_columns.append(columns[row_argmins[mutual]])
+
+        kept_rows = np.ones(rows.size, dtype=bool)
+        kept_rows[mutual] = False
+        kept_columns = np.ones(columns.size, dtype=bool)
+        kept_columns[row_argmins[mutual]] = False
+        rows, columns = rows[kept_rows], columns[kept_columns]
+        costs = costs[np.ix_(kept_rows, kept_columns)]
+
+    if not matched_rows:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    matched_rows, matched_columns = np.concatenate(matched_rows), np.concatenate(matched_columns)
+    order = np.argsort(matched_columns)
+    return matched_rows[order], matched_columns[order]
@@ -0,0 +1,24 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def jv_solver(cost_matrix: np.ndarray, cost_limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solves the assignment exactly with the Jonker-Volgenant algorithm. The cost matrix is extended so that rows
+    and columns can stay unassigned, at half the cost limit each, so that pairs whose cost is above the cost limit
+    are never matched.
+
+    Args:
+        cost_matrix (np.ndarray): A [N, M] cost matrix, with one row per switcher and one column per candidate.
+        cost_limit (float): Pairs whose cost is above the cost limit are not matched.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row and column indexes of the matched pairs, sorted by column.
+    """
+    # lap is imported on the first assignment, to keep importing trackreid lightweight
+    import lap
+
+    _, _, column_rows = lap.lapjv(cost_matrix, extend_cost=True, cost_limit=cost_limit)
+    columns = np.flatnonzero(column_rows >= 0)
+    return column_rows[columns], columns
@@ -0,0 +1,31 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def trivial_solver(cost_matrix: np.ndarray, cost_limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Solves the assignment of a single switcher or a single candidate exactly, by matching it with its lowest cost
+    counterpart, ties being broken by index.
+
+    Args:
+        cost_matrix (np.ndarray): A [1, M] or [N, 1] cost matrix, with one row per switcher and one column per
+            candidate.
+        cost_limit (float): Pairs whose cost is above the cost limit are not matched.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The row and column indexes of the matched pairs, sorted by column.
+
+    Raises:
+        ValueError: If the cost matrix has more than one row and more than one column.
+    """
+    if min(cost_matrix.shape) > 1:
+        raise ValueError(
+            f"The trivial solver only solves 1xM or Nx1 problems, got {cost_matrix.shape}."
+        )
+    if not cost_matrix.size:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    best = np.unravel_index(np.argmin(cost_matrix), cost_matrix.shape)
+    if cost_matrix[best] >= cost_limit:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    return np.array([best[0]]), np.array([best[1]])
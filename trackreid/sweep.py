@@ -0,0 +1,279 @@
+"""
+Parallel hyperparameter sweeps of ReidProcessor over a single tracker log.
+
+The tracker log is parsed and split by frame once, and stored in a shared memory block: its rows sorted by frame,
+the frame ids and the offset of each frame. Workers of a process pool attach to the block once, when they start,
+and run a ReidProcessor for each parameter combination over read-only views of the frames, without copying or
+parsing the log again, so that sweeps are bound by the re-identification itself.
+
+Each run reports its parameters, summary statistics of the processor (nb_corrections, mean_nb_corrections,
+nb_tracker_ids, number of output rows, processing time) and, if ground truth is given, the metrics of
+trackreid.evaluation, as one row of a table, i.e. a list of dictionaries which can be loaded with
+pandas.DataFrame.
+
+Example:
+    results = run_sweep(
+        "tracker_log.txt",
+        param_grid={"max_frames_to_rematch": [50, 100, 200], "max_attempt_to_match": [3, 5]},
+        base_kwargs={"filter_confidence_threshold": 0.1, "filter_time_threshold": 5},
+        ground_truth=ground_truth,
+    )
+    best = max(results, key=lambda row: row["idf1"])
+"""
+import itertools
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from trackreid.evaluation import evaluate
+from trackreid.reid_processor import ReidProcessor
+from trackreid.tracker_log import process_tracker_log, split_tracker_log
+
+# number of int64 values of the header of the shared block: number of rows, of columns and of frames
+HEADER_SIZE = 3
+
+
+def get_parameter_grid(param_grid: Dict[str, Sequence]) -> List[Dict]:
+    """
+    Lists all the combinations of a grid of parameters, in the order of itertools.product.
+
+    Args:
+        param_grid (Dict[str, Sequence]): The values of each parameter.
+
+    Returns:
+        List[Dict]: The parameters of each combination.
+    """
+    names = list(param_grid)
+    return [dict(zip(names, values)) for values in itertools.product(*param_grid.values())]
+
+
+class SharedTrackerLog:
+    """
+    Tracker log split by frame, in a shared memory block. See the module documentation.
+
+    Use SharedTrackerLog.create in one process, then SharedTrackerLog.attach with the same name in the others.
+
+    Args:
+        shm (shared_memory.SharedMemory): The shared memory block.
+        owner (bool): Whether this instance created the block, and unlinks it on close.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool = False) -> None:
+        self.shm = shm
+        self.owner = owner
+        nb_rows, nb_cols, nb_frames = (
+            int(value) for value in np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)
+        )
+        offset = HEADER_SIZE * 8
+        self.frame_ids = np.ndarray((nb_frames,), dtype=np.int64, buffer=shm.buf, offset=offset)
+        offset += nb_frames * 8
+        self.frame_offsets = np.ndarray(
+            (nb_frames + 1,), dtype=np.int64, buffer=shm.buf, offset=offset
+        )
+        offset += (nb_frames + 1) * 8
+        self.rows = np.ndarray((nb_rows, nb_cols), dtype=np.float64, buffer=shm.buf, offset=offset)
+        if not owner:
+            for array in (self.frame_ids, self.frame_offsets, self.rows):
+                array.flags.writeable = False
+
+    @classmethod
+    def create(cls, tracker_log: np.ndarray, name: Optional[str] = None) -> "SharedTrackerLog":
+        """
+        Splits a tracker log by frame into a new shared memory block.
+
+        Args:
+            tracker_log (np.ndarray): The tracker log, whose first column is the frame id, followed by the columns
+                of the tracker output expected by ReidProcessor.update.
+            name (Optional[str], optional): The name of the shared memory block, None for a random name.
+                Defaults to None.
+
+        Returns:
+            SharedTrackerLog: The shared tracker log, which unlinks the block on close.
+        """
+        frame_ids, frame_tracker_outputs = split_tracker_log(tracker_log)
+        nb_cols = tracker_log.shape[1] - 1 if tracker_log.size else 0
+        frame_offsets = np.concatenate(
+            [[0], np.cumsum([len(tracker_output) for tracker_output in frame_tracker_outputs])]
+        ).astype(np.int64)
+        nb_rows = int(frame_offsets[-1])
+
+        size = 8 * (HEADER_SIZE + 2 * len(frame_ids) + 1 + nb_rows * nb_cols)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        np.ndarray((HEADER_SIZE,), dtype=np.int64, buffer=shm.buf)[:] = [
+            nb_rows,
+            nb_cols,
+            len(frame_ids),
+        ]
+        shared_log = cls(shm, owner=True)
+        shared_log.frame_ids[:] = frame_ids
+        shared_log.frame_offsets[:] = frame_offsets
+        if nb_rows:
+            shared_log.rows[:] = np.concatenate(frame_tracker_outputs)
+        return shared_log
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedTrackerLog":
+        """
+        Attaches to a shared tracker log created by another process, as read-only views.
+
+        Args:
+            name (str): The name of the shared memory block.
+
+        Returns:
+            SharedTrackerLog: The shared tracker log.
+        """
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    def get_frames(self) -> Tuple[np.ndarray, List[np.ndarray]]:
+        """
+        Returns the frame ids, and views of the tracker output of each frame, as split_tracker_log.
+        """
+        return self.frame_ids, [
+            self.rows[start:end]
+            for start, end in zip(self.frame_offsets[:-1], self.frame_offsets[1:])
+        ]
+
+    def close(self) -> None:
+        """
+        Releases the views of the shared memory, and unlinks it if this instance created it.
+        """
+        del self.frame_ids, self.frame_offsets, self.rows
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+# state of a sweep worker, set once when the worker starts
+_worker_state: Dict = {}
+
+
+def _init_worker(
+    shared_log_name: Optional[str],
+    base_kwargs: Dict,
+    ground_truth: Optional[np.ndarray],
+    evaluation_kwargs: Dict,
+    return_outputs: bool,
+    shared_log: Optional[SharedTrackerLog] = None,
+) -> None:
+    if shared_log is None:
+        shared_log = SharedTrackerLog.attach(shared_log_name)
+    frame_ids, frame_tracker_outputs = shared_log.get_frames()
+    _worker_state.update(
+        shared_log=shared_log,
+        frame_ids=frame_ids,
+        frame_tracker_outputs=frame_tracker_outputs,
+        base_kwargs=base_kwargs,
+        ground_truth=ground_truth,
+        evaluation_kwargs=evaluation_kwargs,
+        return_outputs=return_outputs,
+    )
+
+
+def _run_parameters(parameters: Dict) -> Dict:
+    """
+    Runs a ReidProcessor with the given parameters over the frames of the worker, and summarizes the run.
+    """
+    processor_kwargs = {**_worker_state["base_kwargs"], **parameters, "save_to_txt": False}
+    reid_processor = ReidProcessor(**processor_kwargs)
+
+    start = time.perf_counter()
+    outputs = process_tracker_log(
+        reid_processor, _worker_state["frame_ids"], _worker_state["frame_tracker_outputs"]
+    )
+    processing_time = time.perf_counter() - start
+    outputs = [output for output in outputs if output.size]
+    if outputs:
+        reid_output = np.concatenate(outputs)
+    elif reid_processor.output_format == "structured":
+        reid_output = np.zeros(0, dtype=reid_processor.output_dtype)
+    else:
+        reid_output = np.zeros((0, reid_processor.nb_output_cols))
+
+    row = {
+        **parameters,
+        "nb_corrections": reid_processor.nb_corrections,
+        "mean_nb_corrections": reid_processor.mean_nb_corrections,
+        "nb_tracker_ids": reid_processor.nb_tracker_ids,
+        "nb_output_rows": len(reid_output),
+        "processing_time": processing_time,
+    }
+    if _worker_state["ground_truth"] is not None:
+        row.update(
+            evaluate(
+                reid_output, _worker_state["ground_truth"], **_worker_state["evaluation_kwargs"]
+            )
+        )
+    if _worker_state["return_outputs"]:
+        row["outputs"] = reid_output
+    return row
+
+
+def run_sweep(
+    tracker_log: Union[np.ndarray, str, Path],
+    param_grid: Union[Dict[str, Sequence], List[Dict]],
+    base_kwargs: Optional[Dict] = None,
+    ground_truth: Optional[np.ndarray] = None,
+    evaluation_kwargs: Optional[Dict] = None,
+    return_outputs: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[Dict]:
+    """
+    Runs a ReidProcessor over a tracker log for each combination of parameters, in parallel, see the module
+    documentation.
+
+    Args:
+        tracker_log (Union[np.ndarray, str, Path]): The tracker log, or the path of a text tracker log.
+        param_grid (Union[Dict[str, Sequence], List[Dict]]): The values of each swept parameter, whose
+            combinations are listed with get_parameter_grid, or the list of parameter combinations.
+        base_kwargs (Optional[Dict], optional): The ReidProcessor parameters shared by all runs, overridden by
+            the swept parameters. Cost and selection functions must be picklable, i.e. defined at module level,
+            when max_workers is not 1. Defaults to None.
+        ground_truth (Optional[np.ndarray], optional): Ground truth to evaluate each run with
+            trackreid.evaluation.evaluate. Defaults to None.
+        evaluation_kwargs (Optional[Dict], optional): Keyword arguments of evaluate, e.g. iou_threshold.
+            Defaults to None.
+        return_outputs (bool, optional): Whether to add the concatenated output of each run to its row, under
+            "outputs". Defaults to False.
+        max_workers (Optional[int], optional): Number of worker processes. Runs are executed in the current
+            process if set to 1. Defaults to None, i.e. the number of processors.
+
+    Returns:
+        List[Dict]: One row per parameter combination, in order, with the parameters, the summary statistics
+        and the metrics of the run.
+    """
+    if isinstance(tracker_log, (str, Path)):
+        tracker_log = np.loadtxt(tracker_log, ndmin=2)
+    if isinstance(param_grid, dict):
+        param_grid = get_parameter_grid(param_grid)
+    worker_args = (
+        base_kwargs or {},
+        ground_truth,
+        evaluation_kwargs or {},
+        return_outputs,
+    )
+
+    shared_log = SharedTrackerLog.create(tracker_log)
+    try:
+        if max_workers == 1:
+            _init_worker(shared_log.name, *worker_args, shared_log=shared_log)
+            try:
+                return [_run_parameters(parameters) for parameters in param_grid]
+            finally:
+                _worker_state.clear()
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(shared_log.name, *worker_args),
+        ) as executor:
+            return list(executor.map(_run_parameters, param_grid))
+    finally:
+        shared_log.close()
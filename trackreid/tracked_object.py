@@ -45,6 +45,7 @@ class TrackedObject:
         state (int): The current state of the object.
         metadata (Union[np.ndarray, TrackedObjectMetaData]): The metadata for the object. It can be either a TrackedObjectMetaData object, or a data line, i.e. output of detection model. If metadata is initialized with a TrackedObjectMetaData object, a frame_id must be given.
         frame_id (Optional[int], optional): The frame ID where the object was first seen. Defaults to None.
+        **metadata_kwargs: Options forwarded to TrackedObjectMetaData when metadata is a data line, e.g. num_classes.
 
     Raises:
         NameError: If the type of object_ids or metadata is unrecognized.
@@ -56,6 +57,7 @@ class TrackedObject:
         state: int,
         metadata: Union[np.ndarray, TrackedObjectMetaData],
         frame_id: Optional[int] = None,
+        **metadata_kwargs,
     ):
         self.state = state
 
@@ -69,7 +71,7 @@ class TrackedObject:
             assert (
                 frame_id is not None
             ), "Please provide a frame_id for TrackedObject initialization"
-            self.metadata = TrackedObjectMetaData(metadata, frame_id)
+            self.metadata = TrackedObjectMetaData(metadata, frame_id, **metadata_kwargs)
         elif isinstance(metadata, TrackedObjectMetaData):
             self.metadata = metadata.copy()
         else:
@@ -109,7 +111,7 @@ class TrackedObject:
         """
         Returns the category with the maximum count in the class_counts dictionary of the metadata.
         """
-        return max(self.metadata.class_counts, key=self.metadata.class_counts.get)
+        return self.metadata.category
 
     @property
     def confidence(self):
@@ -153,44 +155,54 @@ class TrackedObject:
         """
         return self.nb_ids - 1
 
-    def get_percentage_of_time_seen(self, frame_id: int):
+    def get_percentage_of_time_seen(self, frame_id: int, timestamp: Optional[float] = None):
         """
-        Calculates and returns the percentage of time the tracked object has been seen up to the given frame id.
+        Calculates and returns the percentage of time the tracked object has been seen up to the given frame id,
+        or up to the given timestamp if observations are timestamped.
 
         Args:
             frame_id (int): The current frame id.
+            timestamp (Optional[float], optional): The current timestamp, in seconds. Defaults to None.
 
         Returns:
             float: The percentage of time the tracked object has been seen.
         """
-        return self.metadata.percentage_of_time_seen(frame_id=frame_id)
+        return self.metadata.percentage_of_time_seen(frame_id=frame_id, timestamp=timestamp)
 
-    def get_age(self, frame_id: int):
+    def get_age(self, frame_id: int, timestamp: Optional[float] = None):
         """
         Calculates and returns the age of the tracked object based on the given frame id.
         Age is defined as the difference between the current frame id and the first frame id where
-        the object was detected.
+        the object was detected. If a timestamp is given, the age is the time elapsed since the first
+        observation, in seconds, or the frame-based age if the object was never observed with a timestamp.
 
         Args:
             frame_id (int): The current frame id.
+            timestamp (Optional[float], optional): The current timestamp, in seconds. Defaults to None.
 
         Returns:
-            int: The age of the tracked object based on the given frame id.
+            Union[int, float]: The age of the tracked object based on the given frame id, or timestamp.
         """
+        if timestamp is not None and self.metadata.first_timestamp is not None:
+            return timestamp - self.metadata.first_timestamp
         return frame_id - self.metadata.first_frame_id
 
-    def get_nb_frames_since_last_appearance(self, frame_id: int):
+    def get_nb_frames_since_last_appearance(self, frame_id: int, timestamp: Optional[float] = None):
         """
         Calculates and returns the number of frames since the last appearance of the tracked object.
         This is computed as the difference between the current frame id and the last frame id where
-        the object was detected.
+        the object was detected. If a timestamp is given, the time elapsed since the last observation
+        is returned instead, in seconds, unless the object was never observed with a timestamp.
 
         Args:
             frame_id (int): The current frame id.
+            timestamp (Optional[float], optional): The current timestamp, in seconds. Defaults to None.
 
         Returns:
-            int: The number of frames since the last appearance of the tracked object.
+            Union[int, float]: The number of frames, or the time, since the last appearance of the tracked object.
         """
+        if timestamp is not None and self.metadata.last_timestamp is not None:
+            return timestamp - self.metadata.last_timestamp
         return frame_id - self.metadata.last_frame_id
 
     def get_state(self):
@@ -211,7 +223,13 @@ class TrackedObject:
     def __str__(self):
         return f"{self.__repr__()}, metadata : {self.metadata}"
 
-    def update_metadata(self, data_line: np.ndarray, frame_id: int):
+    def update_metadata(
+        self,
+        data_line: np.ndarray,
+        frame_id: int,
+        timestamp: Optional[float] = None,
+        previous_frame_timestamp: Optional[float] = None,
+    ):
         """
         Updates the metadata of the tracked object based on new detection data.
 
@@ -223,8 +241,17 @@ class TrackedObject:
             data_line (np.ndarray): The detection data for a single frame. It contains information such as the class name, bounding box coordinates, and confidence level of the detection.
 
             frame_id (int): The frame id where the object was detected. This is used to update the last frame id of the tracked object.
+
+            timestamp (Optional[float]): The timestamp of the frame, in seconds, if observations are timestamped.
+
+            previous_frame_timestamp (Optional[float]): The timestamp of the previous processed frame of the stream.
         """  # noqa: E501
-        self.metadata.update(data_line=data_line, frame_id=frame_id)
+        self.metadata.update(
+            data_line=data_line,
+            frame_id=frame_id,
+            timestamp=timestamp,
+            previous_frame_timestamp=previous_frame_timestamp,
+        )
 
     def __eq__(self, other):
         if isinstance(other, (float, int)):
@@ -259,8 +286,12 @@ class TrackedObject:
         new_object = TrackedObject(
             state=reid_constants.STATES.STABLE, object_ids=after, metadata=self.metadata
         )
-        # set potential age 0 for new object
+        # set potential age 0 for new object, and keep only the matching part of its trajectory
         new_object.metadata.first_frame_id = new_object.metadata.last_frame_id
+        if new_object.metadata.last_timestamp is not None:
+            new_object.metadata.first_timestamp = new_object.metadata.last_timestamp
+            new_object.metadata.time_seen = 0.0
+        new_object.metadata.truncate_trajectory(new_object.metadata.first_frame_id)
         return new_object, self
 
     def to_dict(self):
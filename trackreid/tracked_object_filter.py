@@ -1,3 +1,5 @@
+from typing import Union
+
 from trackreid.configs.reid_constants import reid_constants
 from trackreid.tracked_object import TrackedObject
 
@@ -9,12 +11,26 @@ class TrackedObjectFilter:
 
     Args:
         confidence_threshold (float): The minimum mean confidence level required for a tracked object to be considered valid.
-        frames_seen_threshold (int): The minimum number of frames a tracked object must be observed in to be considered valid.
+        frames_seen_threshold (Union[int, float]): The minimum number of frames a tracked object must be observed in to be considered valid, or with time_unit "seconds", the minimum time it must be observed continuously, in seconds.
+        time_unit (str, optional): "frames" or "seconds", the unit of frames_seen_threshold. Defaults to "frames".
     """  # noqa: E501
 
-    def __init__(self, confidence_threshold: float, frames_seen_threshold: int):
+    def __init__(
+        self,
+        confidence_threshold: float,
+        frames_seen_threshold: Union[int, float],
+        time_unit: str = "frames",
+    ):
+        if time_unit not in ("frames", "seconds"):
+            raise ValueError(f"Unknown time unit {time_unit}, use 'frames' or 'seconds'.")
         self.confidence_threshold = confidence_threshold
         self.frames_seen_threshold = frames_seen_threshold
+        self.time_unit = time_unit
+
+    def _is_seen_enough(self, tracked_object: TrackedObject) -> bool:
+        if self.time_unit == "seconds":
+            return tracked_object.metadata.time_seen >= self.frames_seen_threshold
+        return tracked_object.metadata.observations >= self.frames_seen_threshold
 
     def update(self, tracked_object: TrackedObject):
         """
@@ -22,8 +38,8 @@ class TrackedObjectFilter:
         and the number of frames it has been observed in.
 
         If the tracked object's state is TRACKER_OUTPUT, and its mean confidence is greater than the
-        confidence_threshold, and it has been observed in more frames than the frames_seen_threshold,
-        its state is updated to FILTERED_OUTPUT.
+        confidence_threshold, and it has been observed in more frames than the frames_seen_threshold
+        (or for longer than frames_seen_threshold seconds), its state is updated to FILTERED_OUTPUT.
 
         If the tracked object's mean confidence is less than the confidence_threshold, its state is
         updated to TRACKER_OUTPUT.
@@ -34,7 +50,7 @@ class TrackedObjectFilter:
         if tracked_object.get_state() == reid_constants.STATES.TRACKER_OUTPUT:
             if (
                 tracked_object.metadata.mean_confidence() > self.confidence_threshold
-                and tracked_object.metadata.observations >= self.frames_seen_threshold
+                and self._is_seen_enough(tracked_object)
             ):
                 tracked_object.state = reid_constants.STATES.FILTERED_OUTPUT
 
@@ -1,4 +1,6 @@
 import json
+from types import MappingProxyType
+from typing import Optional
 
 import numpy as np
 
@@ -13,20 +15,91 @@ class TrackedObjectMetaData:
 
     This metadata is then use in selection and cost functions to compute likelihood of a match between two objects.
 
+    Derived values (the majority category, the mean confidence and the class proportions) are maintained
+    incrementally by update and merge, so reading them in the matching loop is a plain attribute access.
+
+    Class counts are stored in a dictionary keyed by category by default, which supports open-ended category ids.
+    When the set of categories is known and small (e.g. the 80 COCO classes), num_classes can be given to store
+    them in a dense int32 vector instead: merges become a single vector addition, the category an argmax and the
+    class proportions a division.
+
+    When velocity_smoothing is given, a constant-velocity motion model is maintained as well: velocity holds an
+    exponential moving average of the per-frame displacement of each bounding box coordinate, which is used to
+    extrapolate the position of lost objects (see predict_bbox).
+
+    When trajectory_capacity is given, the last trajectory_capacity observations are kept in a ring buffer,
+    a preallocated [trajectory_capacity, 6] array of (frame_id, x, y, w, h, confidence) rows. Appending is O(1)
+    and the recent history is read as a single array (see trajectory), e.g. by trajectory-aware cost functions.
+
+    version is incremented by every update and merge, so that exporters can detect which objects changed
+    since a previous export without comparing their metadata.
+
+    When observations are timestamped, the first and last timestamps are kept as well, along with time_seen, the
+    total duration the object was continuously observed, i.e. the sum of the intervals between its observations
+    on consecutive processed frames. Unlike counts of frames, these durations do not depend on the frame rate of
+    the stream, so that time-based thresholds give the same behaviour on decimated or variable-rate streams.
+    frame_interval is the nominal interval between processed frames, the smallest interval between a frame where
+    the object was observed and the previous processed frame, with which each observation is credited in
+    percentage_of_time_seen.
+
     Usage:
     An instance of TrackedObjectMetaData is created by passing a data_line (which contains the detection data
     for a single frame) and a frame_id (which identifies the frame where the object was detected).
+
+    Args:
+        data_line (np.ndarray): The detection data for a single frame.
+        frame_id (int): The frame id where the object was detected.
+        num_classes (Optional[int], optional): Number of categories, categories being integers in
+            [0, num_classes). If given, class counts are stored in a dense vector. Defaults to None.
+        velocity_smoothing (Optional[float], optional): Smoothing factor in (0, 1] of the velocity moving
+            average, the weight given to the latest displacement. If None, no motion model is maintained.
+            Defaults to None.
+        trajectory_capacity (Optional[int], optional): Number of observations kept in the trajectory ring buffer.
+            If None, no trajectory is kept. Defaults to None.
+        timestamp (Optional[float], optional): The timestamp of the frame, in seconds, if observations are
+            timestamped. Defaults to None.
     """
 
-    def __init__(self, data_line: np.ndarray, frame_id: int):
+    TRAJECTORY_COLUMNS = ("frame_id", "x", "y", "w", "h", "confidence")
+
+    def __init__(
+        self,
+        data_line: np.ndarray,
+        frame_id: int,
+        num_classes: Optional[int] = None,
+        velocity_smoothing: Optional[float] = None,
+        trajectory_capacity: Optional[int] = None,
+        timestamp: Optional[float] = None,
+    ):
         self.first_frame_id = frame_id
-        self.class_counts = {}
+        self.first_timestamp = timestamp
+        self.last_timestamp = None
+        self.time_seen = 0.0
+        self.frame_interval = None
+        self.velocity_smoothing = velocity_smoothing
+        self.velocity = None if velocity_smoothing is None else np.zeros(4)
+        self.num_classes = num_classes
+        if num_classes is None:
+            self.class_counts = {}
+        else:
+            self.class_counts = np.zeros(num_classes, dtype=np.int32)
         self.observations = 0
         self.confidence_sum = 0
         self.confidence = 0
-        self.update(data_line, frame_id)
-
-    def update(self, data_line: np.ndarray, frame_id: int):
+        self.category = None
+        self._mean_confidence = 0.0
+        self._class_proportions = None
+        self.version = 0
+        self._init_trajectory(trajectory_capacity)
+        self.update(data_line, frame_id, timestamp=timestamp)
+
+    def update(
+        self,
+        data_line: np.ndarray,
+        frame_id: int,
+        timestamp: Optional[float] = None,
+        previous_frame_timestamp: Optional[float] = None,
+    ):
         """
         Updates the metadata of a tracked object based on new detection data.
 
@@ -38,23 +111,252 @@ class TrackedObjectMetaData:
             - confidence: Updated to the confidence level from the detection data
             - confidence_sum: Incremented by the confidence level from the detection data
             - observations: Incremented by 1
+            - category: Running argmax of class_counts
+            - velocity: Moving average of the bounding box displacement per frame, if a motion model is maintained
+            - trajectory: The observation is appended, if a trajectory is kept
+            - last_timestamp: Updated to the timestamp of the frame, if given
+            - time_seen: Incremented by the time since the last observation, if the object was also observed on the previous processed frame
+            - frame_interval: Set to the interval since the previous processed frame, if it is smaller
+            - version: Incremented by 1
 
         Args:
             data_line (np.ndarra): The detection data for a single frame. It contains information such as the class name, bounding box coordinates, and confidence level of the detection.
 
             frame_id (int): The frame id where the object was detected. This is used to update the last frame id of the tracked object.
 
+            timestamp (Optional[float]): The timestamp of the frame, in seconds, if observations are timestamped.
+
+            previous_frame_timestamp (Optional[float]): The timestamp of the previous processed frame of the stream, used to know whether the object was observed continuously since its last observation.
+
         """  # noqa: E501
+        class_name = int(data_line[input_data_positions.category])
+        if self.num_classes is not None:
+            self._check_category(class_name)
+
+        if timestamp is not None:
+            self._update_timestamps(timestamp, previous_frame_timestamp)
+
+        if self.velocity_smoothing is not None and self.observations > 0:
+            self._update_velocity(data_line=data_line, frame_id=frame_id)
+
         self.last_frame_id = frame_id
 
-        class_name = int(data_line[input_data_positions.category])
-        self.class_counts[class_name] = self.class_counts.get(class_name, 0) + 1
+        if self.num_classes is None:
+            self.class_counts[class_name] = self.class_counts.get(class_name, 0) + 1
+        else:
+            self.class_counts[class_name] += 1
         self.bbox = list(data_line[input_data_positions.bbox])
         confidence = float(data_line[input_data_positions.confidence])
         self.confidence = confidence
         self.confidence_sum += confidence
         self.observations += 1
 
+        self._update_category(class_name)
+        self._mean_confidence = self.confidence_sum / self.observations
+        self._class_proportions = None
+        if self.trajectory_capacity is not None:
+            self._append_to_trajectory(frame_id)
+        self.version += 1
+
+    def _update_timestamps(self, timestamp: float, previous_frame_timestamp: Optional[float]):
+        """
+        Updates the last timestamp, the frame interval, and the time seen if the object was observed on the
+        previous processed frame.
+
+        Args:
+            timestamp (float): The timestamp of the frame.
+            previous_frame_timestamp (Optional[float]): The timestamp of the previous processed frame.
+        """
+        if previous_frame_timestamp is not None and timestamp > previous_frame_timestamp:
+            frame_interval = timestamp - previous_frame_timestamp
+            if self.frame_interval is None or frame_interval < self.frame_interval:
+                self.frame_interval = frame_interval
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        elif (
+            previous_frame_timestamp is not None and self.last_timestamp == previous_frame_timestamp
+        ):
+            self.time_seen += timestamp - self.last_timestamp
+        self.last_timestamp = timestamp
+
+    def _update_velocity(self, data_line: np.ndarray, frame_id: int):
+        """
+        Updates the velocity moving average with the displacement since the last observation.
+        The first displacement initializes the velocity.
+
+        Args:
+            data_line (np.ndarray): The new detection data, not yet applied to bbox.
+            frame_id (int): The frame id of the new detection.
+        """
+        elapsed_frames = frame_id - self.last_frame_id
+        if elapsed_frames <= 0:
+            return
+        displacement = (
+            np.asarray(data_line[input_data_positions.bbox], dtype=float) - self.bbox
+        ) / elapsed_frames
+        if self.observations == 1:
+            self.velocity = displacement
+        else:
+            self.velocity = (
+                self.velocity_smoothing * displacement
+                + (1 - self.velocity_smoothing) * self.velocity
+            )
+
+    def predict_bbox(self, frame_id: int) -> np.ndarray:
+        """
+        Extrapolates the bounding box at the given frame id with the constant-velocity motion model.
+        Without motion model, or for past frames, the last bounding box is returned.
+
+        Args:
+            frame_id (int): The frame id at which the bounding box is predicted.
+
+        Returns:
+            np.ndarray: The predicted bounding box.
+        """
+        bbox = np.asarray(self.bbox, dtype=float)
+        if self.velocity is None or frame_id <= self.last_frame_id:
+            return bbox
+        return bbox + self.velocity * (frame_id - self.last_frame_id)
+
+    def _check_category(self, class_name: int):
+        """
+        Checks that a category can be counted in the dense class counts vector.
+
+        Args:
+            class_name (int): The category.
+
+        Raises:
+            ValueError: If the category is not in [0, num_classes).
+        """
+        if not 0 <= class_name < self.num_classes:
+            raise ValueError(
+                f"Category {class_name} out of range for num_classes={self.num_classes}."
+            )
+
+    def _init_trajectory(self, trajectory_capacity: Optional[int]):
+        """
+        Allocates an empty trajectory ring buffer, or disables the trajectory if trajectory_capacity is None.
+
+        Args:
+            trajectory_capacity (Optional[int]): Number of observations kept in the ring buffer.
+        """
+        if trajectory_capacity is not None and trajectory_capacity < 1:
+            raise ValueError(
+                f"trajectory_capacity must be a positive integer, got {trajectory_capacity}."
+            )
+        self.trajectory_capacity = trajectory_capacity
+        self._trajectory = (
+            None
+            if trajectory_capacity is None
+            else np.empty((trajectory_capacity, len(self.TRAJECTORY_COLUMNS)))
+        )
+        self._trajectory_head = 0
+        self._trajectory_size = 0
+
+    def _append_to_trajectory(self, frame_id: int):
+        """
+        Appends the last observation to the trajectory ring buffer, overwriting the oldest one if it is full.
+
+        Args:
+            frame_id (int): The frame id of the observation.
+        """
+        row = self._trajectory[self._trajectory_head]
+        row[0] = frame_id
+        row[1:5] = self.bbox
+        row[5] = self.confidence
+        self._trajectory_head = (self._trajectory_head + 1) % self.trajectory_capacity
+        self._trajectory_size = min(self._trajectory_size + 1, self.trajectory_capacity)
+
+    def _set_trajectory(self, trajectory: np.ndarray):
+        """
+        Fills the ring buffer with the last trajectory_capacity rows of a chronological trajectory.
+
+        Args:
+            trajectory (np.ndarray): A [n, 6] chronological trajectory.
+        """
+        trajectory = trajectory[max(len(trajectory) - self.trajectory_capacity, 0) :]
+        self._trajectory[: len(trajectory)] = trajectory
+        self._trajectory_size = len(trajectory)
+        self._trajectory_head = self._trajectory_size % self.trajectory_capacity
+
+    @property
+    def trajectory(self) -> Optional[np.ndarray]:
+        """
+        The recent observations of the object in chronological order, as a [n, 6] array of
+        (frame_id, x, y, w, h, confidence) rows with n <= trajectory_capacity, or None if no trajectory is kept.
+        """
+        if self._trajectory is None:
+            return None
+        if self._trajectory_size < self.trajectory_capacity:
+            return self._trajectory[: self._trajectory_size].copy()
+        return np.roll(self._trajectory, -self._trajectory_head, axis=0)
+
+    def truncate_trajectory(self, first_frame_id: int):
+        """
+        Drops the observations of the trajectory anterior to first_frame_id.
+
+        Args:
+            first_frame_id (int): The frame id of the first observation to keep.
+        """
+        if self._trajectory is not None:
+            trajectory = self.trajectory
+            self._set_trajectory(trajectory[trajectory[:, 0] >= first_frame_id])
+
+    def trajectory_velocity(self) -> Optional[np.ndarray]:
+        """
+        Estimates the mean bounding box displacement per frame over the trajectory.
+
+        Returns:
+            Optional[np.ndarray]: The velocity of (x, y, w, h), zeros if the trajectory spans a single frame,
+            or None if no trajectory is kept.
+        """
+        trajectory = self.trajectory
+        if trajectory is None:
+            return None
+        elapsed_frames = trajectory[-1, 0] - trajectory[0, 0]
+        if elapsed_frames <= 0:
+            return np.zeros(4)
+        return (trajectory[-1, 1:5] - trajectory[0, 1:5]) / elapsed_frames
+
+    def _update_category(self, class_name: int):
+        """
+        Updates the running argmax of class_counts after class_name has been incremented.
+
+        Ties are resolved like max(class_counts, key=class_counts.get), i.e. in favour of the class
+        that was inserted first in class_counts, so the result never depends on the update path.
+        With dense class counts, ties are resolved like np.argmax, in favour of the smallest class.
+
+        Args:
+            class_name (int): The class whose count has just been incremented.
+        """
+        if self.category is None:
+            self.category = class_name
+        elif class_name != self.category:
+            count, best_count = self.class_counts[class_name], self.class_counts[self.category]
+            if count > best_count:
+                self.category = class_name
+            elif count == best_count:
+                if self.num_classes is None:
+                    self.category = max(self.class_counts, key=self.class_counts.get)
+                else:
+                    self.category = min(class_name, self.category)
+
+    def _refresh_derived(self):
+        """
+        Recomputes every derived value from scratch. Used after merges and deserialization.
+        """
+        if self.num_classes is not None:
+            self.category = int(np.argmax(self.class_counts))
+        elif self.class_counts:
+            self.category = max(self.class_counts, key=self.class_counts.get)
+        else:
+            self.category = None
+        if self.observations > 0:
+            self._mean_confidence = self.confidence_sum / self.observations
+        else:
+            self._mean_confidence = 0.0
+        self._class_proportions = None
+
     def merge(self, other_object):
         """
         Merges the metadata of another TrackedObjectMetaData instance into the current one.
@@ -66,27 +368,64 @@ class TrackedObjectMetaData:
             - confidence: Set to the confidence of the other object.
             - bbox: Set to the bounding box of the other object.
             - last_frame_id: Set to the last frame id of the other object.
-            - class_counts: For each class, the count is incremented by the count of the other object.
+            - last_timestamp: Set to the last timestamp of the other object, time_seen incremented by its time
+            seen, and frame_interval set to the smallest frame interval, if observations are timestamped.
+            - class_counts: For each class, the count is incremented by the count of the other object. With dense
+            class counts on both sides, this is a single vector addition.
+            - velocity: Set to the velocity of the other object, if it maintains a motion model.
+            - trajectory: The trajectory of the other object is appended, keeping the last trajectory_capacity
+            observations.
+            - version: Incremented by 1.
 
         Args:
             other_object (TrackedObjectMetaData): The other TrackedObjectMetaData instance whose metadata is to be merged with the current instance.
 
         Raises:
             TypeError: If the other_object is not an instance of TrackedObjectMetaData.
+            ValueError: If a category of the other object is out of range of the dense class counts.
 
         """  # noqa: E501
         if not isinstance(other_object, type(self)):
             raise TypeError("Can only merge with another TrackedObjectMetaData.")
+        sum_dense_counts = (
+            self.num_classes is not None and self.num_classes == other_object.num_classes
+        )
+        if self.num_classes is not None and not sum_dense_counts:
+            for class_name, _ in other_object.iter_class_counts():
+                self._check_category(class_name)
 
         self.observations += other_object.observations
         self.confidence_sum += other_object.confidence_sum
         self.confidence = other_object.confidence
         self.bbox = other_object.bbox
         self.last_frame_id = other_object.last_frame_id
-        for class_name in other_object.class_counts.keys():
-            self.class_counts[class_name] = self.class_counts.get(
-                class_name, 0
-            ) + other_object.class_counts.get(class_name, 0)
+        if other_object.last_timestamp is not None:
+            if self.first_timestamp is None:
+                self.first_timestamp = other_object.first_timestamp
+            self.last_timestamp = other_object.last_timestamp
+            self.time_seen += other_object.time_seen
+            if self.frame_interval is None or (
+                other_object.frame_interval is not None
+                and other_object.frame_interval < self.frame_interval
+            ):
+                self.frame_interval = other_object.frame_interval
+        if other_object.velocity is not None:
+            self.velocity = other_object.velocity.copy()
+            self.velocity_smoothing = other_object.velocity_smoothing
+        if sum_dense_counts:
+            self.class_counts += other_object.class_counts
+        else:
+            for class_name, count in other_object.iter_class_counts():
+                if self.num_classes is None:
+                    self.class_counts[class_name] = self.class_counts.get(class_name, 0) + count
+                else:
+                    self.class_counts[class_name] += count
+        if other_object.trajectory_capacity is not None:
+            if self.trajectory_capacity is None:
+                self._init_trajectory(other_object.trajectory_capacity)
+            self._set_trajectory(np.concatenate([self.trajectory, other_object.trajectory]))
+        self._refresh_derived()
+        self.version += 1
 
     def copy(self):
         """
@@ -98,12 +437,27 @@ class TrackedObjectMetaData:
         """
         copy_obj = TrackedObjectMetaData.__new__(TrackedObjectMetaData)
         copy_obj.bbox = self.bbox.copy()
+        copy_obj.num_classes = self.num_classes
+        copy_obj.velocity_smoothing = self.velocity_smoothing
+        copy_obj.velocity = None if self.velocity is None else self.velocity.copy()
         copy_obj.class_counts = self.class_counts.copy()
         copy_obj.observations = self.observations
         copy_obj.confidence_sum = self.confidence_sum
         copy_obj.confidence = self.confidence
         copy_obj.first_frame_id = self.first_frame_id
         copy_obj.last_frame_id = self.last_frame_id
+        copy_obj.first_timestamp = self.first_timestamp
+        copy_obj.last_timestamp = self.last_timestamp
+        copy_obj.time_seen = self.time_seen
+        copy_obj.frame_interval = self.frame_interval
+        copy_obj.category = self.category
+        copy_obj._mean_confidence = self._mean_confidence
+        copy_obj._class_proportions = None
+        copy_obj.version = self.version
+        copy_obj.trajectory_capacity = self.trajectory_capacity
+        copy_obj._trajectory = None if self._trajectory is None else self._trajectory.copy()
+        copy_obj._trajectory_head = self._trajectory_head
+        copy_obj._trajectory_size = self._trajectory_size
 
         return copy_obj
 
@@ -111,7 +465,9 @@ class TrackedObjectMetaData:
         """
         Converts the TrackedObjectMetaData instance to a dictionary.
 
-        The class_counts dictionary is converted to a string-keyed dictionary.
+        The class_counts dictionary is converted to a string-keyed dictionary. Dense class counts are
+        converted to a list of integers. The motion model, the trajectory and the timestamps are only exported
+        if maintained.
         The bounding box list is converted to a list of integers.
         The first_frame_id, last_frame_id, confidence, confidence_sum, and observations are converted to their
         respective types.
@@ -119,9 +475,12 @@ class TrackedObjectMetaData:
         Returns:
             dict: A dictionary representation of the TrackedObjectMetaData instance.
         """
-        class_counts_str = {
-            str(class_name): count for class_name, count in self.class_counts.items()
-        }
+        if self.num_classes is None:
+            class_counts_str = {
+                str(class_name): count for class_name, count in self.class_counts.items()
+            }
+        else:
+            class_counts_str = self.class_counts.tolist()
         data = {
             "first_frame_id": int(self.first_frame_id),
             "last_frame_id": int(self.last_frame_id),
@@ -131,6 +490,18 @@ class TrackedObjectMetaData:
             "confidence_sum": float(self.confidence_sum),
             "observations": int(self.observations),
         }
+        if self.velocity is not None:
+            data["velocity_smoothing"] = float(self.velocity_smoothing)
+            data["velocity"] = self.velocity.tolist()
+        if self._trajectory is not None:
+            data["trajectory_capacity"] = int(self.trajectory_capacity)
+            data["trajectory"] = self.trajectory.tolist()
+        if self.last_timestamp is not None:
+            data["first_timestamp"] = float(self.first_timestamp)
+            data["last_timestamp"] = float(self.last_timestamp)
+            data["time_seen"] = float(self.time_seen)
+        if self.frame_interval is not None:
+            data["frame_interval"] = float(self.frame_interval)
         return data
 
     def to_json(self):
@@ -149,7 +520,8 @@ class TrackedObjectMetaData:
 
         The dictionary should contain the following keys: "first_frame_id", "last_frame_id", "class_counts",
         "bbox", "confidence", "confidence_sum", and "observations". The "class_counts" key should map to a
-        dictionary where the keys are class names (as integers) and the values are counts.
+        dictionary where the keys are class names (as integers) and the values are counts, or to a list of
+        counts for dense class counts.
 
         Args:
             data (dict): A dictionary containing the data to populate the new instance.
@@ -158,8 +530,15 @@ class TrackedObjectMetaData:
             TrackedObjectMetaData: A new instance of TrackedObjectMetaData populated with the data from the dictionary.
         """
         class_counts_str = data["class_counts"]
-        class_counts = {int(class_name): count for class_name, count in class_counts_str.items()}
         obj = cls.__new__(cls)
+        if isinstance(class_counts_str, list):
+            class_counts = np.array(class_counts_str, dtype=np.int32)
+            obj.num_classes = len(class_counts)
+        else:
+            class_counts = {
+                int(class_name): count for class_name, count in class_counts_str.items()
+            }
+            obj.num_classes = None
         obj.first_frame_id = data["first_frame_id"]
         obj.last_frame_id = data["last_frame_id"]
         obj.class_counts = class_counts
@@ -167,6 +546,17 @@ class TrackedObjectMetaData:
         obj.confidence = data["confidence"]
         obj.confidence_sum = data["confidence_sum"]
         obj.observations = data["observations"]
+        obj.velocity_smoothing = data.get("velocity_smoothing")
+        obj.velocity = np.array(data["velocity"], dtype=float) if "velocity" in data else None
+        obj.first_timestamp = data.get("first_timestamp")
+        obj.last_timestamp = data.get("last_timestamp")
+        obj.time_seen = data.get("time_seen", 0.0)
+        obj.frame_interval = data.get("frame_interval")
+        obj.version = 0
+        obj._init_trajectory(data.get("trajectory_capacity"))
+        if "trajectory" in data:
+            obj._set_trajectory(np.array(data["trajectory"], dtype=float).reshape(-1, 6))
+        obj._refresh_derived()
         return obj
 
     @classmethod
@@ -187,28 +577,66 @@ class TrackedObjectMetaData:
         """
         Calculates the proportions of each class in the tracked object.
 
+        The proportions are cached until the next update or merge, as a read-only mapping or array, so that
+        callers cannot alter the cache.
+
         Returns:
-            dict: A dictionary where the keys are class names and the values are the proportions of each class.
+            Union[MappingProxyType, np.ndarray]: A read-only mapping where the keys are class names and the values
+            are the proportions of each class. With dense class counts, a read-only array of proportions indexed
+            by class.
         """
-        if self.observations > 0:
-            proportions = {
-                class_name: count / self.observations
-                for class_name, count in self.class_counts.items()
-            }
+        if self._class_proportions is None:
+            if self.num_classes is not None:
+                self._class_proportions = self.class_counts / max(self.observations, 1)
+                self._class_proportions.setflags(write=False)
+            elif self.observations > 0:
+                self._class_proportions = MappingProxyType(
+                    {
+                        class_name: count / self.observations
+                        for class_name, count in self.class_counts.items()
+                    }
+                )
+            else:
+                self._class_proportions = MappingProxyType({})
+        return self._class_proportions
+
+    def iter_class_counts(self):
+        """
+        Iterates over the class counts, whatever their storage. Dense class counts only yield
+        the classes that were observed.
+
+        Yields:
+            tuple: Pairs of (class name, count).
+        """
+        if self.num_classes is None:
+            yield from self.class_counts.items()
         else:
-            proportions = {}
-        return proportions
+            for class_name in np.flatnonzero(self.class_counts):
+                yield int(class_name), int(self.class_counts[class_name])
 
-    def percentage_of_time_seen(self, frame_id: int):
+    def percentage_of_time_seen(self, frame_id: int, timestamp: Optional[float] = None):
         """
-        Calculates the percentage of time the tracked object has been seen.
+        Calculates the percentage of time the tracked object has been seen. Without a timestamp, it is the
+        number of observations over the number of frames since the first observation, both included. With a
+        timestamp, each observation is credited with one frame interval, over the time elapsed since the first
+        observation plus one frame interval, so that both give the same percentage on a stream processed at a
+        constant rate, but the timestamped one does not depend on the frame ids, e.g. on decimated streams. The
+        frame-based percentage is returned until the frame interval is known.
 
         Args:
             frame_id (int): The current frame id.
+            timestamp (Optional[float], optional): The current timestamp, in seconds. Defaults to None.
 
         Returns:
             float: The percentage of time the tracked object has been seen.
         """
+        if timestamp is not None and self.first_timestamp is not None:
+            elapsed = timestamp - self.first_timestamp
+            if elapsed <= 0:
+                return 100.0
+            if self.frame_interval is not None:
+                seen = self.observations * self.frame_interval
+                return min(seen / (elapsed + self.frame_interval), 1.0) * 100
         if self.observations > 0:
             percentage = (self.observations / (frame_id - self.first_frame_id + 1)) * 100
         else:
@@ -217,15 +645,12 @@ class TrackedObjectMetaData:
 
     def mean_confidence(self):
         """
-        Calculates the mean confidence of the tracked object.
+        Returns the mean confidence of the tracked object, maintained by update and merge.
 
         Returns:
             float: The mean confidence of the tracked object.
         """
-        if self.observations > 0:
-            return self.confidence_sum / self.observations
-        else:
-            return 0.0
+        return self._mean_confidence
 
     def __repr__(self) -> str:
         """
@@ -0,0 +1,63 @@
+from pathlib import Path
+from typing import List, Tuple, Union
+
+import numpy as np
+
+from trackreid.reid_processor import ReidProcessor
+
+
+def split_tracker_log(tracker_log: np.ndarray) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Splits a tracker log by frame. A tracker log is an array whose first column is the frame id,
+    followed by the columns of the tracker output expected by ReidProcessor.update.
+
+    Args:
+        tracker_log (np.ndarray): The tracker log, with one row per detection.
+
+    Returns:
+        Tuple[np.ndarray, List[np.ndarray]]: The sorted unique frame ids, and the tracker output of each frame.
+    """
+    if not tracker_log.size:
+        return np.array([], dtype=int), []
+
+    if np.any(np.diff(tracker_log[:, 0]) < 0):
+        tracker_log = tracker_log[np.argsort(tracker_log[:, 0], kind="stable")]
+
+    frame_ids, indexes = np.unique(tracker_log[:, 0], return_index=True)
+    frame_tracker_outputs = np.split(tracker_log[:, 1:], indexes)[1:]
+    return frame_ids.astype(int), frame_tracker_outputs
+
+
+def load_tracker_log(file_path: Union[str, Path]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Loads a tracker log from a text file, with one detection per line and space separated columns,
+    and splits it by frame.
+
+    Args:
+        file_path (Union[str, Path]): The path to the tracker log.
+
+    Returns:
+        Tuple[np.ndarray, List[np.ndarray]]: The sorted unique frame ids, and the tracker output of each frame.
+    """
+    tracker_log = np.loadtxt(file_path, ndmin=2)
+    return split_tracker_log(tracker_log)
+
+
+def process_tracker_log(
+    reid_processor: ReidProcessor, frame_ids: np.ndarray, frame_tracker_outputs: List[np.ndarray]
+) -> List[np.ndarray]:
+    """
+    Runs a ReidProcessor over every frame of a tracker log.
+
+    Args:
+        reid_processor (ReidProcessor): The processor, reset beforehand if it was already used.
+        frame_ids (np.ndarray): The frame ids.
+        frame_tracker_outputs (List[np.ndarray]): The tracker output of each frame.
+
+    Returns:
+        List[np.ndarray]: The output of the processor for each frame.
+    """
+    return [
+        reid_processor.update(tracker_output=frame_tracker_output, frame_id=frame_id)
+        for frame_id, frame_tracker_output in zip(frame_ids, frame_tracker_outputs)
+    ]
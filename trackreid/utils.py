@@ -1,9 +1,10 @@
-from typing import List, Union
+import dataclasses
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 from llist import sllist
 
-from trackreid.configs.output_data_positions import OutputDataPositions
+from trackreid.configs.output_data_positions import OutputDataLayout
 
 
 def get_top_list_correction(tracked_ids: List):
@@ -117,24 +118,147 @@ def reshape_tracker_result(tracker_output: np.ndarray):
     return tracker_output
 
 
-def get_nb_output_cols(output_positions: OutputDataPositions):
+def _get_position_names(positions: Any) -> List[str]:
     """
-    Function to get the number of output columns based on the model json schema.
+    Function to get the variable names of a layout, in declaration order. Layouts are either plain dataclasses,
+    such as OutputDataLayout, or pydantic models, such as OutputDataPositions.
 
     Args:
-        output_positions (OutputDataPositions): The output data positions.
+        positions (Any): The layout.
+
+    Returns:
+        List[str]: The variable names.
+    """
+    if dataclasses.is_dataclass(positions):
+        return [field.name for field in dataclasses.fields(positions)]
+    return list(type(positions).model_fields)
+
+
+def get_nb_output_cols(output_positions: OutputDataLayout):
+    """
+    Function to get the number of output columns of the output layout.
+
+    Args:
+        output_positions (OutputDataLayout): The output data positions.
 
     Returns:
         int: The number of output columns.
     """
-    schema = output_positions.model_json_schema()
     nb_cols = 0
-    for feature in schema["properties"]:
-        if schema["properties"][feature]["type"] == "integer":
+    for _, positions in get_output_columns(output_positions):
+        if isinstance(positions, int):
             nb_cols += 1
-        elif schema["properties"][feature]["type"] == "array":
-            nb_cols += len(schema["properties"][feature]["default"])
+        elif isinstance(positions, list):
+            nb_cols += len(positions)
         else:
             raise TypeError("Unknown type in required output positions.")
 
     return nb_cols
+
+
+def get_output_columns(
+    output_positions: OutputDataLayout,
+) -> List[Tuple[str, Union[int, List[int]]]]:
+    """
+    Function to get the output variables and their positions, ordered as declared in the output layout.
+    It is meant to be computed once, so that outputs can be filled column by column.
+
+    Args:
+        output_positions (OutputDataLayout): The output data positions.
+
+    Returns:
+        List[Tuple[str, Union[int, List[int]]]]: The name and position(s) of each output variable.
+    """
+    return [
+        (feature, getattr(output_positions, feature))
+        for feature in _get_position_names(output_positions)
+    ]
+
+
+def get_output_dtype(output_positions: OutputDataLayout, output_dtypes: Dict[str, str]) -> np.dtype:
+    """
+    Function to get the structured numpy dtype of the output, with one named field per output variable,
+    ordered by position. Variables spanning several positions, such as bbox, are sub-array fields.
+
+    Args:
+        output_positions (OutputDataLayout): The output data positions.
+        output_dtypes (Dict[str, str]): The type of each output variable.
+
+    Returns:
+        np.dtype: The structured dtype of the output.
+    """
+    fields = []
+    for feature, positions in get_output_columns(output_positions):
+        if feature not in output_dtypes:
+            raise TypeError(f"No output type defined for {feature}.")
+        if isinstance(positions, list):
+            fields.append((min(positions), (feature, output_dtypes[feature], (len(positions),))))
+        else:
+            fields.append((positions, (feature, output_dtypes[feature])))
+    return np.dtype([field for _, field in sorted(fields, key=lambda field: field[0])])
+
+
+def batched(function: Callable) -> Callable:
+    """
+    Decorator flagging a cost or selection function as batched.
+
+    A batched function takes the full list of M candidates and the full list of N switchers, and returns
+    a [N, M] array of costs or selections at once (one row per switcher, one column per candidate),
+    instead of being called on every pair by the Matcher.
+
+    Args:
+        function (Callable): The batched cost or selection function.
+
+    Returns:
+        Callable: The same function, flagged as batched.
+    """
+    function.is_batched = True
+    return function
+
+
+def is_batched(function: Callable) -> bool:
+    """
+    Function to check whether a cost or selection function is batched.
+
+    Args:
+        function (Callable): The cost or selection function.
+
+    Returns:
+        bool: True if the function was decorated with batched.
+    """
+    return getattr(function, "is_batched", False)
+
+
+def cache_key(key_function: Callable) -> Callable:
+    """
+    Decorator factory declaring which part of the tracked objects a cost or selection function depends on.
+
+    When the Matcher caches costs and selections across frames, the value of a pair is reused as long as the
+    key_function of both objects is unchanged. Without declared key, any update of an object invalidates
+    its values.
+
+    Args:
+        key_function (Callable): Function computing a hashable key from a TrackedObject.
+
+    Returns:
+        Callable: A decorator attaching key_function to a cost or selection function.
+    """
+
+    def decorator(function: Callable) -> Callable:
+        function.cache_key = key_function
+        return function
+
+    return decorator
+
+
+def get_cache_key(function: Callable) -> Optional[Callable]:
+    """
+    Function to get the cache key declared for a cost or selection function.
+
+    Args:
+        function (Callable): The cost or selection function.
+
+    Returns:
+        Optional[Callable]: The key function declared with cache_key, or None.
+    """
+    return getattr(function, "cache_key", None)